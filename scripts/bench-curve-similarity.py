@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Benchmark the ``dtw_banded`` and ``frechet_fast`` curve similarity methods
+against the existing ``dtw`` (fastdtw) and ``frechet`` (similaritymeasures)
+methods, on random walk curves sharing a common clock, as the performance
+curves compared during stage 4 do.
+
+Usage::
+
+    python3 scripts/bench-curve-similarity.py --lengths 1000 2000 10000
+"""
+
+# Core packages
+import argparse
+import time
+import typing as tp
+
+# 3rd party packages
+import numpy as np
+
+# Project packages
+from titerra.projects.common.perf_measures.vcs import CSRaw
+
+
+def gen_curve(rng: np.random.Generator, n: int) -> np.ndarray:
+    curve = np.zeros((n, 2))
+    curve[:, 0] = np.arange(n)
+    curve[:, 1] = np.cumsum(rng.normal(size=n))
+    return curve
+
+
+def bench(exp_data: np.ndarray,
+          ideal_data: np.ndarray,
+          method: str,
+          band_width: float,
+          repeats: int) -> tp.Tuple[float, float]:
+    """
+    Get the best time of ``repeats`` runs of the method, and the distance.
+    """
+    best = np.inf
+    for _ in range(0, repeats):
+        start = time.perf_counter()
+        dist = CSRaw()(exp_data, ideal_data, method, band_width=band_width)
+        best = min(best, time.perf_counter() - start)
+
+    return best, dist
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='bench-curve-similarity')
+    parser.add_argument("--lengths",
+                        help="Curve lengths to benchmark.",
+                        type=int,
+                        nargs='+',
+                        default=[1000, 2000, 10000])
+    parser.add_argument("--band-widths",
+                        help="Band widths to benchmark ``dtw_banded`` with.",
+                        type=float,
+                        nargs='+',
+                        default=[0.01, 0.1, 1.0])
+    parser.add_argument("--sm-max-length",
+                        help="""Longest curves to run the (very slow)
+                        similaritymeasures ``frechet`` on.""",
+                        type=int,
+                        default=2000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    print("{0:>8} {1:<20} {2:>10} {3:>14}".format('length', 'method', 'time [s]', 'distance'))
+    for n in args.lengths:
+        exp_data = gen_curve(rng, n)
+        ideal_data = gen_curve(rng, n)
+
+        runs = [('dtw', 1.0)]
+        runs.extend(('dtw_banded', w) for w in args.band_widths)
+        runs.append(('frechet_fast', 1.0))
+        if n <= args.sm_max_length:
+            runs.append(('frechet', 1.0))
+
+        for method, band_width in runs:
+            elapsed, dist = bench(exp_data, ideal_data, method, band_width, args.repeats)
+            name = method
+            if method == 'dtw_banded':
+                name = '{0}({1})'.format(method, band_width)
+
+            print("{0:>8} {1:<20} {2:>10.3f} {3:>14.4f}".format(n, name, elapsed, dist))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Benchmark the ways of computing the steady state of the CRW ODE model for a
+batch (``--models-ode-steady-state``), at the batch sizes used by
+``scripts/2021-ode.sh``:
+
+- ``odeint`` - Integrating each experiment separately with
+  :func:`scipy.integrate.odeint` and keeping the last datapoint (what the model
+  did originally).
+
+- ``integrate`` - :meth:`CRWSolver.solve_batch()` with
+  ``steady_state_only=True``.
+
+- ``root`` - :meth:`CRWSolver.solve_steady_state()`.
+
+The model parameters are synthetic, drawn from ranges typical of the 2021-ode
+experiments; only the batch shape matters for timing.
+
+Usage::
+
+    python3 scripts/bench-ode-steady-state.py --repeats 20
+"""
+
+# Core packages
+import argparse
+import time
+import typing as tp
+
+# 3rd party packages
+import numpy as np
+import scipy.integrate as si
+
+# Project packages
+from titerra.projects.fordyca_base.models.ode_solver import CRWSolver
+
+# (name, swarm sizes) for the batch criteria in scripts/2021-ode.sh
+kBatches = [
+    ('VD C10', [10] * 10),
+    ('CD C14 I72', [max(1, 72 * i) for i in range(0, 14)]),
+    ('CD C16 I4', [max(1, 4 * i) for i in range(0, 16)]),
+]
+
+
+def gen_setup(rng: np.random.Generator,
+              N: int,
+              T: int,
+              n_datapoints: int) -> tp.Tuple[tp.Dict[str, float], tp.Dict[str, float]]:
+    tau_av1 = rng.uniform(50, 200)
+    alpha_ca1 = rng.uniform(1e-4, 1e-3)
+    params = {
+        'N': N,
+        'T': T,
+        'n_datapoints': n_datapoints,
+        'tau_av1': tau_av1,
+        'alpha_ca1': alpha_ca1,
+        'tau_h1': rng.uniform(200, 800),
+        'alpha_b1': rng.uniform(1e-4, 1e-3),
+        'N_av1': alpha_ca1 * tau_av1,
+        'crwD': rng.uniform(0.5, 2.0) * N,
+        'tau_avN': tau_av1 * rng.uniform(1.0, 2.0),
+        'tau_hN': rng.uniform(200, 800),
+        'alpha_bN': rng.uniform(1e-4, 1e-3) * N,
+    }
+    z0 = {'N_s0': N, 'N_h0': 0, 'N_avs0': 0, 'B0': 0}
+    return params, z0
+
+
+def solve_odeint(params: tp.List[tp.Dict[str, float]],
+                 z0: tp.List[tp.Dict[str, float]]) -> np.ndarray:
+    ret = []
+    for p, z in zip(params, z0):
+        t = np.linspace(0, p['T'], p['n_datapoints'])
+        soln = si.odeint(CRWSolver.kernel,
+                         [z['N_s0'], z['N_h0'], z['N_avs0'], z['B0']],
+                         t,
+                         args=(None, p))
+        ret.append(soln[-1])
+
+    return np.array(ret)
+
+
+def timeit(func: tp.Callable, repeats: int) -> tp.Tuple[float, np.ndarray]:
+    """
+    Get the mean time of ``repeats`` calls, and the result of the last one.
+    """
+    start = time.perf_counter()
+    for _ in range(0, repeats):
+        res = func()
+
+    return (time.perf_counter() - start) / repeats, res
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='bench-ode-steady-state')
+    parser.add_argument("--T",
+                        help="Simulation length in ticks.",
+                        type=int,
+                        default=200000)
+    parser.add_argument("--n-datapoints", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+
+    print("{0:<12} {1:>5} {2:>12} {3:>14} {4:>10} {5:>12}".format('batch',
+                                                                   'exps',
+                                                                   'odeint [ms]',
+                                                                   'integrate [ms]',
+                                                                   'root [ms]',
+                                                                   'max diff'))
+    for name, sizes in kBatches:
+        params, z0 = zip(*[gen_setup(rng, N, args.T, args.n_datapoints) for N in sizes])
+        params = list(params)
+        z0 = list(z0)
+
+        t_odeint, s_odeint = timeit(lambda: solve_odeint(params, z0), args.repeats)
+        t_integrate, s_integrate = timeit(lambda: CRWSolver.solve_batch(params,
+                                                                        z0,
+                                                                        steady_state_only=True),
+                                          args.repeats)
+        t_root, s_root = timeit(lambda: CRWSolver.solve_steady_state(params, z0),
+                                args.repeats)
+
+        # B is not determined by the fixed point, so only compare the robot
+        # counts.
+        diff = max(np.abs(s_root[:, :3] - s_integrate[:, :3]).max(),
+                   np.abs(s_odeint[:, :3] - s_integrate[:, :3]).max())
+
+        print("{0:<12} {1:>5} {2:>12.2f} {3:>14.2f} {4:>10.2f} {5:>12.2e}".format(name,
+                                                                                  len(sizes),
+                                                                                  t_odeint * 1000,
+                                                                                  t_integrate * 1000,
+                                                                                  t_root * 1000,
+                                                                                  diff))
+
+
+if __name__ == '__main__':
+    main()
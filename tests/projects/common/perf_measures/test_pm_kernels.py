@@ -0,0 +1,135 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Parity of the ``array_kernel()`` steady state performance measure kernels with
+the scalar ``kernel()`` they replace in the ``df_kernel()`` functions.
+"""
+
+# Core packages
+import math
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Project packages
+from titerra.projects.common.perf_measures import common as pmcommon
+from titerra.projects.common.perf_measures import scalability as pmscale
+from titerra.projects.common.perf_measures import self_organization as pmorg
+from titerra.projects.common.perf_measures import robustness as pmrob
+
+# Steady state values for the simulations in an experiment: zero performance,
+# large values of either sign (sigmoid overflow), and the inf/NaN speedups
+# produced by zero performance in the previous experiment.
+kPerf = np.array([0.0, 1.0, 2.5, -3.0, 750.0, -750.0, 0.125, 17.0])
+kSpeedups = np.array([math.inf, math.nan, 0.0, 1.0, 1.5, 2.0, -4.0, 1000.0])
+
+kNormalize = [(False, 'sigmoid'), (True, 'sigmoid'), (True, 'none')]
+
+
+def _scalar(kernel, *args) -> np.ndarray:
+    """
+    Evaluate the scalar kernel per simulation. Array arguments vary per
+    simulation; everything else is shared.
+    """
+    n_sims = max(len(a) for a in args if isinstance(a, np.ndarray))
+    rows = [[a[i] if isinstance(a, np.ndarray) else a for a in args]
+            for i in range(n_sims)]
+    return np.array([kernel(*row) for row in rows])
+
+
+def _assert_same(scalar: np.ndarray, array: np.ndarray) -> None:
+    if scalar.dtype == object or array.dtype == object:
+        assert list(scalar) == list(array)
+    else:
+        np.testing.assert_array_equal(array, scalar)
+
+
+def test_sigmoid_normalize():
+    theta = np.concatenate([kPerf, -kPerf, [1e-12, -1e-12, 40.0, -40.0]])
+    scalar = np.array([pmcommon.utils.Sigmoid(t)() - pmcommon.utils.Sigmoid(-t)()
+                       for t in theta])
+
+    np.testing.assert_array_equal(pmcommon.sigmoid_normalize(theta, True, 'sigmoid'),
+                                  scalar)
+    np.testing.assert_array_equal(pmcommon.sigmoid_normalize(theta, False, 'sigmoid'),
+                                  theta)
+    assert all(v is None for v in pmcommon.sigmoid_normalize(theta, True, 'none'))
+
+
+@pytest.mark.parametrize('n_robots', [1, 4])
+def test_perf_lost(n_robots):
+    cls = pmcommon.BaseSteadyStatePerfLostInteractiveSwarm
+    tlost1 = np.linspace(0.0, 100.0, len(kPerf))
+    tlostN = np.linspace(50.0, 10.0, len(kPerf))
+    perf1 = kPerf[::-1].copy()
+
+    _assert_same(_scalar(cls.kernel, perf1, tlost1, kPerf, tlostN, n_robots),
+                 cls.array_kernel(perf1, tlost1, kPerf, tlostN, n_robots))
+
+
+def test_fl():
+    cls = pmcommon.BaseSteadyStateFL
+    plostN = np.concatenate([[5.0, math.inf, math.nan], kPerf[3:]])
+
+    _assert_same(_scalar(cls.kernel, kPerf, plostN),
+                 cls.array_kernel(kPerf, plostN))
+
+
+@pytest.mark.parametrize('normalize,method', kNormalize)
+@pytest.mark.parametrize('n_robots_i,n_robots_iminus1', [(1, 1), (4, 4), (8, 4), (16, 2)])
+def test_parallel_fraction(normalize, method, n_robots_i, n_robots_iminus1):
+    # inf speedups -> 1.0 and NaN speedups -> 0.0 (L'Hospital's rule), and the
+    # equal swarm sizes special case.
+    cls = pmscale.BaseSteadyStateParallelFraction
+    args = (n_robots_i, n_robots_iminus1, normalize, method)
+
+    _assert_same(_scalar(cls.kernel, kSpeedups, *args),
+                 cls.array_kernel(kSpeedups, *args))
+
+
+def test_efficiency():
+    cls = pmscale.BaseSteadyStateNormalizedEfficiency
+    _assert_same(_scalar(cls.kernel, kPerf, 4), cls.array_kernel(kPerf, 4))
+
+
+@pytest.mark.parametrize('normalize,method', kNormalize)
+@pytest.mark.parametrize('n_robots_i,n_robots_iminus1', [(1, 1), (8, 4)])
+def test_self_org_marginal(normalize, method, n_robots_i, n_robots_iminus1):
+    prev = kPerf[::-1].copy()
+    for cls in [pmorg.BaseSteadyStateFLMarginal, pmorg.BaseSteadyStatePGMarginal]:
+        args = (n_robots_i, prev, n_robots_iminus1, normalize, method)
+        _assert_same(_scalar(cls.kernel, kPerf, *args),
+                     cls.array_kernel(kPerf, *args))
+
+
+@pytest.mark.parametrize('normalize,method', kNormalize)
+@pytest.mark.parametrize('n_robots_i', [1, 8])
+def test_self_org_interactive(normalize, method, n_robots_i):
+    base = kPerf[::-1].copy()
+    for cls in [pmorg.BaseSteadyStateFLInteractive, pmorg.BaseSteadyStatePGInteractive]:
+        args = (n_robots_i, base, normalize, method)
+        _assert_same(_scalar(cls.kernel, kPerf, *args),
+                     cls.array_kernel(kPerf, *args))
+
+
+@pytest.mark.parametrize('normalize,method', kNormalize)
+def test_robustness_pd(normalize, method):
+    cls = pmrob.BaseSteadyStateRobustnessPD
+    perf0 = kPerf[::-1].copy()
+
+    _assert_same(_scalar(cls.kernel, 1000.0, 750.0, perf0, kPerf, normalize, method),
+                 cls.array_kernel(1000.0, 750.0, perf0, kPerf, normalize, method))
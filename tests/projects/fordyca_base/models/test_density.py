@@ -0,0 +1,156 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Parity of the Gauss-Legendre density integrals with the adaptive ``nquad``
+integrals of the scalar ``at_point()`` they replace. The adaptive integrals
+are given the points where the density is not smooth as breakpoints, so they
+are accurate enough to compare against.
+"""
+
+# Core packages
+import math
+import typing as tp
+
+# 3rd party packages
+import pytest
+import scipy.integrate as si
+from sierra.core.utils import ArenaExtent
+from sierra.core.vector import Vector3D
+
+# Project packages
+import titerra.projects.fordyca_base.models.representation as rep
+from titerra.projects.fordyca_base.models.density import BlockAcqDensity, ClusterBlockDensity
+from titerra.projects.fordyca_base.models.dist_measure import DistanceMeasure2D
+
+kRelTol = 1e-8
+
+# (scenario, cluster LL, cluster UR, nest LL, nest UR, # blocks)
+kGeometries = [
+    # RN, with the nest inside the cluster: the density is not smooth across the nest factor
+    # circle.
+    ('RN', (0, 0), (16, 8), (7, 3), (9, 5), 20),
+    ('RN', (0, 0), (40, 20), (19, 9), (21, 11), 50),
+    # RN, with the cluster split up around the nest.
+    ('RN', (0, 0), (7, 8), (7, 3), (9, 5), 10),
+    # PL, with the cluster near, but not overlapping, the nest.
+    ('PL', (10, 4), (12, 6), (7, 3), (9, 5), 4),
+    # SS/DS, with the cluster across the arena from the nest.
+    ('SS', (30, 0), (32, 20), (2, 0), (4, 20), 20),
+    ('DS', (10, 0), (12, 20), (0, 0), (2, 20), 20),
+]
+
+
+class _Nest(rep.Nest):
+    def __init__(self, ll: Vector3D, ur: Vector3D) -> None:
+        self.extent = ArenaExtent.from_corners(ll=ll, ur=ur)
+
+
+def _points(a: float, b: float, center: float, chords: tp.List[float]) -> tp.Dict[str, tp.Any]:
+    """
+    Options for :func:`scipy.integrate.quad()` to split [a,b] where it crosses the nest factor
+    circle, which the density is not smooth across.
+    """
+    opts = {'limit': 200, 'epsabs': 0.0, 'epsrel': 1e-10}  # type: tp.Dict[str, tp.Any]
+    points = [center + sgn * c for c in chords for sgn in [-1, 1]]
+    points = [p for p in points if a < p < b]
+    if points:
+        opts['points'] = points
+
+    return opts
+
+
+def _chords(radius: float, offsets: tp.List[float]) -> tp.List[float]:
+    return [math.sqrt(radius ** 2 - o ** 2) for o in offsets if abs(o) < radius]
+
+
+def _nquad(density: BlockAcqDensity, ll: Vector3D, ur: Vector3D) -> float:
+    center, radius = density.kink()
+
+    def xopts(y):
+        return _points(ll.x, ur.x, center.x, _chords(radius, [y - center.y]))
+
+    yopts = _points(ll.y,
+                    ur.y,
+                    center.y,
+                    _chords(radius, [0.0, ll.x - center.x, ur.x - center.x]))
+    res, _ = si.nquad(density.at_point, [[ll.x, ur.x], [ll.y, ur.y]], opts=[xopts, yopts])
+    return res
+
+
+def _quad_marginal(density: BlockAcqDensity, a: float, b: float, axis: str) -> float:
+    center, radius = density.kink()
+    line = density.marginal_center()
+
+    if axis == 'y':
+        opts = _points(a, b, center.y, _chords(radius, [line.x - center.x]))
+        res, _ = si.quad(lambda y: density.at_point(None, y), a, b, **opts)
+    else:
+        opts = _points(a, b, center.x, _chords(radius, [line.y - center.y]))
+        res, _ = si.quad(lambda x: density.at_point(x, None), a, b, **opts)
+
+    return res
+
+
+def _setup(scenario, cll, cur, nll, nur, n_blocks):
+    nest = _Nest(Vector3D(*nll), Vector3D(*nur))
+    cluster = rep.BlockCluster(ll=Vector3D(*cll),
+                               ur=Vector3D(*cur),
+                               cluster_id=0,
+                               avg_blocks=n_blocks)
+    dist_measure = DistanceMeasure2D(scenario, nest=nest)
+    return nest, cluster, dist_measure
+
+
+@pytest.mark.parametrize('geometry', kGeometries)
+def test_block_acq_density(geometry):
+    nest, cluster, dist_measure = _setup(*geometry)
+    density = BlockAcqDensity(nest=nest, cluster=cluster, dist_measure=dist_measure)
+    ll = cluster.extent.ll
+    ur = cluster.extent.ur
+
+    # The normalization factor comes from for_region() over the cluster.
+    assert _nquad(density, ll, ur) == pytest.approx(1.0, rel=kRelTol)
+
+    # Also over a region which only partially covers the nest factor circle.
+    mid = Vector3D((ll.x + ur.x) / 2.0, (ll.y + ur.y) / 2.0)
+    quarter = Vector3D((ll.x + mid.x) / 2.0 + 0.1, (ll.y + mid.y) / 2.0 + 0.1)
+    for rll, rur in [(ll, ur), (quarter, mid + Vector3D(0.3, 0.2))]:
+        assert density.for_region(ll=rll, ur=rur) == pytest.approx(_nquad(density, rll, rur),
+                                                                   rel=kRelTol)
+
+    evx = _quad_marginal(density, ll.y, ur.y, 'y') * (ur.x ** 2 - ll.x ** 2) / 2.0
+    evy = _quad_marginal(density, ll.x, ur.x, 'x') * (ur.y ** 2 - ll.y ** 2) / 2.0
+    assert density.evx_for_region(ll=ll, ur=ur) == pytest.approx(evx, rel=kRelTol)
+    assert density.evy_for_region(ll=ll, ur=ur) == pytest.approx(evy, rel=kRelTol)
+
+
+@pytest.mark.parametrize('geometry', kGeometries)
+def test_cluster_block_density(geometry):
+    nest, cluster, _ = _setup(*geometry)
+    density = ClusterBlockDensity(cluster=cluster, nest=nest)
+
+    ll = cluster.extent.ll - Vector3D(1, 1)
+    ur = cluster.extent.center + Vector3D(0.5, 0.5)
+    points = [cluster.extent.ll.x, cluster.extent.ur.x, nest.extent.ll.x, nest.extent.ur.x]
+    ref, _ = si.nquad(density.at_point,
+                      [[ll.x, ur.x], [ll.y, ur.y]],
+                      opts=[{'limit': 200, 'points': [cluster.extent.ll.y,
+                                                      cluster.extent.ur.y,
+                                                      nest.extent.ll.y,
+                                                      nest.extent.ur.y]},
+                            {'limit': 200, 'points': points}])
+
+    assert density.for_region(ll=ll, ur=ur) == pytest.approx(ref, rel=kRelTol, abs=1e-12)
@@ -0,0 +1,100 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Scoping of the model result cache to the models of a single batch.
+"""
+
+# Core packages
+import os
+
+# 3rd party packages
+import pandas as pd
+
+# Project packages
+from titerra.projects.fordyca_base.models import model_cache
+
+
+class _Criteria():
+    def gen_exp_dirnames(self, cmdopts):
+        return ['exp0', 'exp1']
+
+
+class _Model():
+    def __init__(self) -> None:
+        self.config = {'a': 1}
+        self.n_runs = 0
+
+    def run(self, criteria, *args):
+        self.n_runs += 1
+        return [pd.DataFrame({'model': [float(self.n_runs)]})]
+
+
+def _cmdopts(tmp_path, batch: str):
+    root = os.path.join(str(tmp_path), batch)
+    return {
+        'batch_root': root,
+        'batch_input_root': os.path.join(root, 'exp-inputs'),
+        'batch_stat_root': os.path.join(root, 'statistics')
+    }
+
+
+def test_batch_cache(tmp_path):
+    model = _Model()
+    criteria = _Criteria()
+    cmdopts = _cmdopts(tmp_path, 'batch1')
+
+    with model_cache.batch_cache(cmdopts) as cache:
+        res1 = model_cache.run_intra(model, criteria, 0, cmdopts)
+        res1[0]['model'] = -1.0
+
+        # Nested contexts for the same batch share the cache
+        with model_cache.batch_cache(cmdopts) as nested:
+            assert nested is cache
+            res2 = model_cache.run_intra(model, criteria, 0, cmdopts)
+
+        model_cache.run_intra(model, criteria, 1, cmdopts)
+        model_cache.run_inter(model, criteria, cmdopts)
+        model_cache.run_inter(model, criteria, cmdopts)
+
+        assert model.n_runs == 3
+        assert (cache.hits, cache.misses) == (2, 3)
+        assert res2[0]['model'].iloc[0] == 1.0
+
+    # Results are dropped when the context exits
+    assert not cache.results
+    model_cache.run_intra(model, criteria, 0, cmdopts)
+    assert model.n_runs == 4
+
+
+def test_implicit_batch(tmp_path):
+    model = _Model()
+    criteria = _Criteria()
+    cmdopts1 = _cmdopts(tmp_path, 'batch1')
+    cmdopts2 = _cmdopts(tmp_path, 'batch2')
+
+    # Outside of a context, results are kept until the models for another
+    # batch are run.
+    model_cache.run_inter(model, criteria, cmdopts1)
+    cache1 = model_cache._active(cmdopts1)
+    model_cache.run_inter(model, criteria, cmdopts1)
+    assert model.n_runs == 1
+
+    model_cache.run_inter(model, criteria, cmdopts2)
+    assert model.n_runs == 2
+    assert not cache1.results
+    assert model_cache._active(cmdopts2) is not cache1
+
+    model_cache._implicit_close()
@@ -0,0 +1,120 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Equivalence of construction targets written as GraphML and in the compact
+binary (``.npz``) format, when read back with
+:func:`~titerra.projects.prism.gmt_io.read_graph()`.
+"""
+
+# Core packages
+import os
+
+# 3rd party packages
+import networkx as nx
+import pytest
+
+# Project packages
+from titerra.projects.prism import gmt_io
+from titerra.projects.prism.variables import construct_targets as ct
+from titerra.projects.prism.variables.orientation import Orientation
+
+kParadigms = ['semantic', 'edge']
+
+# (target class, shape, composition, bounding box, orientation). Beams are one
+# block long, so that the other end of each block in the edge paradigm is
+# within the bounding box.
+kTargets = [
+    (ct.Beam1Prism, 'rectprism', 'beam1', (4, 3, 2), '0'),
+    (ct.Beam1Prism, 'rectprism', 'beam1', (3, 4, 2), 'PI/2'),
+    (ct.Beam2Prism, 'rectprism', 'beam2', (2, 3, 2), '0'),
+    (ct.Beam3Prism, 'rectprism', 'beam3', (4, 3, 2), 'PI/2'),
+    (ct.Beam1Pyramid, 'pyramid', 'beam1', (5, 5, 3), '0'),
+]
+
+kShells = [None, 'virtual', 'complement']
+
+
+def _target(cls, shape, composition, bb, orientation, paradigm):
+    spec = {
+        'shape': shape,
+        'composition': composition,
+        'bb': bb,
+        'anchor': (0, 0, 0),
+        'orientation': Orientation(orientation)
+    }
+    return cls(spec, 0, paradigm, '')
+
+
+def _assert_same(graph1: nx.Graph, graph2: nx.Graph) -> None:
+    # Vertex order, and attribute order and types, as well as edges and their
+    # weights.
+    assert [(vd, list(attrs.items())) for vd, attrs in graph1.nodes(data=True)] == \
+        [(vd, list(attrs.items())) for vd, attrs in graph2.nodes(data=True)]
+    assert sorted(tuple(sorted((u, v))) + (w,) for u, v, w in graph1.edges(data='weight')) == \
+        sorted(tuple(sorted((u, v))) + (w,) for u, v, w in graph2.edges(data='weight'))
+
+
+def _round_trip(tmp_path, write_graphml, write_npz) -> nx.Graph:
+    graphml_path = os.path.join(str(tmp_path), 'target' + gmt_io.kGraphMLExt)
+    npz_path = os.path.join(str(tmp_path), 'target' + gmt_io.kNPZExt)
+    write_graphml(graphml_path)
+    write_npz(npz_path)
+
+    from_graphml = gmt_io.read_graph(graphml_path)
+    from_npz = gmt_io.read_graph(npz_path)
+    _assert_same(from_graphml, from_npz)
+    return from_graphml
+
+
+@pytest.mark.parametrize('paradigm', kParadigms)
+@pytest.mark.parametrize('target', kTargets)
+@pytest.mark.parametrize('shell', kShells)
+def test_graph_npz(tmp_path, paradigm, target, shell):
+    gmt = _target(*target, paradigm)
+    graph = gmt.gen_graph()
+    if shell == 'virtual':
+        graph = gmt.graph_virtual_shell_add(graph)
+    elif shell == 'complement':
+        graph = gmt.graph_complement_shell_add(graph)
+
+    read = _round_trip(tmp_path,
+                       lambda path: nx.write_graphml(graph, path),
+                       lambda path: gmt_io.write_graph_npz(graph, path))
+    _assert_same(graph, read)
+
+
+@pytest.mark.parametrize('paradigm', kParadigms)
+@pytest.mark.parametrize('target', kTargets)
+def test_grid_npz(tmp_path, paradigm, target):
+    gmt = _target(*target, paradigm)
+    grid = gmt.gen_grid()
+    assert grid is not None
+
+    read = _round_trip(tmp_path, grid.write_graphml, grid.write_npz)
+    _assert_same(grid.to_graph(), read)
+
+
+@pytest.mark.parametrize('paradigm', kParadigms)
+@pytest.mark.parametrize('target', kTargets)
+def test_gen_files(tmp_path, paradigm, target):
+    # Both formats written from the same generated target.
+    gmt = _target(*target, paradigm)
+    paths = [os.path.join(str(tmp_path), 'target' + ext)
+             for ext in [gmt_io.kGraphMLExt, gmt_io.kNPZExt]]
+    gmt.gen_files(paths)
+
+    _assert_same(gmt_io.read_graph(paths[0]), gmt_io.read_graph(paths[1]))
+    _assert_same(gmt.gen_graph(), gmt_io.read_graph(paths[0]))
@@ -125,6 +125,74 @@ class CommonCmdline(cmd.CoreCmdline):
                         """ + self.stage_usage_doc([4]),
                         default='sigmoid')
 
+        pm.add_argument("--pm-cache-mb",
+                        help="""
+
+                        Upper bound in MB on the memory used to share collated
+                        ``.csv`` files between performance measures, so that
+                        each file is read from disk once per batch rather than
+                        once per measure. 0 disables sharing.
+
+                        """ + self.stage_usage_doc([4]),
+                        type=int,
+                        default=1024)
+
+        pm.add_argument("--pm-cache-ss-only",
+                        help="""
+
+                        If passed, then only the steady state (last) row of
+                        collated ``.csv`` files used by steady state performance
+                        measures is kept in memory when sharing them between
+                        measures, reducing the memory needed for large
+                        batches. Flexibility and SAA robustness, which use full
+                        curves, will read their inputs from disk.
+
+                        """ + self.stage_usage_doc([4]),
+                        action='store_true')
+
+        pm.add_argument("--pm-processes",
+                        help="""
+
+                        The number of processes to use when computing
+                        performance measures which compare the performance
+                        curves of each simulation (flexibility, SAA
+                        robustness). The comparisons are independent, and with
+                        many simulations per experiment and expensive
+                        similarity methods such as DTW, computing them in
+                        parallel can substantially reduce stage 4 time.
+
+                        """ + self.stage_usage_doc([4]),
+                        type=int,
+                        default=1)
+
+        pm.add_argument("--pm-self-org-persist",
+                        help="""
+
+                        If passed, then the intermediate steady state
+                        performance losses and fractional losses used by the
+                        self-organization performance measures are written
+                        next to the collated ``.csv`` files, and re-used on
+                        later runs of stage 4 if they are newer than the
+                        collated ``.csv`` files they were computed from.
+
+                        """ + self.stage_usage_doc([4]),
+                        action='store_true')
+
+        pm.add_argument("--pm-force",
+                        help="""
+
+                        By default, a performance measure is only recomputed
+                        if the collated ``.csv`` files it is computed from, the
+                        experiments in the batch, or the options which affect
+                        its value have changed since it was last computed;
+                        otherwise its ``.csv`` files from the previous run of
+                        stage 4 are re-used, and only its graph is
+                        regenerated. If passed, then all performance measures
+                        are recomputed.
+
+                        """ + self.stage_usage_doc([4]),
+                        action='store_true')
+
         # Variance curve similarity options
         vcs = self.parser.add_argument_group(
             'Stage4: Variance Curve Similarity (VCS) Options')
@@ -150,7 +218,8 @@ class CommonCmdline(cmd.CoreCmdline):
                          self.bc_applicable_doc([':ref:`SAA Noise <ln-bc-saa-noise>`']) +
                          self.stage_usage_doc([4]),
                          choices=["pcm", "area_between",
-                                  "frechet", "dtw", "curve_length"],
+                                  "frechet", "dtw", "curve_length",
+                                  "dtw_banded", "frechet_fast"],
                          default="dtw")
         vcs.add_argument("--envc-cs-method",
                          help="""
@@ -163,7 +232,8 @@ class CommonCmdline(cmd.CoreCmdline):
                          self.bc_applicable_doc([':ref:`Temporal Variance <ln-bc-tv>`']) +
                          self.stage_usage_doc([4]),
                          choices=["pcm", "area_between",
-                                  "frechet", "dtw", "curve_length"],
+                                  "frechet", "dtw", "curve_length",
+                                  "dtw_banded", "frechet_fast"],
                          default="dtw")
 
         vcs.add_argument("--reactivity-cs-method",
@@ -178,7 +248,8 @@ class CommonCmdline(cmd.CoreCmdline):
                          self.bc_applicable_doc([':ref:`Temporal Variance <ln-bc-tv>`']) +
                          self.stage_usage_doc([4]),
                          choices=["pcm", "area_between",
-                                  "frechet", "dtw", "curve_length"],
+                                  "frechet", "dtw", "curve_length",
+                                  "dtw_banded", "frechet_fast"],
                          default="dtw")
 
         vcs.add_argument("--adaptability-cs-method",
@@ -193,9 +264,60 @@ class CommonCmdline(cmd.CoreCmdline):
                          self.bc_applicable_doc([':ref:`Temporal Variance <ln-bc-tv>`']) +
                          self.stage_usage_doc([4]),
                          choices=["pcm", "area_between",
-                                  "frechet", "dtw", "curve_length"],
+                                  "frechet", "dtw", "curve_length",
+                                  "dtw_banded", "frechet_fast"],
                          default="dtw")
 
+        vcs.add_argument("--vcs-band-width",
+                         help="""
+
+                         The width of the Sakoe-Chiba band used by the
+                         ``dtw_banded`` curve similarity method, as a fraction
+                         of the curve length: points more than this far apart in
+                         time are never matched. 1.0 gives exact, unconstrained
+                         DTW; smaller values are faster.
+
+                         """ + self.stage_usage_doc([4]),
+                         type=float,
+                         default=0.1)
+
+        # Model options
+        models = self.parser.add_argument_group('Stage4: Model Options')
+
+        models.add_argument("--models-processes",
+                            help="""
+
+                            The number of processes to use when computing
+                            independent per-simulation inputs to models, such
+                            as the expected block acquisition distance for
+                            each simulation in power law scenarios, and when
+                            inter-experiment models evaluate their
+                            intra-experiment models for each experiment in the
+                            batch. Results are always combined in the same
+                            order, so they do not depend on the number of
+                            processes.
+
+                            """ + self.stage_usage_doc([4]),
+                            type=int,
+                            default=1)
+
+        models.add_argument("--models-ode-steady-state",
+                            choices=['integrate', 'root'],
+                            help="""
+
+                            How to compute the steady state of the ODE model
+                            for each experiment in the batch:
+
+                            - ``integrate`` - Integrate the ODE system over the
+                              length of the simulation and take the last point.
+
+                            - ``root`` - Solve for the fixed point of the ODE
+                              system directly with a root finder, falling back
+                              to ``integrate`` if it does not converge.
+
+                            """ + self.stage_usage_doc([4]),
+                            default='integrate')
+
     @staticmethod
     def cmdopts_update(cli_args: argparse.Namespace, cmdopts: types.Cmdopts):
         """Updates the core cmdopts dictionary with (key,value) pairs from the
@@ -210,6 +332,7 @@ class CommonCmdline(cmd.CoreCmdline):
             'reactivity_cs_method': cli_args.reactivity_cs_method,
             'adaptability_cs_method': cli_args.adaptability_cs_method,
             'rperf_cs_method': cli_args.rperf_cs_method,
+            'vcs_band_width': cli_args.vcs_band_width,
 
             'pm_scalability_normalize': cli_args.pm_scalability_normalize,
             'pm_scalability_from_exp0': cli_args.pm_scalability_from_exp0,
@@ -217,6 +340,14 @@ class CommonCmdline(cmd.CoreCmdline):
             'pm_flexibility_normalize': cli_args.pm_flexibility_normalize,
             'pm_robustness_normalize': cli_args.pm_robustness_normalize,
             'pm_normalize_method': cli_args.pm_normalize_method,
+            'pm_cache_mb': cli_args.pm_cache_mb,
+            'pm_cache_ss_only': cli_args.pm_cache_ss_only,
+            'pm_self_org_persist': cli_args.pm_self_org_persist,
+            'pm_processes': cli_args.pm_processes,
+            'pm_force': cli_args.pm_force,
+
+            'models_processes': cli_args.models_processes,
+            'models_ode_steady_state': cli_args.models_ode_steady_state,
         }
 
         if cli_args.pm_all_normalize:
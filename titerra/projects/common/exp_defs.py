@@ -0,0 +1,115 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Process-wide memoized access to pickled experiment definitions, and to values
+derived from them, so that the same ``exp_def.pkl`` is only unpickled (and
+walked) once per stage, no matter how many graphs, performance measures, or
+models need it.
+
+Entries are keyed by path and modification time, so re-running stage 1 for a
+batch invalidates them. Returned experiment definitions are shared, and must
+not be modified.
+"""
+
+# Core packages
+import os
+import copy
+import functools
+import typing as tp
+
+# 3rd party packages
+from sierra.core.xml import XMLAttrChangeSet
+import sierra.core.config
+import sierra.plugins.platform.argos.variables.exp_setup as ts
+
+# Project packages
+from titerra.projects.common import param_index
+
+kCacheSize = 256
+
+
+@functools.lru_cache(maxsize=kCacheSize)
+def _unpickle(path: str, mtime: float) -> XMLAttrChangeSet:
+    return XMLAttrChangeSet.unpickle(path)
+
+
+@functools.lru_cache(maxsize=kCacheSize * 8)
+def _derive(path: str, mtime: float, func: tp.Callable) -> tp.Any:
+    return func(_unpickle(path, mtime))
+
+
+def unpickle(path: str) -> XMLAttrChangeSet:
+    """
+    Drop-in replacement for :meth:`XMLAttrChangeSet.unpickle()`.
+    """
+    return _unpickle(path, os.path.getmtime(path))
+
+
+def for_exp(batch_input_root: str, exp_dir: str) -> str:
+    """
+    Get the path to the pickled experiment definition for an experiment in the
+    batch.
+    """
+    return os.path.join(batch_input_root, exp_dir, sierra.core.config.kPickleLeaf)
+
+
+def derive(path: str, func: tp.Callable[[XMLAttrChangeSet], tp.Any]) -> tp.Any:
+    """
+    Compute ``func(exp_def)`` for the experiment definition at ``path``,
+    memoizing the result. ``func`` should be a module-level function or a
+    staticmethod, so that it is the same object on every call. The result is
+    shallow copied, so callers can modify returned containers.
+    """
+    return copy.copy(_derive(path, os.path.getmtime(path), func))
+
+
+def time_params(path: str) -> tp.Dict[str, int]:
+    """
+    Memoized :meth:`ARGoSExpSetup.extract_time_params()`.
+    """
+    return derive(path, ts.ARGoSExpSetup.extract_time_params)
+
+
+def duration(path: str) -> int:
+    """
+    The length of each simulation in the experiment, in ticks. Taken from the
+    batch parameter index if possible.
+    """
+    params = param_index.lookup(path)
+    if params is not None and params['length'] is not None and params['ticks_per_second'] is not None:
+        return params['length'] * params['ticks_per_second']
+
+    return derive(path, _calc_duration)
+
+
+def _calc_duration(exp_def: XMLAttrChangeSet) -> int:
+    # Integers always seem to be pickled as floats, so you can't convert
+    # directly without an exception.
+    for path, attr, value in exp_def:
+        if path == './/experiment' and attr == 'length':
+            length = int(float(value))
+        elif path == './/experiment' and attr == 'ticks_per_second':
+            ticks = int(float(value))
+    return length * ticks
+
+
+__api__ = [
+    'unpickle',
+    'for_exp',
+    'derive',
+    'time_params',
+    'duration'
+]
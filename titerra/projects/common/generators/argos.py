@@ -33,6 +33,7 @@ import sierra.core.utils as scutils
 from titerra.projects.common.variables import block_distribution, arena, block_quantity, exp_setup
 from titerra.projects.common.variables.nest import Nest
 from titerra.projects.common.generators import utils as tiutils
+from titerra.projects.common import param_index
 
 
 class BaseScenarioGenerator(PlatformExpDefGenerator):
@@ -124,6 +125,9 @@ class ForagingScenarioGenerator(BaseScenarioGenerator):
         # Generate and apply # blocks definitions
         self.generate_block_count(exp_def)
 
+        # Index the experiment's parameters for later stages
+        param_index.update(self.spec.exp_def_fpath, exp_def)
+
         return exp_def
 
 
@@ -0,0 +1,82 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Helpers for computing independent pieces of stage 4 work (per-simulation curve
+similarity, per-simulation model inputs, etc.) in a pool of processes.
+"""
+
+# Core packages
+import typing as tp
+import logging
+import multiprocessing
+
+# 3rd party packages
+
+# Project packages
+
+
+# Per-worker state for map_kernel(), set once when each worker starts so that
+# the (potentially large) arguments shared by all tasks are only pickled once
+# per worker instead of once per task.
+_pool_kernel = None  # type: tp.Optional[tp.Callable]
+_pool_shared = ()  # type: tuple
+
+
+def _pool_init(kernel: tp.Callable, shared: tuple) -> None:
+    global _pool_kernel, _pool_shared
+    _pool_kernel = kernel
+    _pool_shared = shared
+
+
+def _pool_apply(task: tuple) -> tp.Any:
+    return _pool_kernel(*_pool_shared, *task)
+
+
+def map_kernel(n_procs: int,
+               kernel: tp.Callable,
+               shared: tuple,
+               tasks: tp.List[tuple]) -> tp.List[tp.Any]:
+    """
+    Compute ``kernel(*shared, *task)`` for each of the independent tasks, in a
+    pool of ``n_procs`` worker processes if more than 1 is requested. Results
+    are always returned in the same order as the tasks, so callers can reduce
+    them deterministically.
+
+    ``kernel`` must be a module-level function so that it can be pickled.
+
+    Tasks are computed serially when called from within a pool worker (e.g., a
+    model run for one experiment in a pool of experiments which itself
+    computes per-simulation tasks), as pool workers cannot have children. Only
+    the outermost level of work is parallelized.
+    """
+    n_procs = min(n_procs, len(tasks))
+
+    if n_procs <= 1 or multiprocessing.current_process().daemon:
+        return [kernel(*shared, *task) for task in tasks]
+
+    logging.getLogger(__name__).debug("Computing %s tasks with %s processes",
+                                      len(tasks),
+                                      n_procs)
+    chunksize = max(1, len(tasks) // (n_procs * 4))
+    with multiprocessing.Pool(processes=n_procs,
+                              initializer=_pool_init,
+                              initargs=(kernel, shared)) as pool:
+        return pool.map(_pool_apply, tasks, chunksize=chunksize)
+
+
+__api__ = [
+    'map_kernel'
+]
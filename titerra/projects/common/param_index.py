@@ -0,0 +1,129 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Batch-level index of the scalar parameters of each experiment which later
+stages need from the generated experiment definition (the time setup), written
+during stage 1 alongside the pickled experiment definitions. Later stages can
+look up parameters for any experiment in the batch with a single small JSON
+read, instead of unpickling and walking the experiment definition.
+
+Only parameters which are read from the index are recorded. Parameters which
+later stages read from the changes made by the batch criteria (population
+dynamics rates, block counts, etc.) are not, as the generated experiment
+definition can differ.
+
+The index lives in ``<batch_input_root>/exp-params.json`` and is a dictionary
+keyed by experiment directory name.
+"""
+
+# Core packages
+import os
+import json
+import typing as tp
+
+# 3rd party packages
+from sierra.core.xml import XMLLuigi
+
+# Project packages
+
+kIndexLeaf = 'exp-params.json'
+
+_loaded = {}  # type: tp.Dict[str, tp.Tuple[float, tp.Dict[str, tp.Dict[str, tp.Any]]]]
+
+
+def _to_num(value: tp.Optional[str]) -> tp.Optional[float]:
+    return None if value is None else float(value)
+
+
+def calc_params(exp_def: XMLLuigi) -> tp.Dict[str, tp.Any]:
+    """
+    Extract the indexed parameters from the (fully generated) experiment
+    definition. Integers are stored as integers; parameters not present in
+    the experiment definition are ``None``.
+    """
+    length = _to_num(exp_def.attr_get('.//experiment', 'length'))
+    ticks = _to_num(exp_def.attr_get('.//experiment', 'ticks_per_second'))
+
+    return {
+        'length': None if length is None else int(length),
+        'ticks_per_second': None if ticks is None else int(ticks),
+    }
+
+
+def update(exp_def_fpath: str, exp_def: XMLLuigi) -> None:
+    """
+    Add/replace the entry for the experiment whose pickled definition is at
+    ``exp_def_fpath`` in the index for its batch.
+
+    Experiments within a batch are generated one at a time during stage 1, so
+    read-modify-write of the index is safe; the index is replaced atomically
+    so readers never see a partially written file.
+    """
+    exp_input_root = os.path.dirname(exp_def_fpath)
+    batch_input_root = os.path.dirname(exp_input_root)
+    ipath = os.path.join(batch_input_root, kIndexLeaf)
+
+    index = {}
+    if os.path.exists(ipath):
+        with open(ipath, 'r') as f:
+            index = json.load(f)
+
+    index[os.path.basename(exp_input_root)] = calc_params(exp_def)
+
+    tmp = ipath + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp, ipath)
+
+
+def load(batch_input_root: str) -> tp.Dict[str, tp.Dict[str, tp.Any]]:
+    """
+    Load the parameter index for the batch, once per modification of the
+    file. Returns an empty dictionary if there is no index (e.g., stage 1 was
+    run before the index was added).
+    """
+    ipath = os.path.join(batch_input_root, kIndexLeaf)
+    try:
+        mtime = os.path.getmtime(ipath)
+    except OSError:
+        return {}
+
+    cached = _loaded.get(ipath)
+    if cached is None or cached[0] != mtime:
+        with open(ipath, 'r') as f:
+            cached = (mtime, json.load(f))
+        _loaded[ipath] = cached
+
+    return cached[1]
+
+
+def lookup(exp_def_fpath: str) -> tp.Optional[tp.Dict[str, tp.Any]]:
+    """
+    Get the indexed parameters for the experiment whose pickled definition is
+    at ``exp_def_fpath``, or ``None`` if the experiment is not in the index.
+    Stage 1 updates the index every time it generates an experiment, so it is
+    always in sync with the pickled definitions.
+    """
+    exp_input_root = os.path.dirname(exp_def_fpath)
+    return load(os.path.dirname(exp_input_root)).get(os.path.basename(exp_input_root))
+
+
+__api__ = [
+    'calc_params',
+    'update',
+    'load',
+    'lookup'
+]
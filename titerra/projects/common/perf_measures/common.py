@@ -20,19 +20,25 @@ Common calculations used by multiple performance measures.
 # Core packages
 import os
 import math
+import json
+import logging
+import contextlib
+import collections
 import typing as tp
 
 # 3rd party packages
 import pandas as pd
+import numpy as np
 from sierra.plugins.platform.argos.variables import population_size
 from sierra.core.variables import batch_criteria as bc
-from sierra.core.xml import XMLAttrChangeSet
 from sierra.plugins.platform.argos.variables import population_constant_density as pcd
 from sierra.plugins.platform.argos.variables import population_variable_density as pvd
 import sierra.core.stat_kernels
-from sierra.core import utils, types, config, storage
+from sierra.core import utils, types, storage
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
+from titerra.projects.common import parallel
 
 ################################################################################
 # Base Classes
@@ -81,6 +87,24 @@ class BaseSteadyStatePerfLostInteractiveSwarm():
         else:
             return (perfN * tlostN - n_robots * plost1) / n_robots
 
+    @staticmethod
+    def array_kernel(perf1: np.ndarray,
+                     tlost1: np.ndarray,
+                     perfN: np.ndarray,
+                     tlostN: np.ndarray,
+                     n_robots: int) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        plost1 = perf1 * tlost1
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plostN = (perfN * tlostN - n_robots * plost1) / n_robots
+
+        # No performance = 100% interactive loss
+        return np.where(perfN == 0, math.inf, plostN)
+
 
 class BaseSteadyStateFL:
     r"""
@@ -105,6 +129,18 @@ class BaseSteadyStateFL:
         else:
             return round(plostN / perfN, 8)
 
+    @staticmethod
+    def array_kernel(perfN: np.ndarray, plostN: np.ndarray) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fl = np.round(plostN / perfN, 8)
+
+        # No performance = 100% fractional loss
+        return np.where(perfN == 0, 1.0, fl)
+
     def __init__(self,
                  cmdopts: types.Cmdopts,
                  inter_perf_csv: str,
@@ -119,19 +155,8 @@ class BaseSteadyStateFL:
 
         # Just need to get # timesteps per simulation which is the same for all
         # simulations/experiments, so we pick exp0 for simplicity to calculate
-        exp_def = XMLAttrChangeSet.unpickle(os.path.join(cmdopts["batch_input_root"],
-                                                         criteria.gen_exp_dirnames(
-                                                             self.cmdopts)[0],
-                                                         config.kPickleLeaf))
-
-        # Integers always seem to be pickled as floats, so you can't convert directly without an
-        # exception.
-        for path, attr, value in exp_def:
-            if path == './/experiment' and attr == 'length':
-                length = int(float(value))
-            elif path == './/experiment' and attr == 'ticks_per_second':
-                ticks = int(float(value))
-        self.duration = length * ticks
+        self.duration = exp_defs.duration(exp_defs.for_exp(cmdopts["batch_input_root"],
+                                                           criteria.gen_exp_dirnames(self.cmdopts)[0]))
 
 ################################################################################
 # Univariate Classes
@@ -180,48 +205,26 @@ class SteadyStatePerfLostInteractiveSwarmUnivar(BaseSteadyStatePerfLostInteracti
 
         # Case 1: 1 robot/exp0
         exp0 = list(collated_perf.keys())[0]
-
-        plostn_dfs[exp0] = pd.DataFrame(columns=collated_perf[exp0].columns,
-                                        index=[0])  # Steady state
+        exp0_perf_df = collated_perf[exp0]
+        exp0_interference_df = collated_interference[exp0]
 
         # By definition, no performance losses in exp0
-        plostn_dfs[exp0].loc[0, :] = 0.0
+        plostn_dfs[exp0] = steady_state_df(exp0_perf_df.columns,
+                                           np.zeros(len(exp0_perf_df.columns)))
 
         # Case 2 : N>1 robots
         for i in range(1, n_exp):
             expx = list(collated_perf.keys())[i]
             expx_perf_df = collated_perf[expx]
             expx_interference_df = collated_interference[expx]
-            plostn_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                            index=[0])  # Steady state
-            n_robots = populations[i]
-
-            exp0 = list(collated_perf.keys())[0]
-            exp0_perf_df = collated_perf[exp0]
-            exp0_interference_df = collated_interference[exp0]
-
-            for sim in expx_perf_df.columns:
-                # steady state
-                tlost1 = exp0_interference_df.loc[exp0_interference_df.index[-1], sim]
-                # steady state
-                perf1 = exp0_perf_df.loc[exp0_perf_df.index[-1], sim]
-
-                # steady state
-                tlostN = expx_interference_df.loc[expx_interference_df.index[-1], sim]
-                # steady state
-                perfN = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-
-                plostN = BaseSteadyStatePerfLostInteractiveSwarm.kernel(perf1=perf1,
-                                                                        tlost1=tlost1,
-                                                                        perfN=perfN,
-                                                                        tlostN=tlostN,
-                                                                        n_robots=n_robots)
-
-                plostn_dfs[expx].loc[0, sim] = BaseSteadyStatePerfLostInteractiveSwarm.kernel(perf1=perf1,
-                                                                                              tlost1=tlost1,
-                                                                                              perfN=perfN,
-                                                                                              tlostN=tlostN,
-                                                                                              n_robots=n_robots)
+            sims = expx_perf_df.columns
+
+            plostN = BaseSteadyStatePerfLostInteractiveSwarm.array_kernel(perf1=steady_state(exp0_perf_df, sims),
+                                                                          tlost1=steady_state(exp0_interference_df, sims),
+                                                                          perfN=steady_state(expx_perf_df, sims),
+                                                                          tlostN=steady_state(expx_interference_df, sims),
+                                                                          n_robots=populations[i])
+            plostn_dfs[expx] = steady_state_df(sims, plostN)
 
         return plostn_dfs
 
@@ -244,24 +247,19 @@ class SteadyStateFLUnivar(BaseSteadyStateFL):
 
         exp0 = list(collated_perf.keys())[0]
 
-        fl_dfs[exp0] = pd.DataFrame(columns=collated_perf[exp0].columns,
-                                    index=[0])  # Steady state
-
         # By definition, no fractional losses in exp0
-        fl_dfs[exp0].loc[0, :] = 0.0
+        fl_dfs[exp0] = steady_state_df(collated_perf[exp0].columns,
+                                       np.zeros(len(collated_perf[exp0].columns)))
 
         for i in range(1, n_exp):
             expx = list(collated_perf.keys())[i]
             expx_plost_df = collated_plost[expx]
             expx_perf_df = collated_perf[expx]
-            fl_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                        index=[0])  # Steady state
+            sims = expx_perf_df.columns
 
-            for sim in expx_perf_df.columns:
-                plost_x = expx_plost_df.loc[expx_plost_df.index[-1], sim]
-                perf_x = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-                fl_dfs[expx].loc[0, sim] = BaseSteadyStateFL.kernel(
-                    perf_x, plost_x)
+            fl = BaseSteadyStateFL.array_kernel(steady_state(expx_perf_df, sims),
+                                                steady_state(expx_plost_df, sims))
+            fl_dfs[expx] = steady_state_df(sims, fl)
 
         return fl_dfs
 
@@ -304,8 +302,7 @@ class SteadyStatePerfLostInteractiveSwarmBivar(BaseSteadyStatePerfLostInteractiv
                 expx = list(collated_perf.keys())[i * ysize + j]
                 expx_perf_df = collated_perf[expx]
                 expx_interference_df = collated_interference[expx]
-                plost_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                               index=[0])  # Steady state
+                sims = expx_perf_df.columns
                 n_robots = populations[i][j]
 
                 if axis == 0:
@@ -313,30 +310,21 @@ class SteadyStatePerfLostInteractiveSwarmBivar(BaseSteadyStatePerfLostInteractiv
                 else:
                     exp0_index = i * xsize
 
+                if (i * ysize + j) == exp0_index:  # exp0
+                    # By definition, no performance losses in exp0
+                    plost_dfs[expx] = steady_state_df(sims, np.zeros(len(sims)))
+                    continue
+
                 exp0 = list(collated_perf.keys())[exp0_index]
                 exp0_perf_df = collated_perf[exp0]
                 exp0_interference_df = collated_interference[exp0]
 
-                for sim in expx_perf_df.columns:
-                    if (i * ysize + j) == exp0_index:  # exp0
-                        plostN = 0.0  # By definition, no performance losses in exp0
-                    else:
-                        # steady state
-                        tlost1 = exp0_interference_df.loc[exp0_interference_df.index[-1], sim]
-                        # steady state
-                        perf1 = exp0_perf_df.loc[exp0_perf_df.index[-1], sim]
-
-                        # steady state
-                        tlostN = expx_interference_df.loc[expx_interference_df.index[-1], sim]
-                        # steady state
-                        perfN = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-
-                        plostN = BaseSteadyStatePerfLostInteractiveSwarm.kernel(perf1=perf1,
-                                                                                tlost1=tlost1,
-                                                                                perfN=perfN,
-                                                                                tlostN=tlostN,
-                                                                                n_robots=n_robots)
-                    plost_dfs[expx].loc[0, sim] = plostN
+                plostN = BaseSteadyStatePerfLostInteractiveSwarm.array_kernel(perf1=steady_state(exp0_perf_df, sims),
+                                                                              tlost1=steady_state(exp0_interference_df, sims),
+                                                                              perfN=steady_state(expx_perf_df, sims),
+                                                                              tlostN=steady_state(expx_interference_df, sims),
+                                                                              n_robots=n_robots)
+                plost_dfs[expx] = steady_state_df(sims, plostN)
 
         return plost_dfs
 
@@ -370,42 +358,346 @@ class SteadyStateFLBivar(BaseSteadyStateFL):
                 expx = list(collated_perf.keys())[i * ysize + j]
                 expx_perf_df = collated_perf[expx]
                 expx_plost_df = collated_plost[expx]
-                fl_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                            index=[0])  # Steady state
+                sims = expx_perf_df.columns
+
                 if axis == 0:
                     exp0_index = i
                 else:
                     exp0_index = i * xsize
 
-                for sim in expx_perf_df.columns:
-                    if (i * ysize + j) == exp0_index:  # exp0
-                        fl_x = 0.0  # By definition, no fractional losses in exp0
-                    else:
-                        # steady state
-                        perfN = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-                        # steady state
-                        plostN = expx_plost_df.loc[expx_plost_df.index[-1], sim]
-                        fl_x = BaseSteadyStateFL.kernel(perfN, plostN)
-
-                    fl_dfs[expx].loc[0, sim] = fl_x
+                if (i * ysize + j) == exp0_index:  # exp0
+                    # By definition, no fractional losses in exp0
+                    fl_dfs[expx] = steady_state_df(sims, np.zeros(len(sims)))
+                else:
+                    fl = BaseSteadyStateFL.array_kernel(steady_state(expx_perf_df, sims),
+                                                        steady_state(expx_plost_df, sims))
+                    fl_dfs[expx] = steady_state_df(sims, fl)
 
         return fl_dfs
 
 
+def steady_state(df: pd.DataFrame,
+                 cols: tp.Optional[pd.Index] = None) -> np.ndarray:
+    """
+    Get the steady state (i.e., last) row of a collated dataframe as an array,
+    optionally selecting/ordering by the specified columns (simulations).
+    """
+    if cols is None:
+        cols = df.columns
+
+    return df.loc[df.index[-1], cols].to_numpy(dtype=float)
+
+
+def steady_state_df(cols: pd.Index, vals: np.ndarray) -> pd.DataFrame:
+    """
+    Build the single row steady state dataframe the ``df_kernel()`` functions
+    return from an array with one value per simulation.
+    """
+    return pd.DataFrame([vals], columns=cols, index=[0])
+
+
+def sigmoid_normalize(theta: np.ndarray,
+                      normalize: bool,
+                      normalize_method: str) -> np.ndarray:
+    """
+    Array form of the normalization applied by the scalar performance measure
+    kernels: ``Sigmoid(theta) - Sigmoid(-theta)``, computed the same way as
+    :class:`~sierra.core.utils.Sigmoid` so results match exactly.
+    """
+    if not normalize:
+        return theta
+
+    if normalize_method != 'sigmoid':
+        return np.full(theta.shape, None, dtype=object)
+
+    def _sigmoid(x: np.ndarray) -> np.ndarray:
+        # Numerically stable for large exponents of either sign
+        e = np.exp(-np.abs(x))
+        return np.where(x < 0, 1.0 - 1.0 / (1 + e), 1.0 / (1 + e))
+
+    return _sigmoid(theta) - _sigmoid(-theta)
+
+
+class CollatedCSVCache():
+    """Batch-scoped, in-memory cache of collated ``.csv`` files, keyed by
+    (experiment, csv leaf, csv column).
+
+    Multiple performance measures read the same collated files from
+    ``batch_stat_collate_root``; with the cache active (see
+    :func:`collated_csv_cache()`), each file is read from disk once per batch
+    and then shared by every measure which needs it. Cached dataframes are
+    shared, and must not be modified by callers.
+
+    Attributes:
+        max_bytes: Upper bound on the memory used by cached dataframes; least
+                   recently used dataframes are evicted to stay under it.
+
+        steady_state_only: If True, only the steady state (last) row of
+                           dataframes requested by steady state performance
+                           measures is kept. Requests for full curves are
+                           always satisfied from disk if only the steady state
+                           row is cached.
+
+    """
+
+    def __init__(self, max_bytes: int, steady_state_only: bool) -> None:
+        self.max_bytes = max_bytes
+        self.steady_state_only = steady_state_only
+        self.frames = collections.OrderedDict()  # type: tp.OrderedDict[tp.Tuple[str, str, str], tp.Tuple[pd.DataFrame, bool, int]]
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self,
+            cmdopts: types.Cmdopts,
+            exp: str,
+            csv_leaf: str,
+            csv_col: str,
+            steady_state: bool) -> pd.DataFrame:
+        key = (exp, csv_leaf, csv_col)
+
+        if key in self.frames:
+            df, is_ss, _ = self.frames[key]
+            if steady_state or not is_ss:
+                self.frames.move_to_end(key)
+                self.hits += 1
+                return df
+
+        self.misses += 1
+        csv_ipath = os.path.join(cmdopts["batch_stat_collate_root"],
+                                 exp + '-' + csv_leaf + '-' + csv_col + '.csv')
+        df = storage.DataFrameReader('storage.csv')(csv_ipath)
+
+        is_ss = self.steady_state_only and steady_state
+        if is_ss:
+            df = df.iloc[[-1]]
+
+        self._insert(key, df, is_ss)
+        return df
+
+    def _insert(self, key: tp.Tuple[str, str, str], df: pd.DataFrame, is_ss: bool) -> None:
+        if key in self.frames:
+            self.n_bytes -= self.frames.pop(key)[2]
+
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        while self.frames and self.n_bytes + size > self.max_bytes:
+            self.n_bytes -= self.frames.popitem(last=False)[1][2]
+
+        self.frames[key] = (df, is_ss, size)
+        self.n_bytes += size
+
+
+_collated_cache = None  # type: tp.Optional[CollatedCSVCache]
+
+
+@contextlib.contextmanager
+def collated_csv_cache(cmdopts: types.Cmdopts) -> tp.Iterator[tp.Optional[CollatedCSVCache]]:
+    """
+    Make a :class:`CollatedCSVCache` sized according to ``--pm-cache-mb`` and
+    ``--pm-cache-ss-only`` available to all calls to
+    :func:`gather_collated_sim_dfs()` for the duration of the context. A size
+    of 0 disables caching.
+    """
+    global _collated_cache
+
+    if cmdopts['pm_cache_mb'] <= 0:
+        yield None
+        return
+
+    prev = _collated_cache
+    _collated_cache = CollatedCSVCache(cmdopts['pm_cache_mb'] * 1024 * 1024,
+                                       cmdopts['pm_cache_ss_only'])
+    try:
+        yield _collated_cache
+    finally:
+        logging.getLogger(__name__).debug("Collated .csv cache: hits=%s,misses=%s,size=%sB",
+                                          _collated_cache.hits,
+                                          _collated_cache.misses,
+                                          _collated_cache.n_bytes)
+        _collated_cache = prev
+
+
 def gather_collated_sim_dfs(cmdopts: types.Cmdopts,
                             criteria: bc.IConcreteBatchCriteria,
                             csv_leaf: str,
-                            csv_col: str) -> tp.Dict[str, pd.DataFrame]:
+                            csv_col: str,
+                            steady_state: bool = False) -> tp.Dict[str, pd.DataFrame]:
+    """
+    Read the collated ``.csv`` for the specified leaf and column for each
+    experiment in the batch, going through the active
+    :class:`CollatedCSVCache`, if there is one.
+
+    Args:
+        steady_state: If True, the caller only uses the steady state (last)
+                      row of each dataframe.
+    """
     # exp_dirs = criteria.gen_exp_dirnames(cmdopts)
     exp_dirs = utils.exp_range_calc(cmdopts, '', criteria)
     dfs = {}
     for d in exp_dirs:
-        csv_ipath = os.path.join(cmdopts["batch_stat_collate_root"],
-                                 d + '-' + csv_leaf + '-' + csv_col + '.csv')
-        dfs[d] = storage.DataFrameReader('storage.csv')(csv_ipath)
+        if _collated_cache is not None:
+            dfs[d] = _collated_cache.get(cmdopts,
+                                         d,
+                                         csv_leaf,
+                                         csv_col,
+                                         steady_state)
+        else:
+            csv_ipath = os.path.join(cmdopts["batch_stat_collate_root"],
+                                     d + '-' + csv_leaf + '-' + csv_col + '.csv')
+            dfs[d] = storage.DataFrameReader('storage.csv')(csv_ipath)
     return dfs
 
 
+# cmdopts which affect the values of performance measures; if any of them
+# change, all measures are recomputed.
+kPMConfigKeys = ['exp_range',
+                 'dist_stats',
+                 'pm_scalability_normalize',
+                 'pm_scalability_from_exp0',
+                 'pm_self_org_normalize',
+                 'pm_flexibility_normalize',
+                 'pm_robustness_normalize',
+                 'pm_normalize_method',
+                 'envc_cs_method',
+                 'reactivity_cs_method',
+                 'adaptability_cs_method',
+                 'rperf_cs_method',
+                 'vcs_band_width']
+
+
+def _pm_manifest_path(cmdopts: types.Cmdopts, oleaf: str) -> str:
+    return os.path.join(cmdopts['batch_stat_collate_root'], oleaf + '.inputs.json')
+
+
+def _pm_outputs(cmdopts: types.Cmdopts, oleaf: str) -> tp.List[str]:
+    root = cmdopts['batch_stat_collate_root']
+    manifest = os.path.basename(_pm_manifest_path(cmdopts, oleaf))
+    return sorted(os.path.join(root, f) for f in os.listdir(root)
+                  if f.startswith(oleaf + '.') and f != manifest)
+
+
+def _pm_stamps(paths: tp.List[str]) -> tp.Optional[tp.Dict[str, tp.List[int]]]:
+    stamps = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamps[path] = [st.st_size, st.st_mtime_ns]
+    return stamps
+
+
+def _pm_state(cmdopts: types.Cmdopts,
+              criteria: bc.IConcreteBatchCriteria,
+              inputs: tp.List[tp.Tuple[str, str]],
+              extra_inputs: tp.Optional[tp.List[str]]) -> tp.Optional[tp.Dict[str, tp.Any]]:
+    exp_dirs = utils.exp_range_calc(cmdopts, '', criteria)
+    ipaths = [os.path.join(cmdopts["batch_stat_collate_root"],
+                           d + '-' + leaf + '-' + col + '.csv')
+              for d in exp_dirs for leaf, col in inputs]
+    ipaths.extend(extra_inputs or [])
+    istamps = _pm_stamps(ipaths)
+    if istamps is None:
+        return None
+
+    return {
+        'exp_dirs': list(exp_dirs),
+        'config': {k: cmdopts.get(k) for k in kPMConfigKeys},
+        'inputs': istamps
+    }
+
+
+def pm_up_to_date(cmdopts: types.Cmdopts,
+                  criteria: bc.IConcreteBatchCriteria,
+                  oleaf: str,
+                  inputs: tp.List[tp.Tuple[str, str]],
+                  extra_inputs: tp.Optional[tp.List[str]] = None) -> bool:
+    """
+    Determine if the performance measure whose output ``.csv`` files have the
+    stem ``oleaf`` was computed by a previous run of stage 4 from the same
+    collated (leaf, column) ``inputs`` for the same experiments and
+    configuration, and its outputs are as that run left them (see
+    :func:`pm_stamp()`). Always False if ``--pm-force`` is passed.
+
+    ``extra_inputs`` are the paths of any other files the measure reads (see
+    :func:`pm_exp_inputs()`).
+
+    Inputs are compared by size and modification time, so adding simulations
+    or re-running stage 3 for an experiment invalidates every measure computed
+    from it.
+    """
+    if cmdopts.get('pm_force', False):
+        return False
+
+    try:
+        with open(_pm_manifest_path(cmdopts, oleaf), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    state = _pm_state(cmdopts, criteria, inputs, extra_inputs)
+    if state is None or any(manifest.get(k) != v for k, v in state.items()):
+        return False
+
+    outputs = manifest.get('outputs')
+    return bool(outputs) and _pm_stamps(list(outputs.keys())) == outputs
+
+
+def pm_stamp(cmdopts: types.Cmdopts,
+             criteria: bc.IConcreteBatchCriteria,
+             oleaf: str,
+             inputs: tp.List[tp.Tuple[str, str]],
+             extra_inputs: tp.Optional[tp.List[str]] = None) -> None:
+    """
+    Record the inputs, configuration, and outputs of the performance measure
+    whose output ``.csv`` files have the stem ``oleaf``, after it has been
+    computed, for :func:`pm_up_to_date()`.
+    """
+    state = _pm_state(cmdopts, criteria, inputs, extra_inputs)
+    if state is None:
+        return
+
+    state['outputs'] = _pm_stamps(_pm_outputs(cmdopts, oleaf))
+
+    path = _pm_manifest_path(cmdopts, oleaf)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+def pm_exp_inputs(cmdopts: types.Cmdopts,
+                  criteria: bc.IConcreteBatchCriteria,
+                  batch_root: str,
+                  leaf: str) -> tp.List[str]:
+    """
+    Get the paths of the file ``leaf`` in the directory for each experiment
+    under ``batch_root``, for passing as the ``extra_inputs`` of a performance
+    measure which reads more than collated ``.csv`` files (e.g., averaged
+    ``.csv`` files, experiment definitions) to :func:`pm_up_to_date()` and
+    :func:`pm_stamp()`.
+    """
+    return [os.path.join(batch_root, d, leaf)
+            for d in utils.exp_range_calc(cmdopts, '', criteria)]
+
+
+def map_sim_kernel(cmdopts: types.Cmdopts,
+                   kernel: tp.Callable,
+                   shared: tuple,
+                   tasks: tp.List[tuple]) -> tp.List[tp.Any]:
+    """
+    Compute ``kernel(*shared, *task)`` for each of the independent per-simulation
+    tasks, in a pool of ``--pm-processes`` worker processes if more than 1 is
+    requested. Results are always returned in the same order as the tasks, so
+    callers can fill their output dataframes deterministically.
+
+    ``kernel`` must be a module-level function so that it can be pickled.
+    """
+    return parallel.map_kernel(cmdopts['pm_processes'], kernel, shared, tasks)
+
+
 def univar_distribution_prepare(cmdopts: types.Cmdopts,
                                 criteria: bc.IConcreteBatchCriteria,
                                 oleaf: str,
@@ -520,4 +812,8 @@ __api__ = [
     'SteadyStatePerfLostInteractiveSwarmBivar',
     'SteadyStateFLBivar',
 
+    'CollatedCSVCache',
+    'pm_up_to_date',
+    'pm_stamp',
+
 ]
@@ -39,6 +39,47 @@ import titerra.projects.common.perf_measures.common as pmcommon
 from titerra.projects.common.perf_measures import vcs
 
 
+def _reactivity_kernel(main_config: types.YAMLDict,
+                       cmdopts: types.Cmdopts,
+                       criteria: bc.IConcreteBatchCriteria,
+                       exp_num: int,
+                       ideal_perf_df: pd.Series,
+                       expx_perf_df: pd.Series) -> float:
+    return vcs.ReactivityCS(main_config,
+                            cmdopts,
+                            criteria,
+                            ideal_num=0,
+                            exp_num=exp_num).from_batch(ideal_perf_df=ideal_perf_df,
+                                                        expx_perf_df=expx_perf_df)
+
+
+def _adaptability_kernel(main_config: types.YAMLDict,
+                         cmdopts: types.Cmdopts,
+                         criteria: bc.IConcreteBatchCriteria,
+                         ideal_perf_df: pd.Series,
+                         expx_perf_df: pd.Series) -> float:
+    return vcs.AdaptabilityCS(main_config,
+                              cmdopts,
+                              criteria).from_batch(ideal_num=0,
+                                                   ideal_perf_df=ideal_perf_df,
+                                                   expx_perf_df=expx_perf_df)
+
+
+def _tv_environment_inputs(main_config: types.YAMLDict,
+                           cmdopts: types.Cmdopts,
+                           criteria: bc.IConcreteBatchCriteria) -> tp.List[str]:
+    """
+    Reactivity and adaptability compare performance against the averaged
+    temporal variance applied to the environment in each experiment, in
+    addition to the collated performance.
+    """
+    leaf = main_config['sierra']['perf']['intra_tv_environment_csv'].split('.')[0]
+    return pmcommon.pm_exp_inputs(cmdopts,
+                                  criteria,
+                                  cmdopts['batch_stat_root'],
+                                  leaf + sierra.core.config.kStatsExtensions['mean'])
+
+
 class BaseSteadyStateReactivity:
     kLeaf = 'PM-ss-reactivity'
 
@@ -67,6 +108,10 @@ class SteadyStateReactivityUnivar(BaseSteadyStateReactivity):
         exp0 = list(collated_perf.keys())[0]
         exp0_perf_df = collated_perf[exp0]
 
+        # The comparison for each (experiment, simulation) pair is independent,
+        # so they can be farmed out to multiple processes.
+        keys = []
+        tasks = []
         for i in range(1, criteria.n_exp()):
             expx = list(collated_perf.keys())[i]
             expx_perf_df = collated_perf[expx]
@@ -74,13 +119,15 @@ class SteadyStateReactivityUnivar(BaseSteadyStateReactivity):
                                         index=[0])  # Steady state
 
             for sim in expx_perf_df.columns:
-                reactivity = vcs.ReactivityCS(main_config,
-                                              cmdopts,
-                                              criteria,
-                                              ideal_num=0,
-                                              exp_num=i).from_batch(ideal_perf_df=exp0_perf_df[sim],
-                                                                    expx_perf_df=expx_perf_df[sim])
-                rt_dfs[expx].loc[0, sim] = reactivity
+                keys.append((expx, sim))
+                tasks.append((i, exp0_perf_df[sim], expx_perf_df[sim]))
+
+        results = pmcommon.map_sim_kernel(cmdopts,
+                                          _reactivity_kernel,
+                                          (main_config, cmdopts, criteria),
+                                          tasks)
+        for (expx, sim), reactivity in zip(keys, results):
+            rt_dfs[expx].loc[0, sim] = reactivity
 
         return rt_dfs
 
@@ -99,15 +146,23 @@ class SteadyStateReactivityUnivar(BaseSteadyStateReactivity):
         Calculate the reactivity metric for a given controller within a specific scenario, and
         generate a graph of the result.
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.main_config, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _tv_environment_inputs(self.main_config, self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col)
+            pm_dfs = self.df_kernel(criteria, self.main_config, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         opath = os.path.join(self.cmdopts["batch_graph_collate_root"],
                              self.kLeaf + sierra.core.config.kImageExt)
@@ -142,6 +197,10 @@ class SteadyStateAdaptabilityUnivar(BaseSteadyStateAdaptability):
         exp0 = list(collated_perf.keys())[0]
         exp0_perf_df = collated_perf[exp0]
 
+        # The comparison for each (experiment, simulation) pair is independent,
+        # so they can be farmed out to multiple processes.
+        keys = []
+        tasks = []
         for i in range(1, criteria.n_exp()):
             expx = list(collated_perf.keys())[i]
             expx_perf_df = collated_perf[expx]
@@ -149,12 +208,15 @@ class SteadyStateAdaptabilityUnivar(BaseSteadyStateAdaptability):
                                         index=[0])  # Steady state
 
             for sim in expx_perf_df.columns:
-                adaptability = vcs.AdaptabilityCS(main_config,
-                                                  cmdopts,
-                                                  criteria).from_batch(ideal_num=0,
-                                                                       ideal_perf_df=exp0_perf_df[sim],
-                                                                       expx_perf_df=expx_perf_df[sim])
-                ad_dfs[expx].loc[0, sim] = adaptability
+                keys.append((expx, sim))
+                tasks.append((exp0_perf_df[sim], expx_perf_df[sim]))
+
+        results = pmcommon.map_sim_kernel(cmdopts,
+                                          _adaptability_kernel,
+                                          (main_config, cmdopts, criteria),
+                                          tasks)
+        for (expx, sim), adaptability in zip(keys, results):
+            ad_dfs[expx].loc[0, sim] = adaptability
 
         return ad_dfs
 
@@ -173,15 +235,23 @@ class SteadyStateAdaptabilityUnivar(BaseSteadyStateAdaptability):
         Calculate the adaptability metric for a given controller within a specific scenario, and
         generate a graph of the result.
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.main_config, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _tv_environment_inputs(self.main_config, self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col)
+            pm_dfs = self.df_kernel(criteria, self.main_config, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         opath = os.path.join(self.cmdopts["batch_graph_collate_root"],
                              self.kLeaf + sierra.core.config.kImageExt)
@@ -309,22 +379,31 @@ class SteadyStateReactivityBivar(BaseSteadyStateReactivity):
         value of the reactivity metric for each experiment within the batch, and plot
         a :class:`~sierra.core.graphs.heatmap.Heatmap` of the reactivity variable vs. the other one.
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
         # We need to know which of the 2 variables was temporal variance, in order to
         # determine the correct dimension along which to compute the metric.
         axis = sierra.core.utils.get_primary_axis(criteria,
                                                   [tv.TemporalVariance],
                                                   self.cmdopts)
 
-        pm_dfs = self.df_kernel(
-            criteria, self.main_config, self.cmdopts, axis, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _tv_environment_inputs(self.main_config, self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col)
+
+            pm_dfs = self.df_kernel(
+                criteria, self.main_config, self.cmdopts, axis, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
@@ -409,22 +488,31 @@ class SteadyStateAdaptabilityBivar(BaseSteadyStateAdaptability):
         value of the adaptability metric for each experiment within the batch, and plot
         a: class: `~sierra.core.graphs.heatmap.Heatmap` of the adaptability variable vs. the other one.
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
         # We need to know which of the 2 variables was temporal variance, in order to
         # determine the correct dimension along which to compute the metric.
         axis = sierra.core.utils.get_primary_axis(criteria,
                                                   [tv.TemporalVariance],
                                                   self.cmdopts)
 
-        pm_dfs = self.df_kernel(
-            criteria, self.main_config, self.cmdopts, axis, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _tv_environment_inputs(self.main_config, self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col)
+
+            pm_dfs = self.df_kernel(
+                criteria, self.main_config, self.cmdopts, axis, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
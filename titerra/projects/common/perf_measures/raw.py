@@ -45,11 +45,8 @@ class BaseSteadyStateRaw:
 
         dfs = {}
         for exp in collated.keys():
-            dfs[exp] = pd.DataFrame(columns=collated[exp].columns,
-                                    index=[0])  # Steady state
-
-            for col in collated[exp].columns:
-                dfs[exp][col] = collated[exp].loc[collated[exp].index[-1], col]
+            dfs[exp] = pmcommon.steady_state_df(collated[exp].columns,
+                                                pmcommon.steady_state(collated[exp]))
 
         return dfs
 
@@ -75,15 +72,19 @@ class SteadyStateRawUnivar(BaseSteadyStateRaw):
         img_opath = os.path.join(self.cmdopts["batch_graph_collate_root"],
                                  self.kLeaf + sierra.core.config.kImageExt)
 
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(dfs)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(dfs)
 
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         SummaryLineGraph(stats_root=self.cmdopts['batch_stat_collate_root'],
                          input_stem=self.kLeaf,
@@ -117,13 +118,17 @@ class SteadyStateRawBivar(BaseSteadyStateRaw):
         img_opath = os.path.join(self.cmdopts["batch_graph_collate_root"],
                                  self.kLeaf + sierra.core.config.kImageExt)
 
-        dfs = pmcommon.gather_collated_sim_dfs(
-            self.cmdopts, criteria, self.perf_leaf, self.perf_col)
-        pm_dfs = self.df_kernel(dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(
+                self.cmdopts, criteria, self.perf_leaf, self.perf_col,
+                steady_state=True)
+            pm_dfs = self.df_kernel(dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         stat_opath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                                   self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
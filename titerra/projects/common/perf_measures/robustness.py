@@ -24,17 +24,18 @@ import typing as tp
 
 # 3rd party packages
 import pandas as pd
+import numpy as np
 from sierra.core.graphs.summary_line_graph import SummaryLineGraph
 import sierra.core.variables.batch_criteria as bc
 from sierra.core.graphs.heatmap import Heatmap
 import sierra.plugins.platform.argos.variables.saa_noise as saan
 import sierra.core.utils
-from sierra.core.xml import XMLAttrChangeSet
 from sierra.core import types
 import sierra.core.config
 
 # Project packages
 
+import titerra.projects.common.exp_defs as exp_defs
 from titerra.projects.common.perf_measures import vcs
 import titerra.projects.common.perf_measures.common as pmcommon
 from titerra.projects.common.variables.population_dynamics import PopulationDynamics
@@ -42,6 +43,15 @@ from titerra.projects.common.variables.population_dynamics import PopulationDyna
 kIDEAL_SAA_ROBUSTNESS = 0.0
 
 
+def _saa_kernel(main_config: types.YAMLDict,
+                cmdopts: types.Cmdopts,
+                ideal_perf_df: pd.Series,
+                expx_perf_df: pd.Series) -> float:
+    return vcs.RawPerfCS(main_config,
+                         cmdopts).from_batch(ideal_perf_df=ideal_perf_df,
+                                             expx_perf_df=expx_perf_df)
+
+
 class BaseSteadyStateRobustnessSAA:
     kLeaf = 'PM-ss-robustness-saa'
 
@@ -86,6 +96,22 @@ class BaseSteadyStateRobustnessPD:
         else:
             return theta
 
+    @staticmethod
+    def array_kernel(T_Sbar0: float,
+                     T_SbarN: float,
+                     perf0: np.ndarray,
+                     perfN: np.ndarray,
+                     normalize: bool,
+                     normalize_method: str) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        scaled_perf0 = float(T_Sbar0) / float(T_SbarN) * perf0
+        theta = (perfN - scaled_perf0)
+
+        return pmcommon.sigmoid_normalize(theta, normalize, normalize_method)
+
 
 ################################################################################
 # Univariate Classes
@@ -109,6 +135,10 @@ class SteadyStateRobustnessSAAUnivar(BaseSteadyStateRobustnessSAA):
         exp0 = list(collated_perf.keys())[0]
         exp0_perf_df = collated_perf[exp0]
 
+        # The comparison for each (experiment, simulation) pair is independent,
+        # so they can be farmed out to multiple processes.
+        keys = []
+        tasks = []
         for i in range(1, criteria.n_exp()):
             expx = list(collated_perf.keys())[i]
             expx_perf_df = collated_perf[expx]
@@ -116,10 +146,15 @@ class SteadyStateRobustnessSAAUnivar(BaseSteadyStateRobustnessSAA):
                                          index=[0])  # Steady state
 
             for sim in expx_perf_df.columns:
-                robustness = vcs.RawPerfCS(main_config,
-                                           cmdopts).from_batch(ideal_perf_df=exp0_perf_df[sim],
-                                                               expx_perf_df=expx_perf_df[sim])
-                saa_dfs[expx].loc[0, sim] = robustness
+                keys.append((expx, sim))
+                tasks.append((exp0_perf_df[sim], expx_perf_df[sim]))
+
+        results = pmcommon.map_sim_kernel(cmdopts,
+                                          _saa_kernel,
+                                          (main_config, cmdopts),
+                                          tasks)
+        for (expx, sim), robustness in zip(keys, results):
+            saa_dfs[expx].loc[0, sim] = robustness
 
         return saa_dfs
 
@@ -141,15 +176,18 @@ class SteadyStateRobustnessSAAUnivar(BaseSteadyStateRobustnessSAA):
 
         """
 
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.main_config, self.cmdopts, dfs)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col)
+            pm_dfs = self.df_kernel(criteria, self.main_config, self.cmdopts, dfs)
 
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         opath = os.path.join(self.cmdopts["batch_graph_collate_root"],
                              self.kLeaf + sierra.core.config.kImageExt)
@@ -184,34 +222,24 @@ class SteadyStateRobustnessPDUnivar(BaseSteadyStateRobustnessPD):
 
         exp0 = list(collated_perf.keys())[0]
         exp0_perf_df = collated_perf[exp0]
-        exp0_def = XMLAttrChangeSet.unpickle(os.path.join(cmdopts['batch_input_root'],
-                                                          exp_dirs[0],
-                                                          sierra.core.config.kPickleLeaf))
-        T_Sbar0 = PopulationDynamics.calc_untasked_swarm_system_time(exp0_def)
+        T_Sbar0 = exp_defs.derive(exp_defs.for_exp(cmdopts['batch_input_root'], exp_dirs[0]),
+                                  PopulationDynamics.calc_untasked_swarm_system_time)
 
         for i in range(0, criteria.n_exp()):
             expx = list(collated_perf.keys())[i]
             expx_perf_df = collated_perf[expx]
-            pd_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                        index=[0])  # Steady state
-
-            expN_def = XMLAttrChangeSet.unpickle(os.path.join(cmdopts['batch_input_root'],
-                                                              exp_dirs[i],
-                                                              sierra.core.config.kPickleLeaf))
-            for sim in expx_perf_df.columns:
-                T_SbarN = PopulationDynamics.calc_untasked_swarm_system_time(
-                    expN_def)
-                perf0 = exp0_perf_df.loc[exp0_perf_df.index[-1], sim]
-                perfN = expx_perf_df.loc[expx_perf_df.index[-1], sim]
 
-                robustness = BaseSteadyStateRobustnessPD.kernel(T_Sbar0=T_Sbar0,
-                                                                T_SbarN=T_SbarN,
-                                                                perf0=perf0,
-                                                                perfN=perfN,
-                                                                normalize=cmdopts['pm_robustness_normalize'],
-                                                                normalize_method=cmdopts['pm_normalize_method'])
+            T_SbarN = exp_defs.derive(exp_defs.for_exp(cmdopts['batch_input_root'], exp_dirs[i]),
+                                      PopulationDynamics.calc_untasked_swarm_system_time)
 
-                pd_dfs[expx].loc[0, sim] = robustness
+            sims = expx_perf_df.columns
+            robustness = BaseSteadyStateRobustnessPD.array_kernel(T_Sbar0=T_Sbar0,
+                                                                  T_SbarN=T_SbarN,
+                                                                  perf0=pmcommon.steady_state(exp0_perf_df, sims),
+                                                                  perfN=pmcommon.steady_state(expx_perf_df, sims),
+                                                                  normalize=cmdopts['pm_robustness_normalize'],
+                                                                  normalize_method=cmdopts['pm_normalize_method'])
+            pd_dfs[expx] = pmcommon.steady_state_df(sims, robustness)
 
         return pd_dfs
 
@@ -232,15 +260,27 @@ class SteadyStateRobustnessPDUnivar(BaseSteadyStateRobustnessPD):
 
         """
 
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = pmcommon.pm_exp_inputs(self.cmdopts,
+                                              criteria,
+                                              self.cmdopts['batch_input_root'],
+                                              sierra.core.config.kPickleLeaf)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         opath = os.path.join(self.cmdopts["batch_graph_collate_root"],
                              self.kLeaf + sierra.core.config.kImageExt)
@@ -350,23 +390,26 @@ class SteadyStateRobustnessSAABivar(BaseSteadyStateRobustnessSAA):
         self.perf_col = perf_col
 
     def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-
         # We need to know which of the 2 variables was SAA noise, in order to determine the correct
         # dimension along which to compute the metric.
         axis = sierra.core.utils.get_primary_axis(criteria,
                                                   [saan.SAANoise],
                                                   self.cmdopts)
 
-        pm_dfs = self.df_kernel(
-            criteria, self.main_config, self.cmdopts, axis, dfs)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col)
 
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pm_dfs = self.df_kernel(
+                criteria, self.main_config, self.cmdopts, axis, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
@@ -403,15 +446,12 @@ class SteadyStateRobustnessPDBivar(BaseSteadyStateRobustnessPD):
             for j in range(axis == 1, ysize):
                 expx = list(collated_perf.keys())[i * ysize + j]
                 expx_perf_df = collated_perf[expx]
-                pd_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                            index=[0])  # Steady state
 
                 expx_pkl_path = os.path.join(cmdopts['batch_input_root'],
                                              exp_dirs[i * ysize + j],
                                              sierra.core.config.kPickleLeaf)
-                expx_def = XMLAttrChangeSet.unpickle(expx_pkl_path)
-                T_SbarN = PopulationDynamics.calc_untasked_swarm_system_time(
-                    expx_def)
+                T_SbarN = exp_defs.derive(expx_pkl_path,
+                                          PopulationDynamics.calc_untasked_swarm_system_time)
 
                 if axis == 0:
                     # exp0 in first row with i=0
@@ -427,20 +467,17 @@ class SteadyStateRobustnessPDBivar(BaseSteadyStateRobustnessPD):
                                                  sierra.core.config.kPickleLeaf)
 
                 exp0_perf_df = collated_perf[exp0]
-                exp0_def = XMLAttrChangeSet.unpickle(exp0_pkl_path)
-                T_Sbar0 = PopulationDynamics.calc_untasked_swarm_system_time(
-                    exp0_def)
-
-                for sim in expx_perf_df.columns:
-                    perf0 = exp0_perf_df.loc[exp0_perf_df.index[-1], sim]
-                    perfN = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-                    robustness = BaseSteadyStateRobustnessPD.kernel(T_Sbar0=T_Sbar0,
-                                                                    T_SbarN=T_SbarN,
-                                                                    perfN=perfN,
-                                                                    perf0=perf0,
-                                                                    normalize=cmdopts['pm_robustness_normalize'],
-                                                                    normalize_method=cmdopts['pm_normalize_method'])
-                    pd_dfs[expx].loc[0, sim] = robustness
+                T_Sbar0 = exp_defs.derive(exp0_pkl_path,
+                                          PopulationDynamics.calc_untasked_swarm_system_time)
+
+                sims = expx_perf_df.columns
+                robustness = BaseSteadyStateRobustnessPD.array_kernel(T_Sbar0=T_Sbar0,
+                                                                      T_SbarN=T_SbarN,
+                                                                      perfN=pmcommon.steady_state(expx_perf_df, sims),
+                                                                      perf0=pmcommon.steady_state(exp0_perf_df, sims),
+                                                                      normalize=cmdopts['pm_robustness_normalize'],
+                                                                      normalize_method=cmdopts['pm_normalize_method'])
+                pd_dfs[expx] = pmcommon.steady_state_df(sims, robustness)
 
         return pd_dfs
 
@@ -453,21 +490,34 @@ class SteadyStateRobustnessPDBivar(BaseSteadyStateRobustnessPD):
         self.perf_col = perf_col
 
     def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
         # We need to know which of the 2 variables was population dynamics, in order to determine
         # the correct dimension along which to compute the metric.
         axis = sierra.core.utils.get_primary_axis(criteria,
                                                   [PopulationDynamics],
                                                   self.cmdopts)
 
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = pmcommon.pm_exp_inputs(self.cmdopts,
+                                              criteria,
+                                              self.cmdopts['batch_input_root'],
+                                              sierra.core.config.kPickleLeaf)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
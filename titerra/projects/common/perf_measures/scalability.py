@@ -35,6 +35,7 @@ import math
 
 # 3rd party packages
 import pandas as pd
+import numpy as np
 from sierra.core.graphs.summary_line_graph import SummaryLineGraph
 from sierra.core.graphs.heatmap import Heatmap
 from sierra.core.variables import batch_criteria as bc
@@ -122,6 +123,34 @@ class BaseSteadyStateParallelFraction():
         else:
             return theta
 
+    @staticmethod
+    def array_kernel(speedup_i: np.ndarray,
+                     n_robots_i: int,
+                     n_robots_iminus1: int,
+                     normalize: bool,
+                     normalize_method: str) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state speedups of
+        all simulations in an experiment at once.
+        """
+        if n_robots_i > 1:
+            size_ratio = float(n_robots_i) / float(n_robots_iminus1)
+            speedup_i = np.where(speedup_i == np.inf, 1.0, speedup_i)
+            # Via L'Hospital's rule.
+            speedup_i = np.where(np.isnan(speedup_i), 0.0, speedup_i)
+
+            # If the two swarm sizes we are computing scalability for are the
+            # same, then e becomes 1.0 via L'Hospital's rule.
+            if size_ratio == 1.0:
+                e = np.ones(len(speedup_i))
+            else:
+                e = (speedup_i - 1.0 / size_ratio) / (1.0 - 1.0 / size_ratio)
+        else:
+            e = np.ones(len(speedup_i))
+        theta = 1.0 - e
+
+        return pmcommon.sigmoid_normalize(theta, normalize, normalize_method)
+
 
 class BaseSteadyStateNormalizedEfficiency():
     r"""Calculate for per-robot efficiency.
@@ -141,6 +170,14 @@ class BaseSteadyStateNormalizedEfficiency():
     def kernel(perf_i: float, n_robots_i: int) -> float:
         return perf_i / float(n_robots_i)
 
+    @staticmethod
+    def array_kernel(perf_i: np.ndarray, n_robots_i: int) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        return perf_i / float(n_robots_i)
+
 ################################################################################
 # Univariate Classes
 ################################################################################
@@ -165,13 +202,12 @@ class SteadyStateNormalizedEfficiencyUnivar(BaseSteadyStateNormalizedEfficiency)
             n_robots_x = populations[i]
             expx = list(collated_perf.keys())[i]
             expx_perf_df = collated_perf[expx]
-            sc_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                        index=[0])  # Steady state
 
-            for sim in expx_perf_df.columns:
-                perfN = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-                sc_dfs[expx].loc[0, sim] = BaseSteadyStateNormalizedEfficiency.kernel(perfN,
-                                                                                      n_robots_x)
+            sims = expx_perf_df.columns
+            perfN = pmcommon.steady_state(expx_perf_df, sims)
+            sc_dfs[expx] = pmcommon.steady_state_df(sims,
+                                                    BaseSteadyStateNormalizedEfficiency.array_kernel(perfN,
+                                                                                                     n_robots_x))
 
         return sc_dfs
 
@@ -187,15 +223,19 @@ class SteadyStateNormalizedEfficiencyUnivar(BaseSteadyStateNormalizedEfficiency)
         along with the calculated metric, if they exist.
 
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         SummaryLineGraph(stats_root=self.cmdopts['batch_stat_collate_root'],
                          input_stem=self.kLeaf,
@@ -241,35 +281,36 @@ class SteadyStateParallelFractionUnivar(BaseSteadyStateParallelFraction):
             exp_iminus1 = list(collated_perf.keys())[i - 1]
             exp_iminus1_df = collated_perf[exp_iminus1]
 
-            sc_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                        index=[0])  # Steady state
-
-            for sim in collated_perf[expx].columns:
-                perf_i = expx_df.loc[expx_df.index[-1], sim]
-                n_robots_i = populations[i]
-
-                perf_iminus1 = exp_iminus1_df.loc[exp_iminus1_df.index[-1], sim]
-                n_robots_iminus1 = populations[i - 1]
+            sims = collated_perf[expx].columns
+            perf_i = pmcommon.steady_state(expx_df, sims)
+            perf_iminus1 = pmcommon.steady_state(exp_iminus1_df, sims)
 
+            with np.errstate(divide='ignore', invalid='ignore'):
                 speedup_i = perf_i / perf_iminus1
 
-                sc_dfs[expx].loc[0, sim] = BaseSteadyStateParallelFraction.kernel(speedup_i=speedup_i,
-                                                                                  n_robots_i=n_robots_i,
-                                                                                  n_robots_iminus1=n_robots_iminus1,
-                                                                                  normalize=cmdopts['pm_scalability_normalize'],
-                                                                                  normalize_method=cmdopts['pm_normalize_method'])
+            parallel_frac = BaseSteadyStateParallelFraction.array_kernel(speedup_i=speedup_i,
+                                                                         n_robots_i=populations[i],
+                                                                         n_robots_iminus1=populations[i - 1],
+                                                                         normalize=cmdopts['pm_scalability_normalize'],
+                                                                         normalize_method=cmdopts['pm_normalize_method'])
+            sc_dfs[expx] = pmcommon.steady_state_df(sims, parallel_frac)
+
         return sc_dfs
 
     def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         SummaryLineGraph(stats_root=self.cmdopts['batch_stat_collate_root'],
                          input_stem=self.kLeaf,
@@ -332,13 +373,12 @@ class SteadyStateNormalizedEfficiencyBivar(BaseSteadyStateNormalizedEfficiency):
             for j in range(0, ysize):
                 expx = list(collated_perf.keys())[i * ysize + j]
                 expx_df = collated_perf[expx]
-                sc_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                            index=[0])  # Steady state
 
-                for sim in expx_df.columns:
-                    perf_x = expx_df.loc[expx_df.index[-1], sim]  # steady state
-                    sc_dfs[expx].loc[0, sim] = BaseSteadyStateNormalizedEfficiency.kernel(perf_x,
-                                                                                          populations[i][j])
+                sims = expx_df.columns
+                perf_x = pmcommon.steady_state(expx_df, sims)
+                sc_dfs[expx] = pmcommon.steady_state_df(sims,
+                                                        BaseSteadyStateNormalizedEfficiency.array_kernel(perf_x,
+                                                                                                         populations[i][j]))
         return sc_dfs
 
     def __init__(self, cmdopts: types.Cmdopts, perf_csv: str, perf_col: str) -> None:
@@ -352,15 +392,19 @@ class SteadyStateNormalizedEfficiencyBivar(BaseSteadyStateNormalizedEfficiency):
         in a batch.
 
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, False)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
@@ -399,37 +443,34 @@ class SteadyStateParallelFractionBivar(BaseSteadyStateParallelFraction):
             for j in range(axis == 1, ysize):
                 expx = list(collated_perf.keys())[i * ysize + j]
                 expx_df = collated_perf[expx]
-                sc_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                            index=[0])  # Steady state
-                for sim in expx_df.columns:
-                    perf_x = expx_df.loc[expx_df.index[-1], sim]  # steady state
-
-                    n_robots_x = populations[i][j]
-
-                    if axis == 0:
-                        exp_xminus1 = list(collated_perf.keys())[
-                            (i - 1) * ysize + j]
-                        n_robots_xminus1 = populations[i - 1][j]
-                    else:
-                        exp_xminus1 = list(collated_perf.keys())[
-                            i * ysize + j - 1]
-                        n_robots_xminus1 = populations[i][j - 1]
-
-                    exp_xminus1_df = collated_perf[exp_xminus1]
-                    # steady state
-                    perf_xminus1 = exp_xminus1_df.loc[exp_xminus1_df.index[-1], sim]
-
-                    if perf_xminus1 == 0:
-                        speedup_i = math.inf
-                    else:
-                        speedup_i = perf_x / perf_xminus1
-
-                    parallel_frac = BaseSteadyStateParallelFraction.kernel(speedup_i=speedup_i,
-                                                                           n_robots_i=n_robots_x,
-                                                                           n_robots_iminus1=n_robots_xminus1,
-                                                                           normalize=cmdopts['pm_scalability_normalize'],
-                                                                           normalize_method=cmdopts['pm_normalize_method'])
-                    sc_dfs[expx].loc[0, sim] = parallel_frac
+                n_robots_x = populations[i][j]
+
+                if axis == 0:
+                    exp_xminus1 = list(collated_perf.keys())[
+                        (i - 1) * ysize + j]
+                    n_robots_xminus1 = populations[i - 1][j]
+                else:
+                    exp_xminus1 = list(collated_perf.keys())[
+                        i * ysize + j - 1]
+                    n_robots_xminus1 = populations[i][j - 1]
+
+                exp_xminus1_df = collated_perf[exp_xminus1]
+
+                sims = expx_df.columns
+                perf_x = pmcommon.steady_state(expx_df, sims)
+                perf_xminus1 = pmcommon.steady_state(exp_xminus1_df, sims)
+
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    speedup_i = np.where(perf_xminus1 == 0,
+                                         np.inf,
+                                         perf_x / perf_xminus1)
+
+                parallel_frac = BaseSteadyStateParallelFraction.array_kernel(speedup_i=speedup_i,
+                                                                             n_robots_i=n_robots_x,
+                                                                             n_robots_iminus1=n_robots_xminus1,
+                                                                             normalize=cmdopts['pm_scalability_normalize'],
+                                                                             normalize_method=cmdopts['pm_normalize_method'])
+                sc_dfs[expx] = pmcommon.steady_state_df(sims, parallel_frac)
 
         return sc_dfs
 
@@ -445,24 +486,28 @@ class SteadyStateParallelFractionBivar(BaseSteadyStateParallelFraction):
         along with the calculated metric, if they exist.
 
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
         # We need to know which of the 2 variables was swarm size, in order to determine
         # the correct dimension along which to compute the metric, which depends on
         # performance between adjacent swarm sizes.
-
         axis = sierra.core.utils.get_primary_axis(criteria,
                                                   [population_size.PopulationSize,
                                                    pcd.PopulationConstantDensity,
                                                    pvd.PopulationVariableDensity],
                                                   self. cmdopts)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
 
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        if not pmcommon.pm_up_to_date(self.cmdopts, criteria, self.kLeaf, inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
@@ -39,6 +39,7 @@ import typing as tp
 
 # 3rd party packages
 import pandas as pd
+import numpy as np
 
 from sierra.core.graphs.summary_line_graph import SummaryLineGraph
 from sierra.core.graphs.heatmap import Heatmap
@@ -48,7 +49,7 @@ from sierra.plugins.platform.argos.variables import population_constant_density
 from sierra.plugins.platform.argos.variables import population_variable_density as pvd
 import sierra.core.utils
 import sierra.core.config
-from sierra.core import types
+from sierra.core import types, storage
 
 # Project packages
 
@@ -112,6 +113,25 @@ class BaseSteadyStateFLMarginal():
         else:
             return theta
 
+    @staticmethod
+    def array_kernel(fl_i: np.ndarray,
+                     n_robots_i: int,
+                     fl_iminus1: np.ndarray,
+                     n_robots_iminus1: int,
+                     normalize: bool,
+                     normalize_method: str) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        if n_robots_i > 1:
+            theta = float(n_robots_i) / \
+                float(n_robots_iminus1) * fl_iminus1 - fl_i
+        else:
+            theta = np.zeros(len(fl_i))
+
+        return pmcommon.sigmoid_normalize(theta, normalize, normalize_method)
+
 
 class BaseSteadyStateFLInteractive():
     r"""
@@ -156,6 +176,21 @@ class BaseSteadyStateFLInteractive():
         else:
             return theta
 
+    @staticmethod
+    def array_kernel(fl_i: np.ndarray,
+                     n_robots_i: int,
+                     fl_1: np.ndarray,
+                     normalize: bool,
+                     normalize_method: str) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        scaled_fl_1 = float(n_robots_i) * fl_1
+        theta = scaled_fl_1 - fl_i
+
+        return pmcommon.sigmoid_normalize(theta, normalize, normalize_method)
+
 
 class BaseSteadyStatePGMarginal():
     r"""Calculates the marginal performance gains achieved by the swarm
@@ -208,6 +243,25 @@ class BaseSteadyStatePGMarginal():
         else:
             return theta
 
+    @staticmethod
+    def array_kernel(perf_i: np.ndarray,
+                     n_robots_i: int,
+                     perf_iminus1: np.ndarray,
+                     n_robots_iminus1: int,
+                     normalize: bool,
+                     normalize_method: str) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        if n_robots_i > 1:
+            theta = perf_i - (float(n_robots_i) /
+                              float(n_robots_iminus1)) * perf_iminus1
+        else:
+            theta = np.zeros(len(perf_i))
+
+        return pmcommon.sigmoid_normalize(theta, normalize, normalize_method)
+
 
 class BaseSteadyStatePGInteractive():
     r"""
@@ -251,6 +305,148 @@ class BaseSteadyStatePGInteractive():
         else:
             return theta
 
+    @staticmethod
+    def array_kernel(perf_i: np.ndarray,
+                     n_robots_i: int,
+                     perf_0: np.ndarray,
+                     normalize: bool,
+                     normalize_method: str) -> np.ndarray:
+        """
+        Same as :meth:`kernel()`, but operating on the steady state values of
+        all simulations in an experiment at once.
+        """
+        theta = perf_i - n_robots_i * perf_0
+
+        return pmcommon.sigmoid_normalize(theta, normalize, normalize_method)
+
+
+def _exp_def_inputs(cmdopts: types.Cmdopts,
+                    criteria: bc.IConcreteBatchCriteria) -> tp.List[str]:
+    """
+    The self-organization measures scale performance by the swarm size of each
+    experiment, which comes from its pickled definition.
+    """
+    return pmcommon.pm_exp_inputs(cmdopts,
+                                  criteria,
+                                  cmdopts['batch_input_root'],
+                                  sierra.core.config.kPickleLeaf)
+
+
+class SteadyStateFLIntermediates():
+    r"""Computes the intermediate results the fractional performance loss based
+    self-organization measures depend on: :math:`P_{lost}` for each experiment
+    (see
+    :class:`~titerra.projects.common.perf_measures.common.BaseSteadyStatePerfLostInteractiveSwarm`)
+    and the fractional losses :math:`FL` derived from it (see
+    :class:`~titerra.projects.common.perf_measures.common.BaseSteadyStateFL`).
+
+    They only depend on the collated performance and interference ``.csv``
+    files and the swarm size of each experiment, so :class:`SelfOrgUnivarGenerator`/:class:`SelfOrgBivarGenerator`
+    compute them once per batch and hand them to each measure. If
+    ``--pm-self-org-persist`` is passed, they are also written next to the
+    collated ``.csv`` files, and re-used by later stage 4 runs as long as they
+    are newer than all of the collated files and experiment definitions they
+    were computed from.
+
+    """
+    kPlostLeaf = 'PM-ss-plost'
+    kFLLeaf = 'PM-ss-fl'
+
+    def __init__(self,
+                 cmdopts: types.Cmdopts,
+                 perf_csv: str,
+                 perf_col: str,
+                 interference_csv: str,
+                 interference_col: str) -> None:
+        self.cmdopts = cmdopts
+        self.perf_leaf = perf_csv.split('.')[0]
+        self.perf_col = perf_col
+        self.interference_leaf = interference_csv.split('.')[0]
+        self.interference_col = interference_col
+        self.logger = logging.getLogger(__name__)
+        self.fl = None  # type: tp.Optional[tp.Dict[str, pd.DataFrame]]
+
+    def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> tp.Dict[str, pd.DataFrame]:
+        """
+        Get the steady state fractional losses for each experiment in the
+        batch, computing (and optionally persisting) them if needed. They are
+        only computed once per object.
+        """
+        if self.fl is None:
+            self.fl = self._from_batch(criteria)
+
+        return self.fl
+
+    def _from_batch(self, criteria: bc.IConcreteBatchCriteria) -> tp.Dict[str, pd.DataFrame]:
+        exp_dirs = sierra.core.utils.exp_range_calc(self.cmdopts, '', criteria)
+
+        if self.cmdopts['pm_self_org_persist'] and self._persisted_valid(criteria, exp_dirs):
+            self.logger.debug("Using persisted P_lost/FL from %s",
+                              self.cmdopts['batch_stat_collate_root'])
+            return {d: storage.DataFrameReader('storage.csv')(self._opath(d, self.kFLLeaf))
+                    for d in exp_dirs}
+
+        perf_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                    criteria,
+                                                    self.perf_leaf,
+                                                    self.perf_col,
+                                                    steady_state=True)
+        interference_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                            criteria,
+                                                            self.interference_leaf,
+                                                            self.interference_col,
+                                                            steady_state=True)
+
+        if criteria.is_univar():
+            plostN = pmcommon.SteadyStatePerfLostInteractiveSwarmUnivar.df_kernel(criteria,
+                                                                                  self.cmdopts,
+                                                                                  interference_dfs,
+                                                                                  perf_dfs)
+            fl = pmcommon.SteadyStateFLUnivar.df_kernel(criteria, perf_dfs, plostN)
+        else:
+            plostN = pmcommon.SteadyStatePerfLostInteractiveSwarmBivar.df_kernel(criteria,
+                                                                                 self.cmdopts,
+                                                                                 interference_dfs,
+                                                                                 perf_dfs)
+            fl = pmcommon.SteadyStateFLBivar.df_kernel(criteria,
+                                                       self.cmdopts,
+                                                       perf_dfs,
+                                                       plostN)
+
+        if self.cmdopts['pm_self_org_persist']:
+            for d in exp_dirs:
+                writer = storage.DataFrameWriter('storage.csv')
+                writer(plostN[d], self._opath(d, self.kPlostLeaf), index=False)
+                writer(fl[d], self._opath(d, self.kFLLeaf), index=False)
+
+        return fl
+
+    def _opath(self, exp: str, leaf: str) -> str:
+        return os.path.join(self.cmdopts['batch_stat_collate_root'],
+                            exp + '-' + leaf + '-' + self.perf_col + '.csv')
+
+    def _persisted_valid(self,
+                         criteria: bc.IConcreteBatchCriteria,
+                         exp_dirs: tp.List[str]) -> bool:
+        # P_lost depends on the swarm size of each experiment too, so a stage 1
+        # re-run without a stage 3 re-run also invalidates them.
+        inputs = _exp_def_inputs(self.cmdopts, criteria)
+        outputs = []
+        for d in exp_dirs:
+            inputs.extend([os.path.join(self.cmdopts['batch_stat_collate_root'],
+                                        d + '-' + leaf + '-' + col + '.csv')
+                           for leaf, col in [(self.perf_leaf, self.perf_col),
+                                             (self.interference_leaf, self.interference_col)]])
+            outputs.extend([self._opath(d, self.kPlostLeaf),
+                            self._opath(d, self.kFLLeaf)])
+
+        if not all(os.path.exists(f) for f in inputs + outputs):
+            return False
+
+        newest_input = max(os.path.getmtime(f) for f in inputs)
+        return all(os.path.getmtime(f) >= newest_input for f in outputs)
+
+
 ################################################################################
 # Univariate Classes
 ################################################################################
@@ -283,20 +479,14 @@ class SteadyStateFLMarginalUnivar(BaseSteadyStateFLMarginal):
             exp_xminus1 = list(collated_fl.keys())[i - 1]
             exp_xminus1_fl_df = collated_fl[exp_xminus1]
 
-            so_dfs[expx] = pd.DataFrame(columns=collated_fl[expx].columns,
-                                        index=[0])  # Steady state
-
-            for sim in expx_fl_df.columns:
-                fl_x = expx_fl_df.loc[expx_fl_df.index[-1], sim]
-                fl_xminus1 = exp_xminus1_fl_df.loc[exp_xminus1_fl_df.index[-1], sim]
-
-                self_org = BaseSteadyStateFLMarginal.kernel(fl_i=fl_x,
-                                                            fl_iminus1=fl_xminus1,
-                                                            n_robots_i=n_robots_x,
-                                                            n_robots_iminus1=n_robots_xminus1,
-                                                            normalize=cmdopts['pm_self_org_normalize'],
-                                                            normalize_method=cmdopts['pm_normalize_method'])
-                so_dfs[expx].loc[0, sim] = self_org
+            sims = expx_fl_df.columns
+            self_org = BaseSteadyStateFLMarginal.array_kernel(fl_i=pmcommon.steady_state(expx_fl_df, sims),
+                                                              fl_iminus1=pmcommon.steady_state(exp_xminus1_fl_df, sims),
+                                                              n_robots_i=n_robots_x,
+                                                              n_robots_iminus1=n_robots_xminus1,
+                                                              normalize=cmdopts['pm_self_org_normalize'],
+                                                              normalize_method=cmdopts['pm_normalize_method'])
+            so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -311,29 +501,37 @@ class SteadyStateFLMarginalUnivar(BaseSteadyStateFLMarginal):
         self.perf_col = perf_col
         self.interference_leaf = interference_csv.split('.')[0]
         self.interference_col = interference_col
-
-    def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        perf_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                    criteria,
-                                                    self.perf_leaf,
-                                                    self.perf_col)
-        interference_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                            criteria,
-                                                            self.interference_leaf,
-                                                            self.interference_col)
-
-        plostN = pmcommon.SteadyStatePerfLostInteractiveSwarmUnivar.df_kernel(criteria,
-                                                                              self.cmdopts,
-                                                                              interference_dfs,
-                                                                              perf_dfs)
-
-        fl = pmcommon.SteadyStateFLUnivar.df_kernel(criteria, perf_dfs, plostN)
-
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, fl)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        self.intermediates = SteadyStateFLIntermediates(cmdopts,
+                                                        perf_csv,
+                                                        perf_col,
+                                                        interference_csv,
+                                                        interference_col)
+
+    def from_batch(self,
+                   criteria: bc.IConcreteBatchCriteria,
+                   intermediates: tp.Optional[SteadyStateFLIntermediates] = None) -> None:
+        """
+        Calculate the measure for each experiment in the batch, using the
+        fractional losses computed by the passed
+        :class:`SteadyStateFLIntermediates`, if any. The fractional losses are
+        only computed if the measure is out of date.
+        """
+        inputs = [(self.perf_leaf, self.perf_col),
+                  (self.interference_leaf, self.interference_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            fl = (intermediates or self.intermediates).from_batch(criteria)
+
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, fl)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         SummaryLineGraph(stats_root=self.cmdopts['batch_stat_collate_root'],
                          input_stem=self.kLeaf,
@@ -376,18 +574,13 @@ class SteadyStateFLInteractiveUnivar(BaseSteadyStateFLInteractive):
             expx = list(collated_fl.keys())[i]
             expx_fl_df = collated_fl[expx]
 
-            so_dfs[expx] = pd.DataFrame(columns=collated_fl[expx].columns,
-                                        index=[0])  # Steady state
-
-            for sim in expx_fl_df.columns:
-                fl_x = expx_fl_df.loc[expx_fl_df.index[-1], sim]
-                fl_1 = exp0_fl_df.loc[exp0_fl_df.index[-1], sim]
-                self_org = BaseSteadyStateFLInteractive.kernel(fl_i=fl_x,
-                                                               n_robots_i=n_robots_x,
-                                                               fl_1=fl_1,
-                                                               normalize=cmdopts['pm_self_org_normalize'],
-                                                               normalize_method=cmdopts['pm_normalize_method'])
-                so_dfs[expx].loc[0, sim] = self_org
+            sims = expx_fl_df.columns
+            self_org = BaseSteadyStateFLInteractive.array_kernel(fl_i=pmcommon.steady_state(expx_fl_df, sims),
+                                                                 n_robots_i=n_robots_x,
+                                                                 fl_1=pmcommon.steady_state(exp0_fl_df, sims),
+                                                                 normalize=cmdopts['pm_self_org_normalize'],
+                                                                 normalize_method=cmdopts['pm_normalize_method'])
+            so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -402,29 +595,37 @@ class SteadyStateFLInteractiveUnivar(BaseSteadyStateFLInteractive):
         self.perf_col = perf_col
         self.interference_leaf = interference_csv.split('.')[0]
         self.interference_col = interference_col
-
-    def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        perf_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                    criteria,
-                                                    self.perf_leaf,
-                                                    self.perf_col)
-        interference_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                            criteria,
-                                                            self.interference_leaf,
-                                                            self.interference_col)
-
-        plostN = pmcommon.SteadyStatePerfLostInteractiveSwarmUnivar.df_kernel(criteria,
-                                                                              self.cmdopts,
-                                                                              interference_dfs,
-                                                                              perf_dfs)
-
-        fl = pmcommon.SteadyStateFLUnivar.df_kernel(criteria, perf_dfs, plostN)
-
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, fl)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        self.intermediates = SteadyStateFLIntermediates(cmdopts,
+                                                        perf_csv,
+                                                        perf_col,
+                                                        interference_csv,
+                                                        interference_col)
+
+    def from_batch(self,
+                   criteria: bc.IConcreteBatchCriteria,
+                   intermediates: tp.Optional[SteadyStateFLIntermediates] = None) -> None:
+        """
+        Calculate the measure for each experiment in the batch, using the
+        fractional losses computed by the passed
+        :class:`SteadyStateFLIntermediates`, if any. The fractional losses are
+        only computed if the measure is out of date.
+        """
+        inputs = [(self.perf_leaf, self.perf_col),
+                  (self.interference_leaf, self.interference_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            fl = (intermediates or self.intermediates).from_batch(criteria)
+
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, fl)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         SummaryLineGraph(stats_root=self.cmdopts['batch_stat_collate_root'],
                          input_stem=self.kLeaf,
@@ -469,19 +670,14 @@ class SteadyStatePGMarginalUnivar(BaseSteadyStatePGMarginal):
             exp_xminus1 = list(collated_perf.keys())[i - 1]
             exp_xminus1_perf_df = collated_perf[exp_xminus1]
 
-            so_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                        index=[0])  # Steady state
-
-            for sim in expx_perf_df.columns:
-                perf_x = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-                perf_xminus1 = exp_xminus1_perf_df.loc[exp_xminus1_perf_df.index[-1], sim]
-                self_org = BaseSteadyStatePGMarginal.kernel(perf_i=perf_x,
-                                                            n_robots_i=n_robots_x,
-                                                            perf_iminus1=perf_xminus1,
-                                                            n_robots_iminus1=n_robots_xminus1,
-                                                            normalize=cmdopts['pm_self_org_normalize'],
-                                                            normalize_method=cmdopts['pm_normalize_method'])
-                so_dfs[expx].loc[0, sim] = self_org
+            sims = expx_perf_df.columns
+            self_org = BaseSteadyStatePGMarginal.array_kernel(perf_i=pmcommon.steady_state(expx_perf_df, sims),
+                                                              n_robots_i=n_robots_x,
+                                                              perf_iminus1=pmcommon.steady_state(exp_xminus1_perf_df, sims),
+                                                              n_robots_iminus1=n_robots_xminus1,
+                                                              normalize=cmdopts['pm_self_org_normalize'],
+                                                              normalize_method=cmdopts['pm_normalize_method'])
+            so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -496,15 +692,24 @@ class SteadyStatePGMarginalUnivar(BaseSteadyStatePGMarginal):
         each experiment in a batch.
 
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         SummaryLineGraph(stats_root=self.cmdopts['batch_stat_collate_root'],
                          input_stem=self.kLeaf,
@@ -547,19 +752,13 @@ class SteadyStatePGInteractiveUnivar(BaseSteadyStatePGInteractive):
             expx = list(collated_perf.keys())[i]
             expx_perf_df = collated_perf[expx]
 
-            so_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                        index=[0])  # Steady state
-
-            for sim in expx_perf_df.columns:
-                perf_0 = exp0_perf_df.loc[exp0_perf_df.index[-1], sim]
-                perf_x = expx_perf_df.loc[expx_perf_df.index[-1], sim]
-                self_org = BaseSteadyStatePGInteractive.kernel(perf_i=perf_x,
-                                                               n_robots_i=n_robots_x,
-                                                               perf_0=perf_0,
-                                                               normalize=cmdopts['pm_self_org_normalize'],
-                                                               normalize_method=cmdopts['pm_normalize_method'])
-
-                so_dfs[expx].loc[0, sim] = self_org
+            sims = expx_perf_df.columns
+            self_org = BaseSteadyStatePGInteractive.array_kernel(perf_i=pmcommon.steady_state(expx_perf_df, sims),
+                                                                 n_robots_i=n_robots_x,
+                                                                 perf_0=pmcommon.steady_state(exp0_perf_df, sims),
+                                                                 normalize=cmdopts['pm_self_org_normalize'],
+                                                                 normalize_method=cmdopts['pm_normalize_method'])
+            so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -574,15 +773,24 @@ class SteadyStatePGInteractiveUnivar(BaseSteadyStatePGInteractive):
         each experiment in a batch.
 
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.univar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.univar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         SummaryLineGraph(stats_root=self.cmdopts['batch_stat_collate_root'],
                          input_stem=self.kLeaf,
@@ -619,16 +827,24 @@ class SelfOrgUnivarGenerator:
                  criteria: bc.IConcreteBatchCriteria) -> None:
         self.logger.info("From %s", cmdopts["batch_stat_collate_root"])
 
+        # Fractional losses are needed by multiple measures; only compute them
+        # once, and only if one of those measures is out of date.
+        intermediates = SteadyStateFLIntermediates(cmdopts,
+                                                   perf_csv,
+                                                   perf_col,
+                                                   interference_csv,
+                                                   interference_col)
+
         SteadyStateFLMarginalUnivar(cmdopts,
                                     perf_csv,
                                     perf_col,
                                     interference_csv,
-                                    interference_col).from_batch(criteria)
+                                    interference_col).from_batch(criteria, intermediates)
         SteadyStateFLInteractiveUnivar(cmdopts,
                                        perf_csv,
                                        perf_col,
                                        interference_csv,
-                                       interference_col).from_batch(criteria)
+                                       interference_col).from_batch(criteria, intermediates)
         SteadyStatePGMarginalUnivar(
             cmdopts, perf_csv, perf_col).from_batch(criteria)
         SteadyStatePGInteractiveUnivar(
@@ -672,35 +888,27 @@ class SteadyStateFLMarginalBivar(BaseSteadyStateFLMarginal):
             for j in range(axis == 1, ysize):
                 expx = list(collated_fl.keys())[i * ysize + j]
                 flx_df = collated_fl[expx]
-
-                so_dfs[expx] = pd.DataFrame(columns=collated_fl[expx].columns,
-                                            index=[0])  # Steady state
                 n_robots_x = populations[i][j]
 
-                for sim in flx_df.columns:
-                    fl_x = flx_df.loc[flx_df.index[-1], sim]  # steady state
-
-                    if axis == 0:
-                        exp_xminus1 = list(collated_fl.keys())[
-                            (i - 1) * ysize + j]
-                        n_robots_xminus1 = populations[i - 1][j]
-                    else:
-                        exp_xminus1 = list(collated_fl.keys())[
-                            i * ysize + (j - 1)]
-                        n_robots_xminus1 = populations[i][j - 1]
-
-                    fl_xminus1_df = collated_fl[exp_xminus1]
-                    # steady state
-                    fl_xminus1 = fl_xminus1_df.loc[fl_xminus1_df.index[-1], sim]
+                if axis == 0:
+                    exp_xminus1 = list(collated_fl.keys())[
+                        (i - 1) * ysize + j]
+                    n_robots_xminus1 = populations[i - 1][j]
+                else:
+                    exp_xminus1 = list(collated_fl.keys())[
+                        i * ysize + (j - 1)]
+                    n_robots_xminus1 = populations[i][j - 1]
 
-                    self_org = BaseSteadyStateFLMarginal.kernel(fl_i=fl_x,
-                                                                n_robots_i=n_robots_x,
-                                                                fl_iminus1=fl_xminus1,
-                                                                n_robots_iminus1=n_robots_xminus1,
-                                                                normalize=cmdopts['pm_self_org_normalize'],
-                                                                normalize_method=cmdopts['pm_normalize_method'])
+                fl_xminus1_df = collated_fl[exp_xminus1]
 
-                    so_dfs[expx].loc[0, sim] = self_org
+                sims = flx_df.columns
+                self_org = BaseSteadyStateFLMarginal.array_kernel(fl_i=pmcommon.steady_state(flx_df, sims),
+                                                                  n_robots_i=n_robots_x,
+                                                                  fl_iminus1=pmcommon.steady_state(fl_xminus1_df, sims),
+                                                                  n_robots_iminus1=n_robots_xminus1,
+                                                                  normalize=cmdopts['pm_self_org_normalize'],
+                                                                  normalize_method=cmdopts['pm_normalize_method'])
+                so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -715,25 +923,21 @@ class SteadyStateFLMarginalBivar(BaseSteadyStateFLMarginal):
         self.perf_col = perf_col
         self.interference_leaf = interference_csv.split('.')[0]
         self.interference_col = interference_col
-
-    def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        perf_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                    criteria,
-                                                    self.perf_leaf,
-                                                    self.perf_col)
-        interference_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                            criteria,
-                                                            self.interference_leaf,
-                                                            self.interference_col)
-
-        plostN = pmcommon.SteadyStatePerfLostInteractiveSwarmBivar.df_kernel(criteria,
-                                                                             self.cmdopts,
-                                                                             interference_dfs,
-                                                                             perf_dfs)
-
-        fl = pmcommon.SteadyStateFLBivar.df_kernel(
-            criteria, self.cmdopts, perf_dfs, plostN)
-
+        self.intermediates = SteadyStateFLIntermediates(cmdopts,
+                                                        perf_csv,
+                                                        perf_col,
+                                                        interference_csv,
+                                                        interference_col)
+
+    def from_batch(self,
+                   criteria: bc.IConcreteBatchCriteria,
+                   intermediates: tp.Optional[SteadyStateFLIntermediates] = None) -> None:
+        """
+        Calculate the measure for each experiment in the batch, using the
+        fractional losses computed by the passed
+        :class:`SteadyStateFLIntermediates`, if any. The fractional losses are
+        only computed if the measure is out of date.
+        """
         # We need to know which of the 2 variables was swarm size, in order to determine
         # the correct dimension along which to compute the metric, which depends on
         # performance between adjacent swarm sizes.
@@ -743,11 +947,22 @@ class SteadyStateFLMarginalBivar(BaseSteadyStateFLMarginal):
                                                    pvd.PopulationVariableDensity],
                                                   self.cmdopts)
 
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, fl)
+        inputs = [(self.perf_leaf, self.perf_col),
+                  (self.interference_leaf, self.interference_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            fl = (intermediates or self.intermediates).from_batch(criteria)
 
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, fl)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
@@ -795,23 +1010,16 @@ class SteadyStateFLInteractiveBivar(BaseSteadyStateFLInteractive):
                     exp0 = list(collated_fl.keys())[i * ysize + 0]
 
                 flx_df = collated_fl[expx]
-
-                so_dfs[expx] = pd.DataFrame(columns=collated_fl[expx].columns,
-                                            index=[0])  # Steady state
+                fl_1_df = collated_fl[exp0]
                 n_robots_x = populations[i][j]
 
-                for sim in flx_df.columns:
-                    fl_x = flx_df.loc[flx_df.index[-1], sim]  # steady state
-
-                    fl_1_df = collated_fl[exp0]
-                    fl_1 = fl_1_df.loc[fl_1_df.index[-1], sim]  # steady state
-
-                    self_org = BaseSteadyStateFLInteractive.kernel(fl_i=fl_x,
-                                                                   n_robots_i=n_robots_x,
-                                                                   fl_1=fl_1,
-                                                                   normalize=cmdopts['pm_self_org_normalize'],
-                                                                   normalize_method=cmdopts['pm_normalize_method'])
-                    so_dfs[expx].loc[0, sim] = self_org
+                sims = flx_df.columns
+                self_org = BaseSteadyStateFLInteractive.array_kernel(fl_i=pmcommon.steady_state(flx_df, sims),
+                                                                     n_robots_i=n_robots_x,
+                                                                     fl_1=pmcommon.steady_state(fl_1_df, sims),
+                                                                     normalize=cmdopts['pm_self_org_normalize'],
+                                                                     normalize_method=cmdopts['pm_normalize_method'])
+                so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -826,24 +1034,21 @@ class SteadyStateFLInteractiveBivar(BaseSteadyStateFLInteractive):
         self.perf_col = perf_col
         self.interference_leaf = interference_csv.split('.')[0]
         self.interference_col = interference_col
-
-    def from_batch(self, criteria: bc.IConcreteBatchCriteria) -> None:
-        perf_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                    criteria,
-                                                    self.perf_leaf,
-                                                    self.perf_col)
-        interference_dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                                            criteria,
-                                                            self.interference_leaf,
-                                                            self.interference_col)
-
-        plostN = pmcommon.SteadyStatePerfLostInteractiveSwarmBivar.df_kernel(criteria,
-                                                                             self.cmdopts,
-                                                                             interference_dfs,
-                                                                             perf_dfs)
-        fl = pmcommon.SteadyStateFLBivar.df_kernel(
-            criteria, self.cmdopts, perf_dfs, plostN)
-
+        self.intermediates = SteadyStateFLIntermediates(cmdopts,
+                                                        perf_csv,
+                                                        perf_col,
+                                                        interference_csv,
+                                                        interference_col)
+
+    def from_batch(self,
+                   criteria: bc.IConcreteBatchCriteria,
+                   intermediates: tp.Optional[SteadyStateFLIntermediates] = None) -> None:
+        """
+        Calculate the measure for each experiment in the batch, using the
+        fractional losses computed by the passed
+        :class:`SteadyStateFLIntermediates`, if any. The fractional losses are
+        only computed if the measure is out of date.
+        """
         # We need to know which of the 2 variables was swarm size, in order to
         # determine the correct dimension along which to compute the metric,
         # which depends on performance between adjacent swarm sizes.
@@ -853,11 +1058,22 @@ class SteadyStateFLInteractiveBivar(BaseSteadyStateFLInteractive):
                                                    pvd.PopulationVariableDensity],
                                                   self.cmdopts)
 
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, fl)
+        inputs = [(self.perf_leaf, self.perf_col),
+                  (self.interference_leaf, self.interference_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            fl = (intermediates or self.intermediates).from_batch(criteria)
 
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, fl)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
@@ -901,37 +1117,27 @@ class SteadyStatePGMarginalBivar(BaseSteadyStatePGMarginal):
             for j in range(axis == 1, ysize):
                 expx = list(collated_perf.keys())[i * ysize + j]
                 expx_df = collated_perf[expx]
-                so_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                            index=[0])  # Steady state
                 n_robots_x = populations[i][j]
 
-                for sim in expx_df.columns:
-                    perf_x = expx_df.loc[expx_df.index[-1], sim]  # steady state
-
-                    if axis == 0:
-                        exp_xminus1 = list(collated_perf.keys())[
-                            (i - 1) * ysize + j]
-                        exp_xminus1_df = collated_perf[exp_xminus1]
-
-                        # steady state
-                        perf_xminus1 = exp_xminus1_df.loc[exp_xminus1_df.index[-1], sim]
-                        n_robots_xminus1 = populations[i - 1][j]
-                    else:
-                        exp_xminus1 = list(collated_perf.keys())[
-                            i * ysize + (j - 1)]
-                        exp_xminus1_df = collated_perf[exp_xminus1]
-
-                        # steady state
-                        perf_xminus1 = exp_xminus1_df.loc[exp_xminus1_df.index[-1], sim]
-                        n_robots_xminus1 = populations[i][j - 1]
-
-                    self_org = BaseSteadyStatePGMarginal.kernel(perf_i=perf_x,
-                                                                n_robots_i=n_robots_x,
-                                                                perf_iminus1=perf_xminus1,
-                                                                n_robots_iminus1=n_robots_xminus1,
-                                                                normalize=cmdopts['pm_self_org_normalize'],
-                                                                normalize_method=cmdopts['pm_normalize_method'])
-                    so_dfs[expx].loc[0, sim] = self_org
+                if axis == 0:
+                    exp_xminus1 = list(collated_perf.keys())[
+                        (i - 1) * ysize + j]
+                    n_robots_xminus1 = populations[i - 1][j]
+                else:
+                    exp_xminus1 = list(collated_perf.keys())[
+                        i * ysize + (j - 1)]
+                    n_robots_xminus1 = populations[i][j - 1]
+
+                exp_xminus1_df = collated_perf[exp_xminus1]
+
+                sims = expx_df.columns
+                self_org = BaseSteadyStatePGMarginal.array_kernel(perf_i=pmcommon.steady_state(expx_df, sims),
+                                                                  n_robots_i=n_robots_x,
+                                                                  perf_iminus1=pmcommon.steady_state(exp_xminus1_df, sims),
+                                                                  n_robots_iminus1=n_robots_xminus1,
+                                                                  normalize=cmdopts['pm_self_org_normalize'],
+                                                                  normalize_method=cmdopts['pm_normalize_method'])
+                so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -946,10 +1152,6 @@ class SteadyStatePGMarginalBivar(BaseSteadyStatePGMarginal):
         each experiment in a batch.
 
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
         # We need to know which of the 2 variables was swarm size, in order to determine
         # the correct dimension along which to compute the metric, which depends on
         # performance between adjacent swarm sizes.
@@ -959,11 +1161,25 @@ class SteadyStatePGMarginalBivar(BaseSteadyStatePGMarginal):
                                                    pvd.PopulationVariableDensity],
                                                   self.cmdopts)
 
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
-
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         so_opath = os.path.join(
             self.cmdopts["batch_stat_collate_root"], self.kLeaf)
@@ -1006,27 +1222,22 @@ class SteadyStatePGInteractiveBivar(BaseSteadyStatePGInteractive):
             for j in range(axis == 1, ysize):
                 expx = list(collated_perf.keys())[i * ysize + j]
                 expx_df = collated_perf[expx]
-                so_dfs[expx] = pd.DataFrame(columns=collated_perf[expx].columns,
-                                            index=[0])  # Steady state
                 n_robots_x = populations[i][j]
 
-                for sim in expx_df.columns:
-                    perf_x = expx_df.loc[expx_df.index[-1], sim]  # steady state
-
-                    if axis == 0:
-                        exp0 = list(collated_perf.keys())[0 * ysize + j]
-                    else:
-                        exp0 = list(collated_perf.keys())[i * ysize + 0]
+                if axis == 0:
+                    exp0 = list(collated_perf.keys())[0 * ysize + j]
+                else:
+                    exp0 = list(collated_perf.keys())[i * ysize + 0]
 
-                    exp0_df = collated_perf[exp0]
-                    perf_0 = exp0_df.loc[exp0_df.index[-1], sim]
+                exp0_df = collated_perf[exp0]
 
-                    self_org = BaseSteadyStatePGInteractive.kernel(perf_i=perf_x,
-                                                                   n_robots_i=n_robots_x,
-                                                                   perf_0=perf_0,
-                                                                   normalize=cmdopts['pm_self_org_normalize'],
-                                                                   normalize_method=cmdopts['pm_normalize_method'])
-                    so_dfs[expx].loc[0, sim] = self_org
+                sims = expx_df.columns
+                self_org = BaseSteadyStatePGInteractive.array_kernel(perf_i=pmcommon.steady_state(expx_df, sims),
+                                                                     n_robots_i=n_robots_x,
+                                                                     perf_0=pmcommon.steady_state(exp0_df, sims),
+                                                                     normalize=cmdopts['pm_self_org_normalize'],
+                                                                     normalize_method=cmdopts['pm_normalize_method'])
+                so_dfs[expx] = pmcommon.steady_state_df(sims, self_org)
 
         return so_dfs
 
@@ -1040,10 +1251,6 @@ class SteadyStatePGInteractiveBivar(BaseSteadyStatePGInteractive):
         Calculate marginal performance gain metric for the given controller for
         each experiment in a batch.
         """
-        dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
-                                               criteria,
-                                               self.perf_leaf,
-                                               self.perf_col)
         # We need to know which of the 2 variables was swarm size, in order to determine
         # the correct dimension along which to compute the metric, which depends on
         # performance between adjacent swarm sizes.
@@ -1052,11 +1259,25 @@ class SteadyStatePGInteractiveBivar(BaseSteadyStatePGInteractive):
                                                    pcd.PopulationConstantDensity,
                                                    pvd.PopulationVariableDensity],
                                                   self.cmdopts)
-        pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
 
-        # Calculate summary statistics for the performance measure
-        pmcommon.bivar_distribution_prepare(
-            self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+        inputs = [(self.perf_leaf, self.perf_col)]
+        extra_inputs = _exp_def_inputs(self.cmdopts, criteria)
+        if not pmcommon.pm_up_to_date(self.cmdopts,
+                                      criteria,
+                                      self.kLeaf,
+                                      inputs,
+                                      extra_inputs):
+            dfs = pmcommon.gather_collated_sim_dfs(self.cmdopts,
+                                                   criteria,
+                                                   self.perf_leaf,
+                                                   self.perf_col,
+                                                   steady_state=True)
+            pm_dfs = self.df_kernel(criteria, self.cmdopts, axis, dfs)
+
+            # Calculate summary statistics for the performance measure
+            pmcommon.bivar_distribution_prepare(
+                self.cmdopts, criteria, self.kLeaf, pm_dfs, True, axis)
+            pmcommon.pm_stamp(self.cmdopts, criteria, self.kLeaf, inputs, extra_inputs)
 
         ipath = os.path.join(self.cmdopts["batch_stat_collate_root"],
                              self.kLeaf + sierra.core.config.kStatsExtensions['mean'])
@@ -1093,16 +1314,24 @@ class SelfOrgBivarGenerator:
                  criteria: bc.IConcreteBatchCriteria) -> None:
         self.logger.info("From %s", cmdopts["batch_stat_collate_root"])
 
+        # Fractional losses are needed by multiple measures; only compute them
+        # once, and only if one of those measures is out of date.
+        intermediates = SteadyStateFLIntermediates(cmdopts,
+                                                   perf_csv,
+                                                   perf_col,
+                                                   interference_csv,
+                                                   interference_col)
+
         SteadyStateFLMarginalBivar(cmdopts,
                                    perf_csv,
                                    perf_col,
                                    interference_csv,
-                                   interference_col).from_batch(criteria)
+                                   interference_col).from_batch(criteria, intermediates)
         SteadyStateFLInteractiveBivar(cmdopts,
                                       perf_csv,
                                       perf_col,
                                       interference_csv,
-                                      interference_col).from_batch(criteria)
+                                      interference_col).from_batch(criteria, intermediates)
         SteadyStatePGMarginalBivar(
             cmdopts, perf_csv, perf_col).from_batch(criteria)
         SteadyStatePGInteractiveBivar(
@@ -1114,6 +1343,8 @@ class SelfOrgBivarGenerator:
 ################################################################################
 
 __api__ = [
+    'SteadyStateFLIntermediates',
+
     'BaseSteadyStateFLInteractive',
     'BaseSteadyStateFLMarginal',
     'BaseSteadyStatePGInteractive',
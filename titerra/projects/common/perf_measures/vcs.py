@@ -22,6 +22,7 @@ curves.
 import os
 import typing as tp
 import logging
+import functools
 
 # 3rd party packages
 import fastdtw
@@ -45,7 +46,9 @@ def method_xlabel(method: str) -> str:
         "area_between": "Area Difference For Experiment and Ideal Conditions Variance Curves",
         "frechet": "Experiment Frechet Distance To Ideal Conditions",
         "curve_length": "Curve Length Difference To Ideal Conditions",
-        "dtw": r'DTW($I_{{ec}}(t)$,$V_{{ec}}(t)$)'
+        "dtw": r'DTW($I_{{ec}}(t)$,$V_{{ec}}(t)$)',
+        "dtw_banded": r'DTW($I_{{ec}}(t)$,$V_{{ec}}(t)$)',
+        "frechet_fast": "Experiment Frechet Distance To Ideal Conditions"
     }
     return labels[method]
 
@@ -68,7 +71,9 @@ def method_ylabel(method: str, arg: tp.Any) -> str:
         "area_between": "Area Between Variance and Performance Curves",
         "frechet": "Frechet Distance Between Variance and Performance Curves",
         "curve_length": "Curve Length Difference Between Variance and Performance Curves",
-        "dtw": r'DTW(' + ideal_curve_names[arg] + ',' + r'$P(N,\kappa,t)$)'
+        "dtw": r'DTW(' + ideal_curve_names[arg] + ',' + r'$P(N,\kappa,t)$)',
+        "dtw_banded": r'DTW(' + ideal_curve_names[arg] + ',' + r'$P(N,\kappa,t)$)',
+        "frechet_fast": "Frechet Distance Between Variance and Performance Curves"
     }
     return labels[method]
 
@@ -118,7 +123,8 @@ class EnvironmentalCS():
         ideal_data[:, 1] = ideal_var_df[attr["variance_csv_col"]].values
         return CSRaw()(exp_data=exp_data,
                        ideal_data=ideal_data,
-                       method=self.cmdopts["envc_cs_method"])
+                       method=self.cmdopts["envc_cs_method"],
+                       band_width=self.cmdopts['vcs_band_width'])
 
 
 class RawPerfCS():
@@ -154,7 +160,8 @@ class RawPerfCS():
                        ideal_data=ideal_data,
                        method=self.cmdopts["rperf_cs_method"],
                        normalize=self.cmdopts['pm_flexibility_normalize'],
-                       normalize_method=self.cmdopts['pm_normalize_method'])
+                       normalize_method=self.cmdopts['pm_normalize_method'],
+                       band_width=self.cmdopts['vcs_band_width'])
 
 
 class AdaptabilityCS():
@@ -206,7 +213,8 @@ class AdaptabilityCS():
                        ideal_data=ideal_data,
                        method=self.cmdopts["adaptability_cs_method"],
                        normalize=self.cmdopts['pm_flexibility_normalize'],
-                       normalize_method=self.cmdopts['pm_normalize_method'])
+                       normalize_method=self.cmdopts['pm_normalize_method'],
+                       band_width=self.cmdopts['vcs_band_width'])
 
     def waveforms_for_example_plots(self,
                                     ideal_num: int,
@@ -327,7 +335,8 @@ class ReactivityCS():
                        ideal_data=ideal_data,
                        method=self.cmdopts["reactivity_cs_method"],
                        normalize=self.cmdopts['pm_flexibility_normalize'],
-                       normalize_method=self.cmdopts['pm_normalize_method'])
+                       normalize_method=self.cmdopts['pm_normalize_method'],
+                       band_width=self.cmdopts['vcs_band_width'])
 
     def waveforms_for_example_plots(self,
                                     exp_dirs: tp.Optional[tp.List[str]] = None) -> tp.Tuple[np.ndarray, np.ndarray]:
@@ -395,15 +404,15 @@ class ReactivityCS():
         # observed to increase by an amount proportional to that difference, as the system reacts
         # the drop in penalties. Vice versa for an increase penalty in the experiment for a timestep
         # t vs. the amount imposed during the ideal conditions experiment.
-        for i in ideal_perf_df.index:
-            ideal_var = ideal_var_df.loc[i, self.var_csv_col]
-            expx_var = expx_var_df.loc[i, self.var_csv_col]
-            ideal_perf = ideal_perf_df.iloc[i]
+        ideal_var = ideal_var_df.loc[ideal_perf_df.index,
+                                     self.var_csv_col].to_numpy(dtype=float)
+        expx_var = expx_var_df.loc[ideal_perf_df.index,
+                                   self.var_csv_col].to_numpy(dtype=float)
+        scale_factor = self.criteria.calc_reactivity_scaling_array(ideal_var,
+                                                                   expx_var)
 
-            scale_factor = self.criteria.calc_reactivity_scaling(
-                ideal_var, expx_var)
-
-            ideal_df.loc[i, self.perf_csv_col] = ideal_perf * scale_factor
+        ideal_df.loc[ideal_perf_df.index,
+                     self.perf_csv_col] = ideal_perf_df.to_numpy(dtype=float) * scale_factor
 
         xlen = len(ideal_var_df[self.var_csv_col].values)
         exp_data = np.zeros((xlen, 2))
@@ -428,7 +437,14 @@ class CSRaw():
                  ideal_data: np.ndarray,
                  method: str,
                  normalize: tp.Optional[bool] = False,
-                 normalize_method: tp.Optional[str] = None) -> float:
+                 normalize_method: tp.Optional[str] = None,
+                 band_width: float = 1.0) -> float:
+        """
+        Args:
+            band_width: For ``dtw_banded``, the width of the Sakoe-Chiba band
+                        as a fraction of the curve length. 1.0 gives exact,
+                        unconstrained DTW.
+        """
         assert method is not None, "Cannot compare curves without method"
 
         if method == "pcm":
@@ -439,6 +455,14 @@ class CSRaw():
             return sm.frechet_dist(exp_data, ideal_data)  # type: ignore
         elif method == "dtw":
             return CSRaw._calc_dtw(exp_data, ideal_data, normalize, normalize_method)
+        elif method == "dtw_banded":
+            return CSRaw._calc_dtw_banded(exp_data,
+                                          ideal_data,
+                                          band_width,
+                                          normalize,
+                                          normalize_method)
+        elif method == "frechet_fast":
+            return CSRaw._calc_frechet_fast(exp_data, ideal_data)
         elif method == "curve_length":
             return sm.curve_length_measure(exp_data, ideal_data)  # type: ignore
         else:
@@ -451,7 +475,82 @@ class CSRaw():
                   normalize_method: tp.Optional[str]) -> float:
         # Don't use the sm version--waaayyyy too slow
         dist, _ = fastdtw.fastdtw(exp_data, ideal_data)
+        return CSRaw._normalize_dist(dist, normalize, normalize_method)
+
+    @staticmethod
+    def _calc_dtw_banded(exp_data: np.ndarray,
+                         ideal_data: np.ndarray,
+                         band_width: float,
+                         normalize: tp.Optional[bool],
+                         normalize_method: tp.Optional[str]) -> float:
+        # Exact DTW within a Sakoe-Chiba band, using the same L1 point distance
+        # as fastdtw. The band is always at least as wide as the difference in
+        # curve lengths so that a warping path exists.
+        n = len(exp_data)
+        m = len(ideal_data)
+        radius = max(int(np.ceil(band_width * max(n, m))), abs(n - m))
+        dist = CSRaw._antidiagonal_dp(exp_data, ideal_data, radius, 1, np.add)
+        return CSRaw._normalize_dist(dist, normalize, normalize_method)
+
+    @staticmethod
+    def _calc_frechet_fast(exp_data: np.ndarray, ideal_data: np.ndarray) -> float:
+        # Exact discrete Frechet distance with the euclidean point distance, as
+        # in similaritymeasures.
+        return CSRaw._antidiagonal_dp(exp_data,
+                                      ideal_data,
+                                      max(len(exp_data), len(ideal_data)),
+                                      2,
+                                      np.maximum)
+
+    @staticmethod
+    def _antidiagonal_dp(exp_data: np.ndarray,
+                         ideal_data: np.ndarray,
+                         radius: int,
+                         norm_ord: int,
+                         accum: tp.Callable) -> float:
+        """
+        Compute the DTW-style dynamic program::
 
+            D[i,j] = accum(d(x_i, y_j), min(D[i-1,j-1], D[i-1,j], D[i,j-1]))
+
+        over all cells with ``|i - j| <= radius``, returning ``D[n-1,m-1]``.
+
+        Cells on an anti-diagonal ``i + j = k`` only depend on anti-diagonals
+        ``k-1`` and ``k-2``, so each anti-diagonal is computed with a single set
+        of array operations, and only the last two need to be kept.
+        """
+        n = len(exp_data)
+        m = len(ideal_data)
+
+        # Index i + 1 holds row i; index 0 is always inf as the out-of-bounds
+        # row -1.
+        prev2 = np.full(n + 1, np.inf)
+        prev1 = np.full(n + 1, np.inf)
+        cur = np.full(n + 1, np.inf)
+
+        for k in range(0, n + m - 1):
+            lo = max(0, k - m + 1, (k - radius + 1) // 2)
+            hi = min(n - 1, k, (k + radius) // 2)
+            i = np.arange(lo, hi + 1)
+
+            cost = np.linalg.norm(exp_data[i] - ideal_data[k - i],
+                                  ord=norm_ord,
+                                  axis=1)
+            if k == 0:
+                best = np.zeros(1)
+            else:
+                best = np.minimum(np.minimum(prev2[i], prev1[i]), prev1[i + 1])
+
+            cur.fill(np.inf)
+            cur[i + 1] = accum(cost, best)
+            prev2, prev1, cur = prev1, cur, prev2
+
+        return float(prev1[n])
+
+    @staticmethod
+    def _normalize_dist(dist: float,
+                        normalize: tp.Optional[bool],
+                        normalize_method: tp.Optional[str]) -> float:
         if normalize is None or not normalize:
             # You can't normalize [0,infinity) into [0,1], where HIGHER values now are better (even
             # if it is more intuitive this way), because the maxval can be different for different
@@ -466,6 +565,23 @@ class CSRaw():
 
 
 class DataFrames:
+    """
+    Readers for the averaged variance and performance ``.csv`` files for an
+    experiment.
+
+    The same files are requested for every simulation in every experiment when
+    computing flexibility, so reads are memoized in a bounded LRU cache shared
+    by all callers in the process. Entries are keyed by (path, modification
+    time), so a rewritten file is always re-read. Returned dataframes are
+    shared, and must not be modified by callers.
+    """
+    kCacheSize = 128
+
+    @staticmethod
+    @functools.lru_cache(maxsize=kCacheSize)
+    def _read(path: str, mtime: float) -> pd.DataFrame:
+        return storage.DataFrameReader('storage.csv')(path)
+
     @staticmethod
     def expx_var_df(cmdopts: types.Cmdopts,
                     criteria,
@@ -481,7 +597,7 @@ class DataFrames:
                             dirs[exp_num],
                             tv_environment_csv)
         try:
-            return storage.DataFrameReader('storage.csv')(path)
+            return DataFrames._read(path, os.path.getmtime(path))
         except (FileNotFoundError, IndexError):
             logging.fatal("%s does not exist for exp num %s",
                           path,
@@ -502,7 +618,7 @@ class DataFrames:
                             dirs[exp_num],
                             intra_perf_csv)
         try:
-            return storage.DataFrameReader('storage.csv')(path)
+            return DataFrames._read(path, os.path.getmtime(path))
         except (FileNotFoundError, IndexError):
             logging.fatal("%s does not exist for exp num %s",
                           path,
@@ -17,8 +17,11 @@
 # Core packages
 import os
 import typing as tp
+import hashlib
+import pickle
 
 # 3rd party packages
+import numpy as np
 import pandas as pd
 
 # Project packages
@@ -27,6 +30,23 @@ import sierra.core.storage as storage
 
 
 class ExperimentalRunCSVGatherer(run_collator.ExperimentalRunCSVGatherer):
+    """
+    Gathers the intra-experiment interference column from each run in addition
+    to the CSVs SIERRA gathers.
+
+    Only the needed column is parsed from the interference CSV, and the parsed
+    column is cached alongside it (keyed by the size and modification time of
+    the CSV, falling back to its content hash if they change), so that
+    re-running stage 3 does not re-parse runs whose output has not changed.
+
+    The cache lives in each run's metrics directory because that is the only
+    location the gatherer is given, and so that it is removed along with the
+    run's output. Files there are gathered by name, so it is never mistaken
+    for simulation output; putting it anywhere else under the experiment's
+    output directory would make it look like another run.
+    """
+    kCacheLeaf = '.interference-gather-cache.pkl'
+
     def gather_csvs_from_run(self, run: str) -> tp.Dict[tp.Tuple[str, str], pd.DataFrame]:
         ret = super().gather_csvs_from_run(run)
 
@@ -37,14 +57,87 @@ class ExperimentalRunCSVGatherer(run_collator.ExperimentalRunCSVGatherer):
         run_output_root = os.path.join(self.exp_output_root,
                                        run,
                                        self.run_metrics_leaf)
+        path = os.path.join(run_output_root, intra_interference_leaf + '.csv')
 
-        reader = storage.DataFrameReader(self.storage_medium)
-        run_output_root = os.path.join(self.exp_output_root,
-                                       run,
-                                       self.run_metrics_leaf)
-        interference_df = reader(os.path.join(run_output_root,
-                                              intra_interference_leaf + '.csv'),
-                                 index_col=False)
         key = (intra_interference_leaf, intra_interference_col)
-        ret.update({key: interference_df[intra_interference_col]})
+        ret.update({key: self._gather_interference(path,
+                                                   run_output_root,
+                                                   intra_interference_col)})
         return ret
+
+    def _gather_interference(self,
+                             path: str,
+                             run_output_root: str,
+                             col: str) -> pd.Series:
+        cache_path = os.path.join(run_output_root, self.kCacheLeaf)
+        st = os.stat(path)
+        stamp = (st.st_size, st.st_mtime_ns)
+
+        cached = self._cache_read(cache_path, col)
+        digest = None
+
+        if cached is not None:
+            # Unchanged since the last collation; skip hashing too
+            if cached['stamp'] == stamp:
+                return pd.Series(cached['data'], name=col)
+
+            # Only hash if the stamp changed, so cold runs read each CSV once
+            digest = self._hash(path)
+            if cached['digest'] == digest:
+                cached['stamp'] = stamp
+                self._cache_write(cache_path, cached)
+                return pd.Series(cached['data'], name=col)
+
+        reader = storage.DataFrameReader(self.storage_medium)
+        data = reader(path, index_col=False, usecols=[col])[col]
+
+        # Every cache entry gets a real digest, so the first touch of an
+        # unchanged CSV is a hit. The CSV was just read, so hashing it again is
+        # cheap.
+        if digest is None:
+            digest = self._hash(path)
+
+        # The parsed column is stored as a plain array, rather than as a
+        # pickled pd.Series, so the cache does not depend on pandas internals.
+        self._cache_write(cache_path, {'col': col,
+                                       'stamp': stamp,
+                                       'digest': digest,
+                                       'data': data.to_numpy()})
+        return data
+
+    @staticmethod
+    def _cache_read(cache_path: str, col: str) -> tp.Optional[tp.Dict[str, tp.Any]]:
+        # Anything wrong with the cache (missing, truncated, written by a
+        # different version of something, etc.) is just a miss.
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+
+            if cached['col'] != col:
+                return None
+
+            return {'col': cached['col'],
+                    'stamp': tuple(cached['stamp']),
+                    'digest': cached['digest'],
+                    'data': np.asarray(cached['data'])}
+        except Exception:
+            return None
+
+    @staticmethod
+    def _hash(path: str) -> str:
+        h = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    @staticmethod
+    def _cache_write(cache_path: str, cached: tp.Dict[str, tp.Any]) -> None:
+        # Not being able to cache (e.g., read-only output) is not an error
+        try:
+            tmp = cache_path + '.tmp'
+            with open(tmp, 'wb') as f:
+                pickle.dump(cached, f)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
@@ -34,6 +34,7 @@ import titerra.projects.common.perf_measures.raw as pmraw
 import titerra.projects.common.perf_measures.robustness as pmb
 import titerra.projects.common.perf_measures.flexibility as pmf
 import titerra.projects.common.perf_measures.scalability as pms
+import titerra.projects.common.perf_measures.common as pmcommon
 
 
 class InterExpGraphGenerator(stage4.inter_exp_graph_generator.InterExpGraphGenerator):
@@ -90,30 +91,33 @@ class UnivarPerfMeasuresGenerator:
         raw_title = self.main_config['sierra']['perf']['raw_perf_title']
         raw_ylabel = self.main_config['sierra']['perf']['raw_perf_ylabel']
 
-        if criteria.pm_query('raw'):
-            pmraw.SteadyStateRawUnivar(self.cmdopts, perf_csv, perf_col).from_batch(criteria,
-                                                                                    title=raw_title,
-                                                                                    ylabel=raw_ylabel)
-        if criteria.pm_query('scalability'):
-            pms.ScalabilityUnivarGenerator()(perf_csv, perf_col, self.cmdopts, criteria)
-
-        if criteria.pm_query('self-org'):
-            pmso.SelfOrgUnivarGenerator()(self.cmdopts,
-                                          perf_csv,
-                                          perf_col,
-                                          interference_csv,
-                                          interference_col,
-                                          criteria)
-
-        if criteria.pm_query('flexibility'):
-            pmf.FlexibilityUnivarGenerator()(self.cmdopts,
-                                             self.main_config,
-                                             criteria)
-
-        if criteria.pm_query('robustness-pd') or criteria.pm_query('robustness-saa'):
-            pmb.RobustnessUnivarGenerator()(self.cmdopts,
-                                            self.main_config,
-                                            criteria)
+        # All measures read from the same set of collated .csv files, so share
+        # them across measures instead of re-reading them for each one.
+        with pmcommon.collated_csv_cache(self.cmdopts):
+            if criteria.pm_query('raw'):
+                pmraw.SteadyStateRawUnivar(self.cmdopts, perf_csv, perf_col).from_batch(criteria,
+                                                                                        title=raw_title,
+                                                                                        ylabel=raw_ylabel)
+            if criteria.pm_query('scalability'):
+                pms.ScalabilityUnivarGenerator()(perf_csv, perf_col, self.cmdopts, criteria)
+
+            if criteria.pm_query('self-org'):
+                pmso.SelfOrgUnivarGenerator()(self.cmdopts,
+                                              perf_csv,
+                                              perf_col,
+                                              interference_csv,
+                                              interference_col,
+                                              criteria)
+
+            if criteria.pm_query('flexibility'):
+                pmf.FlexibilityUnivarGenerator()(self.cmdopts,
+                                                 self.main_config,
+                                                 criteria)
+
+            if criteria.pm_query('robustness-pd') or criteria.pm_query('robustness-saa'):
+                pmb.RobustnessUnivarGenerator()(self.cmdopts,
+                                                self.main_config,
+                                                criteria)
 
 
 class BivarPerfMeasuresGenerator:
@@ -142,32 +146,35 @@ class BivarPerfMeasuresGenerator:
         interference_col = self.main_config['sierra']['perf']['intra_interference_col']
         raw_title = self.main_config['sierra']['perf']['raw_perf_title']
 
-        if criteria.pm_query('raw'):
-            pmraw.SteadyStateRawBivar(self.cmdopts,
-                                      perf_csv=perf_csv,
-                                      perf_col=perf_col).from_batch(criteria,
-                                                                    title=raw_title)
-
-        if criteria.pm_query('scalability'):
-            pms.ScalabilityBivarGenerator()(perf_csv, perf_col, self.cmdopts, criteria)
-
-        if criteria.pm_query('self-org'):
-            pmso.SelfOrgBivarGenerator()(self.cmdopts,
-                                         perf_csv,
-                                         perf_col,
-                                         interference_csv,
-                                         interference_col,
-                                         criteria)
-
-        if criteria.pm_query('flexibility'):
-            pmf.FlexibilityBivarGenerator()(self.cmdopts,
-                                            self.main_config,
-                                            criteria)
-
-        if criteria.pm_query('robustness-pd') or criteria.pm_query('robustness-saa'):
-            pmb.RobustnessBivarGenerator()(self.cmdopts,
-                                           self.main_config,
-                                           criteria)
+        # All measures read from the same set of collated .csv files, so share
+        # them across measures instead of re-reading them for each one.
+        with pmcommon.collated_csv_cache(self.cmdopts):
+            if criteria.pm_query('raw'):
+                pmraw.SteadyStateRawBivar(self.cmdopts,
+                                          perf_csv=perf_csv,
+                                          perf_col=perf_col).from_batch(criteria,
+                                                                        title=raw_title)
+
+            if criteria.pm_query('scalability'):
+                pms.ScalabilityBivarGenerator()(perf_csv, perf_col, self.cmdopts, criteria)
+
+            if criteria.pm_query('self-org'):
+                pmso.SelfOrgBivarGenerator()(self.cmdopts,
+                                             perf_csv,
+                                             perf_col,
+                                             interference_csv,
+                                             interference_col,
+                                             criteria)
+
+            if criteria.pm_query('flexibility'):
+                pmf.FlexibilityBivarGenerator()(self.cmdopts,
+                                                self.main_config,
+                                                criteria)
+
+            if criteria.pm_query('robustness-pd') or criteria.pm_query('robustness-saa'):
+                pmb.RobustnessBivarGenerator()(self.cmdopts,
+                                               self.main_config,
+                                               criteria)
 
 
 __api__ = ['InterExpGraphGenerator',
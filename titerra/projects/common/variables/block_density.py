@@ -35,6 +35,7 @@ import sierra.core.config
 import sierra.core.variables.batch_criteria as bc
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
 
 
 @implements.implements(bc.IConcreteBatchCriteria)
@@ -109,8 +110,8 @@ class BlockConstantDensity(cd.ConstantDensity):
             pkl_path = os.path.join(self.batch_input_root,
                                     d,
                                     sierra.core.config.kPickleLeaf)
-            exp_def = XMLAttrChangeSet.unpickle(pkl_path)
-            areas.append(sierra.core.utils.extract_arena_dims(exp_def).area())
+            areas.append(exp_defs.derive(pkl_path,
+                                         sierra.core.utils.extract_arena_dims).area())
 
         return areas
 
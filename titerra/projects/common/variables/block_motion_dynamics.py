@@ -20,17 +20,15 @@ Classes for the block motion batch criteria. See
 
 # Core packages
 import typing as tp
-import os
 
 # 3rd party packages
 import implements
 from sierra.core.variables import batch_criteria as bc
-import sierra.core.utils
 from sierra.core.xml import XMLAttrChangeSet, XMLAttrChange
 from sierra.core import types
-import sierra.core.config
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
 import titerra.projects.common.variables.dynamics_parser as dp
 
 
@@ -79,10 +77,8 @@ class BlockMotionDynamics(bc.UnivarBatchCriteria):
         ticks = []
 
         for d in exp_dirs:
-            exp_def = XMLAttrChangeSet.unpickle(os.path.join(self.batch_input_root,
-                                                             d,
-                                                             sierra.core.config.kPickleLeaf))
-            ticks.append(BlockMotionDynamics.calc_xtick(exp_def))
+            ticks.append(exp_defs.derive(exp_defs.for_exp(self.batch_input_root, d),
+                                         BlockMotionDynamics.calc_xtick))
 
         return ticks
 
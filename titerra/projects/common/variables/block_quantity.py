@@ -34,6 +34,7 @@ from sierra.core import types
 import sierra.core.config
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
 
 
 @implements.implements(bc.IConcreteBatchCriteria)
@@ -89,7 +90,7 @@ class BlockQuantity(bc.UnivarBatchCriteria):
             pkl_path = os.path.join(self.batch_input_root,
                                     d,
                                     sierra.core.config.kPickleLeaf)
-            exp_def = XMLAttrChangeSet.unpickle(pkl_path)
+            exp_def = exp_defs.unpickle(pkl_path)
             for path, attr, value in exp_def:
                 if path == ".//arena_map/blocks/distribution/manifest" and attr == "n_" + self.block_type:
                     quantities.append(float(value))
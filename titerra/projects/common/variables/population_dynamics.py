@@ -20,18 +20,16 @@
 
 # Core packages
 import typing as tp
-import os
 
 # 3rd party packages
 import implements
 from sierra.core.variables import batch_criteria as bc
-import sierra.core.utils
 from sierra.core.xml import XMLAttrChange, XMLAttrChangeSet, XMLLuigi
-import sierra.core.config
 import sierra.plugins.platform.argos.variables.exp_setup as ts
 from sierra.core import types
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
 import titerra.projects.common.variables.dynamics_parser as dp
 
 
@@ -107,26 +105,22 @@ class PopulationDynamics(bc.UnivarBatchCriteria):
 
         ticks = []
 
-        exp0_def = XMLAttrChangeSet.unpickle(os.path.join(self.batch_input_root,
-                                                          exp_dirs[0],
-                                                          sierra.core.config.kPickleLeaf))
-        T_Sbar0 = PopulationDynamics.calc_untasked_swarm_system_time(exp0_def)
+        T_Sbar0 = exp_defs.derive(exp_defs.for_exp(self.batch_input_root, exp_dirs[0]),
+                                  PopulationDynamics.calc_untasked_swarm_system_time)
 
         for d in exp_dirs:
-            exp_def = XMLAttrChangeSet.unpickle(os.path.join(self.batch_input_root,
-                                                             d,
-                                                             sierra.core.config.kPickleLeaf))
+            pkl_path = exp_defs.for_exp(self.batch_input_root, d)
 
             # If we had pure death dynamics, the tasked swarm time is 0 in the
             # steady state, so we use lambda_d as the ticks instead, which is
             # somewhat more meaningful.
             if self.is_pure_death_dynamics():
-                lambda_d, _, _, _ = PopulationDynamics.extract_rate_params(
-                    exp_def)
+                lambda_d, _, _, _ = exp_defs.derive(pkl_path,
+                                                    PopulationDynamics.extract_rate_params)
                 ticks.append(lambda_d)
             else:
-                T_Sbar = PopulationDynamics.calc_untasked_swarm_system_time(
-                    exp_def)
+                T_Sbar = exp_defs.derive(pkl_path,
+                                         PopulationDynamics.calc_untasked_swarm_system_time)
 
                 ticks.append(round(T_Sbar0 / T_Sbar, 4))
 
@@ -19,12 +19,15 @@ documentation.
 """
 
 # Core packages
+import os
 import math
+import json
 import typing as tp
 import logging
 
 # 3rd party packages
 import implements
+import numpy as np
 import sierra.core.variables.batch_criteria as bc
 from sierra.plugins.platform.argos.variables.population_size import PopulationSize
 from sierra.core.xml import XMLAttrChange, XMLAttrChangeSet
@@ -35,6 +38,19 @@ from titerra.projects.common.perf_measures import vcs
 from titerra.projects.common.variables.temporal_variance_parser import TemporalVarianceParser
 
 
+# Name of the per-batch file in the batch statistics root that the
+# environmental curve similarity x-ticks are persisted to.
+kXticksCacheLeaf = 'tv-xticks.json'
+
+# Maximum # of (batch, key) x-ticks entries memoized in-process; the oldest
+# entry is evicted first.
+kXticksMemoSize = 64
+
+# (batch stat root, key) -> (variance .csv mtimes, x-ticks). Recomputed
+# entries replace stale ones for the same batch and key.
+_xticks_memo = {}  # type: tp.Dict[tp.Tuple[str, str], tp.Tuple[tp.List[float], tp.List[float]]]
+
+
 @implements.implements(bc.IConcreteBatchCriteria)
 class TemporalVariance(bc.UnivarBatchCriteria):
     """
@@ -131,6 +147,24 @@ class TemporalVariance(bc.UnivarBatchCriteria):
         else:
             return 0.0
 
+    def calc_reactivity_scaling_array(self,
+                                      ideal_var: np.ndarray,
+                                      expx_var: np.ndarray) -> np.ndarray:
+        """
+        Array form of :meth:`calc_reactivity_scaling`, computing the scaling
+        factor for each timestep of a variance curve at once.
+        """
+        ideal_var = np.asarray(ideal_var, dtype=float)
+        expx_var = np.asarray(expx_var, dtype=float)
+
+        if self.variance_type in ['BC', 'M']:
+            diff = np.abs(expx_var - ideal_var)
+            return np.where(expx_var > ideal_var, 1.0 - diff, 1.0 + diff)
+        elif self.variance_type == 'BM':
+            return ideal_var / expx_var
+        else:
+            return np.zeros(ideal_var.shape)
+
     def graph_xticks(self,
                      cmdopts: types.Cmdopts,
                      exp_dirs: tp.Optional[tp.List[str]] = None) -> tp.List[float]:
@@ -142,10 +176,68 @@ class TemporalVariance(bc.UnivarBatchCriteria):
         if exp_dirs is None:
             exp_dirs = self.gen_exp_dirnames(cmdopts)
 
-        m = len(exp_dirs)
+        # Each tick is a full curve similarity comparison, and the ticks are
+        # requested many times per batch, so they are memoized in-process and
+        # persisted to a per-batch file. Both are invalidated if any of the
+        # variance .csv files they were computed from change.
+        csv = self.main_config['sierra']['perf']['intra_tv_environment_csv']
+        try:
+            mtimes = [os.path.getmtime(os.path.join(cmdopts['batch_stat_root'], d, csv))
+                      for d in exp_dirs]
+        except FileNotFoundError:
+            return self._calc_xticks(cmdopts, exp_dirs)
+
+        key = '{0}:{1}:{2}'.format(cmdopts['envc_cs_method'],
+                                   cmdopts['vcs_band_width'],
+                                   ','.join(exp_dirs))
+        memo_key = (cmdopts['batch_stat_root'], key)
+
+        memoed = _xticks_memo.get(memo_key)
+        if memoed is None or memoed[0] != mtimes:
+            xticks = self._xticks_from_sidecar(cmdopts, exp_dirs, key, mtimes)
+
+            _xticks_memo.pop(memo_key, None)
+            if len(_xticks_memo) >= kXticksMemoSize:
+                del _xticks_memo[next(iter(_xticks_memo))]
+            memoed = (mtimes, xticks)
+            _xticks_memo[memo_key] = memoed
+
+        return list(memoed[1])
+
+    def _xticks_from_sidecar(self,
+                             cmdopts: types.Cmdopts,
+                             exp_dirs: tp.List[str],
+                             key: str,
+                             mtimes: tp.List[float]) -> tp.List[float]:
+        path = os.path.join(cmdopts['batch_stat_root'], kXticksCacheLeaf)
+        entries = {}
+        try:
+            with open(path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        entry = entries.get(key)
+        if entry is not None and entry['mtimes'] == mtimes:
+            return entry['xticks']
 
+        xticks = self._calc_xticks(cmdopts, exp_dirs)
+        entries[key] = {'mtimes': mtimes, 'xticks': xticks}
+
+        # Write to a per-process temporary file first, so a crash or a
+        # concurrent stage 4 never leaves a truncated sidecar behind.
+        tmp = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp, path)
+
+        return xticks
+
+    def _calc_xticks(self,
+                     cmdopts: types.Cmdopts,
+                     exp_dirs: tp.List[str]) -> tp.List[float]:
         return [round(vcs.EnvironmentalCS(self.main_config, cmdopts, x)(self, exp_dirs), 4)
-                for x in range(0, m)]
+                for x in range(0, len(exp_dirs))]
 
     def graph_xticklabels(self,
                           cmdopts: types.Cmdopts,
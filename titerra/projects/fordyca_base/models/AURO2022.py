@@ -23,22 +23,22 @@ Models of the steady state collective foraging behavior of a swarm of
 # Core packages
 import os
 import typing as tp
-import copy
 from functools import reduce
 
 # 3rd party packages
 import implements
 import pandas as pd
-from sierra.core import types, config, utils
+from sierra.core import types, config
 import sierra.core.models.interface
 import sierra.core.variables.batch_criteria as bc
 from sierra.core.experiment.spec import ExperimentSpec
-from sierra.core.xml import XMLAttrChangeSet
-import sierra.plugins.platform.argos.variables.exp_setup as ts
 
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
 import titerra.projects.fordyca_base.models.representation as rep
+import titerra.projects.fordyca_base.models.model_cache as model_cache
+import titerra.projects.fordyca_base.models.exp_runner as exp_runner
 from titerra.projects.fordyca_base.models.interference import IntraExp_RobotInterferenceRate_NRobots, IntraExp_WallInterferenceRate_1Robot
 from titerra.projects.fordyca_base.models.homing_time import IntraExp_HomingTime_NRobots, IntraExp_HomingTime_1Robot
 import titerra.projects.fordyca_base.models.ode_solver as ode
@@ -94,6 +94,27 @@ class IntraExp_ODE_1Robot():
             exp_num: int,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
+        model_params, z0 = self.ode_setup(criteria, exp_num, cmdopts)
+        soln = ode.CRWSolver(model_params).solve(z0)
+
+        res = {
+            'searching': [soln[:, 0]][0],
+            'homing': [soln[:, 1]][0]
+        }
+
+        res['avoiding'] = z0['N_s0'] - res['searching'] - res['homing']
+        res_df = pd.DataFrame(res)
+
+        return [res_df['searching'], res_df['homing'], res_df['avoiding']]
+
+    def ode_setup(self,
+                  criteria: bc.IConcreteBatchCriteria,
+                  exp_num: int,
+                  cmdopts: types.Cmdopts) -> tp.Tuple[tp.Dict[str, float],
+                                                      tp.Dict[str, float]]:
+        """
+        Compute the ODE parameters and initial conditions for the experiment.
+        """
         model_params = self._ode_params_calc(criteria, exp_num, cmdopts)
 
         nest = rep.Nest(cmdopts, criteria, exp_num)
@@ -107,17 +128,7 @@ class IntraExp_ODE_1Robot():
             'N_avs0': 0,
             'B0': n_blocks
         }
-        soln = ode.CRWSolver(model_params).solve(z0)
-
-        res = {
-            'searching': [soln[:, 0]][0],
-            'homing': [soln[:, 1]][0]
-        }
-
-        res['avoiding'] = z0['N_s0'] - res['searching'] - res['homing']
-        res_df = pd.DataFrame(res)
-
-        return [res_df['searching'], res_df['homing'], res_df['avoiding']]
+        return model_params, z0
 
     def _ode_params_calc(self,
                          criteria: bc.IConcreteBatchCriteria,
@@ -128,8 +139,7 @@ class IntraExp_ODE_1Robot():
 
         # T,n_datapoints are directly from simulation inputs
         spec = ExperimentSpec(criteria, exp_num, cmdopts)
-        exp_def = XMLAttrChangeSet.unpickle(spec.exp_def_fpath)
-        time_params = ts.ARGoSExpSetup.extract_time_params(exp_def)
+        time_params = exp_defs.time_params(spec.exp_def_fpath)
         T = time_params['T_in_secs'] * time_params['ticks_per_sec']
 
         n_datapoints = len(fsm_counts_df.index)
@@ -139,18 +149,21 @@ class IntraExp_ODE_1Robot():
 
         # tau_h, alpha_b are computed directly from simulation inputs/configuration, so we can run()
         # them here.
-        tau_h1 = IntraExp_HomingTime_1Robot(self.main_config, self.config).run(criteria,
-                                                                               exp_num,
-                                                                               cmdopts)[0]
+        tau_h1 = model_cache.run_intra(IntraExp_HomingTime_1Robot(self.main_config, self.config),
+                                       criteria,
+                                       exp_num,
+                                       cmdopts)[0]
 
-        alpha_b1 = IntraExp_BlockAcqRate_NRobots(self.main_config, self.config).run(criteria,
-                                                                                    exp_num,
-                                                                                    cmdopts)[0]
+        alpha_b1 = model_cache.run_intra(IntraExp_BlockAcqRate_NRobots(self.main_config, self.config),
+                                         criteria,
+                                         exp_num,
+                                         cmdopts)[0]
 
         # FIXME: This currently reads alpha_ca1 from experimental data
-        alpha_ca1 = IntraExp_WallInterferenceRate_1Robot(self.main_config, self.config).run(criteria,
-                                                                                            exp_num,
-                                                                                            cmdopts)[0]
+        alpha_ca1 = model_cache.run_intra(IntraExp_WallInterferenceRate_1Robot(self.main_config, self.config),
+                                          criteria,
+                                          exp_num,
+                                          cmdopts)[0]
 
         params = {
             'N': 1,
@@ -208,9 +221,40 @@ class IntraExp_ODE_NRobots():
         model1_robot = IntraExp_ODE_1Robot(self.main_config, self.config)
 
         if n_robots == 1:
-            return model1_robot.run(criteria, 0, cmdopts)
+            return model_cache.run_intra(model1_robot,
+                                         criteria,
+                                         0,
+                                         self._exp0_cmdopts(criteria, cmdopts))
+
+        model_params, z0 = self.ode_setup(criteria, exp_num, cmdopts)
+        soln = ode.CRWSolver(model_params).solve(z0)
 
-        model_params = model1_robot._ode_params_calc(criteria, 0, cmdopts)
+        res = {
+            'searching': [soln[:, 0]][0],
+            'homing': [soln[:, 1]][0]
+        }
+
+        res['avoiding'] = z0['N_s0'] - res['searching'] - res['homing']
+        res_df = pd.DataFrame(res)
+
+        return [res_df['searching'], res_df['homing'], res_df['avoiding']]
+
+    def ode_setup(self,
+                  criteria: bc.IConcreteBatchCriteria,
+                  exp_num: int,
+                  cmdopts: types.Cmdopts) -> tp.Tuple[tp.Dict[str, float],
+                                                      tp.Dict[str, float]]:
+        """
+        Compute the ODE parameters and initial conditions for the experiment.
+        """
+        model1_robot = IntraExp_ODE_1Robot(self.main_config, self.config)
+
+        cmdopts0 = self._exp0_cmdopts(criteria, cmdopts)
+
+        if criteria.populations(cmdopts)[exp_num] == 1:
+            return model1_robot.ode_setup(criteria, 0, cmdopts0)
+
+        model_params = model1_robot._ode_params_calc(criteria, 0, cmdopts0)
         model_params.update(self._ode_params_calc(criteria, exp_num, cmdopts))
 
         nest = rep.Nest(cmdopts, criteria, exp_num)
@@ -224,17 +268,16 @@ class IntraExp_ODE_NRobots():
             'N_avs0': 0,
             'B0': n_blocks
         }
-        soln = ode.CRWSolver(model_params).solve(z0)
-
-        res = {
-            'searching': [soln[:, 0]][0],
-            'homing': [soln[:, 1]][0]
-        }
-
-        res['avoiding'] = z0['N_s0'] - res['searching'] - res['homing']
-        res_df = pd.DataFrame(res)
+        return model_params, z0
 
-        return [res_df['searching'], res_df['homing'], res_df['avoiding']]
+    @staticmethod
+    def _exp0_cmdopts(criteria: bc.IConcreteBatchCriteria,
+                      cmdopts: types.Cmdopts) -> types.Cmdopts:
+        """
+        Get the cmdopts for running the 1 robot sub-models on exp0, so that they read the exp0
+        results, and are only run once for the batch rather than once for each experiment.
+        """
+        return exp_runner.exp_cmdopts(cmdopts, criteria.gen_exp_dirnames(cmdopts), 0)
 
     def _ode_params_calc(self,
                          criteria: bc.IConcreteBatchCriteria,
@@ -247,8 +290,7 @@ class IntraExp_ODE_NRobots():
         N = criteria.populations(cmdopts)[exp_num]
 
         spec = ExperimentSpec(criteria, exp_num, cmdopts)
-        exp_def = XMLAttrChangeSet.unpickle(spec.exp_def_fpath)
-        time_params = ts.ARGoSExpSetup.extract_time_params(exp_def)
+        time_params = exp_defs.time_params(spec.exp_def_fpath)
         T = time_params['T_in_secs'] * time_params['ticks_per_sec']
         n_datapoints = len(fsm_counts_df.index)
 
@@ -257,9 +299,10 @@ class IntraExp_ODE_NRobots():
 
         # tau_h, alpha_b are computed directly from simulation
         # inputs/configuration, so we can run() them here.
-        tau_hN = IntraExp_HomingTime_NRobots(self.main_config, self.config).run(criteria,
-                                                                                exp_num,
-                                                                                cmdopts)[0]
+        tau_hN = model_cache.run_intra(IntraExp_HomingTime_NRobots(self.main_config, self.config),
+                                       criteria,
+                                       exp_num,
+                                       cmdopts)[0]
 
         # FIXME: N_av1 COULD be computed a priori, but I don't have time to do it right now, so I
         # just read it from simulation results.
@@ -273,7 +316,10 @@ class IntraExp_ODE_NRobots():
 
         # crwD calculated directly from simulation inputs/configuration
         acq = IntraExp_BlockAcqRate_NRobots(self.main_config, self.config)
-        alpha_bN = acq.run(criteria, exp_num, cmdopts)[0]
+        alpha_bN = model_cache.run_intra(acq,
+                                         criteria,
+                                         exp_num,
+                                         cmdopts)[0]
         crwD = diffusion.crwD_for_avoiding(N=N,
                                            wander_speed=float(
                                                self.config['wander_mean_speed']),
@@ -351,37 +397,23 @@ class InterExp_ODE_NRobots():
 
         # attempting to get one model datapoint from batch to be representative
         # of ODE solution
+        setups = exp_runner.map_exps(IntraExp_ODE_NRobots.ode_setup,
+                                     (IntraExp_ODE_NRobots(self.main_config, self.config),),
+                                     criteria,
+                                     cmdopts)
+
+        # Solve the whole batch at once, only computing the steady state
+        # solution for avoiding and searching counts.
+        params, z0 = zip(*setups)
+        if cmdopts['models_ode_steady_state'] == 'root':
+            soln = ode.CRWSolver.solve_steady_state(params, z0)
+        else:
+            soln = ode.CRWSolver.solve_batch(params, z0, steady_state_only=True)
+
         for i, exp in enumerate(dirs):
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-
-            cmdopts2["exp0_output_root"] = os.path.join(
-                cmdopts["batch_output_root"], dirs[0])
-            cmdopts2["exp0_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], dirs[0])
-
-            utils.dir_create_checked(cmdopts2['exp_model_root'],
-                                       exist_ok=True)
-
-            intra_dfs = IntraExp_ODE_NRobots(self.main_config,
-                                             self.config).run(criteria,
-                                                              i,
-                                                              cmdopts2)
-
-            # gets steady state solution for avoiding and searching counts
-            res_df_searching[exp] = intra_dfs[0].iloc[-1]
-            res_df_homing[exp] = intra_dfs[1].iloc[-1]
-            res_df_avoiding[exp] = intra_dfs[2].iloc[-1]
+            res_df_searching[exp] = soln[i, 0]
+            res_df_homing[exp] = soln[i, 1]
+            res_df_avoiding[exp] = z0[i]['N_s0'] - soln[i, 0] - soln[i, 1]
 
         return [res_df_searching, res_df_homing, res_df_avoiding]
 
@@ -438,8 +470,14 @@ class InterExp_ODEWrapper_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        perf_df = self.raw_perf.run(criteria, cmdopts)[0]
-        sc_df = self.scalability.run(criteria, cmdopts)[0]
-        so_df = self.self_org.run(criteria, cmdopts)[0]
+        perf_df = model_cache.run_inter(self.raw_perf,
+                                        criteria,
+                                        cmdopts)[0]
+        sc_df = model_cache.run_inter(self.scalability,
+                                      criteria,
+                                      cmdopts)[0]
+        so_df = model_cache.run_inter(self.self_org,
+                                      criteria,
+                                      cmdopts)[0]
 
         return [perf_df, sc_df, so_df]
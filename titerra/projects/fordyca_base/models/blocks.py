@@ -19,7 +19,6 @@ Free block acquisition and block collection models for the FORDYCA project.
 
 # Core packages
 import os
-import copy
 import typing as tp
 import math
 
@@ -28,18 +27,20 @@ import implements
 import pandas as pd
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
 import sierra.core.models.interface
 from sierra.core.experiment.spec import ExperimentSpec
 import titerra.projects.fordyca_base.models.representation as rep
 import sierra.core.variables.batch_criteria as bc
 from sierra.core.vector import Vector3D
-from sierra.core.xml import XMLAttrChangeSet
-from sierra.core import types, storage, utils
-import sierra.plugins.platform.argos.variables.exp_setup as ts
+from sierra.core import types, storage
 
 from titerra.projects.fordyca_base.models.density import BlockAcqDensity
 from titerra.projects.fordyca_base.models.dist_measure import DistanceMeasure2D
 import titerra.projects.fordyca_base.models.diffusion as diffusion
+import titerra.projects.fordyca_base.models.model_cache as model_cache
+import titerra.projects.fordyca_base.models.exp_runner as exp_runner
+from titerra.projects.common import parallel
 
 
 def available_models(category: str):
@@ -135,17 +136,23 @@ class IntraExp_BlockAcqRate_NRobots():
 
         nest = rep.Nest(cmdopts, criteria, exp_num)
 
+        # The expected acquisition distance for each simulation is independent
+        # of all others, but summed in order so the result does not depend on
+        # the # of processes.
+        dists = parallel.map_kernel(cmdopts['models_processes'],
+                                    expected_acq_dist_kernel,
+                                    (cmdopts, nest),
+                                    [(result,) for result in result_opaths])
         dist = 0.0
-        for result in result_opaths:
-            dist += ExpectedAcqDist()(cmdopts, result, nest)
+        for d in dists:
+            dist += d
 
         # Average our results
         avg_acq_dist = dist / len(result_opaths)
         n_robots = criteria.populations(cmdopts)[exp_num]
 
         spec = ExperimentSpec(criteria, exp_num, cmdopts)
-        exp_def = XMLAttrChangeSet.unpickle(spec.exp_def_fpath)
-        time_params = ts.ARGoSExpSetup.extract_time_params(exp_def)
+        time_params = exp_defs.time_params(spec.exp_def_fpath)
 
         alpha_b = self._kernel(N=n_robots,
                                wander_speed=float(
@@ -215,9 +222,10 @@ class IntraExp_BlockCollectionRate_NRobots():
                                                                     'block-manipulation.csv'))
 
         # Calculate acquisition rate
-        alpha_bN = IntraExp_BlockAcqRate_NRobots(main_config, config).run(criteria,
-                                                                          exp_num,
-                                                                          cmdopts)[0]
+        alpha_bN = model_cache.run_intra(IntraExp_BlockAcqRate_NRobots(main_config, config),
+                                         criteria,
+                                         exp_num,
+                                         cmdopts)[0]
 
         # FIXME: In the future, this will be another model, rather than being read from experimental
         # data.
@@ -301,38 +309,10 @@ class InterExp_BlockAcqRate_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        dirs = criteria.gen_exp_dirnames(cmdopts)
-        res_df = pd.DataFrame(columns=dirs, index=[0])
-
-        for i, exp in enumerate(dirs):
-
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-
-            cmdopts2["exp0_output_root"] = os.path.join(
-                cmdopts["batch_output_root"], dirs[0])
-            cmdopts2["exp0_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], dirs[0])
-
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-            utils.dir_create_checked(
-                cmdopts2['exp_model_root'], exist_ok=True)
-
-            # Model only targets a single graph
-            intra_df = IntraExp_BlockAcqRate_NRobots(self.main_config,
-                                                     self.config).run(criteria,
-                                                                      i,
-                                                                      cmdopts2)[0]
-            res_df[exp] = intra_df.loc[intra_df.index[-1], 'model']
+        # Model only targets a single graph
+        res_df = exp_runner.steady_state_for_batch(IntraExp_BlockAcqRate_NRobots(self.main_config, self.config),
+                                                   criteria,
+                                                   cmdopts)
 
         # All done!
         return [res_df]
@@ -369,38 +349,10 @@ class InterExp_BlockCollectionRate_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        dirs = criteria.gen_exp_dirnames(cmdopts)
-        res_df = pd.DataFrame(columns=dirs, index=[0])
-
-        for i, exp in enumerate(dirs):
-
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-
-            cmdopts2["exp0_output_root"] = os.path.join(
-                cmdopts["batch_output_root"], dirs[0])
-            cmdopts2["exp0_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], dirs[0])
-
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-            utils.dir_create_checked(
-                cmdopts2['exp_model_root'], exist_ok=True)
-
-            # Model only targets a single graph
-            intra_df = IntraExp_BlockCollectionRate_NRobots(self.main_config,
-                                                            self.config).run(criteria,
-                                                                             i,
-                                                                             cmdopts2)[0]
-            res_df[exp] = intra_df.loc[intra_df.index[-1], 'model']
+        # Model only targets a single graph
+        res_df = exp_runner.steady_state_for_batch(IntraExp_BlockCollectionRate_NRobots(self.main_config, self.config),
+                                                   criteria,
+                                                   cmdopts)
 
         # All done!
         return [res_df]
@@ -410,6 +362,16 @@ class InterExp_BlockCollectionRate_NRobots():
 ################################################################################
 
 
+def expected_acq_dist_kernel(cmdopts: types.Cmdopts,
+                             nest: rep.Nest,
+                             result_opath: str) -> float:
+    """
+    Compute :class:`ExpectedAcqDist` for a single simulation/averaged result. Module level so
+    that it can be run in a process pool.
+    """
+    return ExpectedAcqDist()(cmdopts, result_opath, nest)
+
+
 class ExpectedAcqDist():
     def __call__(self, cmdopts: types.Cmdopts, result_opath: str, nest: rep.Nest) -> float:
 
@@ -17,9 +17,10 @@
 # Core packages
 import math
 import typing as tp
+import functools
 
 # 3rd party packages
-import scipy.integrate as si
+import numpy as np
 
 # Project packages
 import sierra.core.utils
@@ -29,6 +30,83 @@ import titerra.projects.fordyca_base.models.representation as rep
 from titerra.projects.fordyca_base.models.dist_measure import DistanceMeasure2D
 
 
+# Order of the Gauss-Legendre rule used on each panel, and the number of equal
+# width panels each integration interval is split into. Densities are smooth
+# within the regions they are integrated over, except across the circle given
+# by :meth:`BaseDensity.kink()`, which the rules are split along (see
+# :func:`kinked_gauss_legendre()`).
+kGL_ORDER = 16
+kGL_PANELS = 8
+
+# Number of panels for each piece of an interval split at kinks, and the power
+# of the substitution grading each piece towards its ends. The pieces are
+# smooth in the substituted variable, so need fewer panels.
+kGL_KINK_PANELS = 2
+kGL_KINK_GRADING = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _gauss_legendre_ref(panels: int) -> tp.Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the nodes and weights of the composite Gauss-Legendre rule over [0,1].
+    """
+    x, w = np.polynomial.legendre.leggauss(kGL_ORDER)
+    edges = np.linspace(0.0, 1.0, panels + 1)
+    half = (edges[1:] - edges[:-1]) / 2.0
+    mid = (edges[1:] + edges[:-1]) / 2.0
+
+    nodes = (mid[:, np.newaxis] + half[:, np.newaxis] * x).ravel()
+    weights = (half[:, np.newaxis] * w).ravel()
+    return nodes, weights
+
+
+def gauss_legendre(a: tp.Union[float, np.ndarray],
+                   b: tp.Union[float, np.ndarray]) -> tp.Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the nodes and weights of a composite Gauss-Legendre quadrature rule over
+    the interval [a,b].
+    """
+    u, w = _gauss_legendre_ref(kGL_PANELS)
+    return a + (b - a) * u, (b - a) * w
+
+
+def kinked_gauss_legendre(a: tp.Union[float, np.ndarray],
+                          b: tp.Union[float, np.ndarray],
+                          kinks: np.ndarray) -> tp.Tuple[np.ndarray, np.ndarray]:
+    r"""
+    Get the nodes and weights of a quadrature rule over the interval [a,b] for integrands which are
+    smooth except at the ``kinks``, where they behave like (powers of) the square root of the
+    distance to the kink.
+
+    The interval is split at the kinks (clipped to [a,b]), and each piece is split in half, with the
+    nodes of each half clustered towards the end of the piece via the substitution :math:`t = a +
+    (b - a)u^4` (or its mirror). The integrand is smooth in :math:`u`, so the rule converges as
+    quickly as it does for smooth integrands.
+
+    ``a``, ``b`` can be arrays of intervals, in which case the last axis of ``kinks`` indexes the
+    kinks for each interval, and the last axis of the nodes/weights indexes the nodes for each
+    interval.
+    """
+    kinks = np.asarray(kinks, dtype=float)
+    a = np.broadcast_to(a, kinks.shape[:-1])[..., np.newaxis]
+    b = np.broadcast_to(b, kinks.shape[:-1])[..., np.newaxis]
+
+    edges = np.concatenate([a, np.clip(np.sort(kinks, axis=-1), a, b), b], axis=-1)
+    lo = edges[..., :-1, np.newaxis]
+    hi = edges[..., 1:, np.newaxis]
+    half = (hi - lo) / 2.0
+
+    u, w = _gauss_legendre_ref(kGL_KINK_PANELS)
+    g = u ** kGL_KINK_GRADING
+    dg = kGL_KINK_GRADING * u ** (kGL_KINK_GRADING - 1) * w
+
+    nodes = np.concatenate([lo + half * g, hi - half * g], axis=-1)
+    weights = np.concatenate([half * dg, half * dg], axis=-1)
+
+    shape = kinks.shape[:-1] + (-1,)
+    return nodes.reshape(shape), weights.reshape(shape)
+
+
 class BaseDensity():
     def at_point(self, x: tp.Optional[float] = None, y: tp.Optional[float] = None) -> float:
         """
@@ -38,54 +116,149 @@ class BaseDensity():
         """
         raise NotImplementedError
 
+    def at_points(self,
+                  xs: tp.Optional[np.ndarray] = None,
+                  ys: tp.Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the value of the density at each of a set of x,y points, with the same semantics as
+        :meth:`at_point()`. Derived classes should override this with a vectorized version; this one
+        just calls :meth:`at_point()` for each point.
+        """
+        if xs is None:
+            return np.array([self.at_point(None, y) for y in ys], dtype=float)
+        elif ys is None:
+            return np.array([self.at_point(x, None) for x in xs], dtype=float)
+
+        return np.array([self.at_point(x, y) for x, y in zip(xs, ys)], dtype=float)
+
+    def kink(self) -> tp.Optional[tp.Tuple[Vector3D, float]]:
+        """
+        Get the center and radius of the circle in the plane across which the density is not
+        smooth, if there is one, so that integration can be split along it.
+        """
+        return None
+
+    def marginal_center(self) -> Vector3D:
+        """
+        Get the point whose X (Y) coordinate the marginal PDF of Y (X) is evaluated at (see
+        :meth:`at_point()`). Only needed for densities with a :meth:`kink()`.
+        """
+        raise NotImplementedError
+
     def for_region(self, ll: Vector3D, ur: Vector3D):
         r"""
         Calculate the cumulative probability density within a region defined by the lower left and
-        upper right corners of the 2D region using :method:`at_point`.
+        upper right corners of the 2D region using :method:`at_points`, via tensor-grid
+        Gauss-Legendre quadrature.
 
+        If the density has a :meth:`kink()` within the region, the X rule is split where the circle
+        begins/ends in X or crosses the region's edges, and the Y rule for each X node is split
+        where that line crosses the circle.
         """
-        res, _ = si.nquad(self.at_point, [[ll.x, ur.x], [
-                          ll.y, ur.y]], opts={'limit': 100})
-        return res
+        kink = self.kink()
+        if kink is None or not _intersects(kink, ll, ur):
+            xs, wx = gauss_legendre(ll.x, ur.x)
+            ys, wy = gauss_legendre(ll.y, ur.y)
+            gx, gy = np.meshgrid(xs, ys, indexing='ij')
+
+            vals = self.at_points(gx.ravel(), gy.ravel()).reshape(gx.shape)
+            return float(wx @ vals @ wy)
+
+        # The integral over Y along each X is not smooth where the line is tangent to the circle,
+        # or crosses it on the region's edge.
+        center, radius = kink
+        xkinks = [center.x - radius, center.x + radius]
+        for edge in [ll.y, ur.y]:
+            if abs(edge - center.y) < radius:
+                chord = math.sqrt(radius ** 2 - (edge - center.y) ** 2)
+                xkinks.extend([center.x - chord, center.x + chord])
+
+        xs, wx = kinked_gauss_legendre(ll.x, ur.x, np.array(xkinks))
+
+        # Half the length of the chord of the circle along the line through each X node
+        chords = np.sqrt(np.maximum(radius ** 2 - (xs - center.x) ** 2, 0.0))
+        ys, wy = kinked_gauss_legendre(ll.y,
+                                       ur.y,
+                                       np.stack([center.y - chords, center.y + chords], axis=-1))
+        gx = np.broadcast_to(xs[:, np.newaxis], ys.shape)
+
+        vals = self.at_points(gx.ravel(), ys.ravel()).reshape(ys.shape)
+        return float(wx @ (vals * wy).sum(axis=1))
 
     def evx_for_region(self, ll: Vector3D, ur: Vector3D):
         """
         Calculate the expected value of the X coordinate of the average density location within the
         region defined by the lower left and upper right corners of the 2D region.
         """
-        res, _ = si.nquad(lambda x: self._marginal_pdfx(ll=ll, ur=ur) * x,
-                          [[ll.x, ur.x]],
-                          opts={'limit': 100})
-
-        return res
+        # The marginal PDF does not depend on X, so what is left is the integral of X over the
+        # region, which we have in closed form.
+        return self._marginal_pdfx(ll=ll, ur=ur) * (ur.x ** 2 - ll.x ** 2) / 2.0
 
     def evy_for_region(self, ll: Vector3D, ur: Vector3D):
         """
         Calculate the expected value of the Y coordinate of the average density location within the
         region defined by the lower left and upper right corners of the 2D region.
         """
-        res, _ = si.nquad(lambda y: self._marginal_pdfy(ll=ll, ur=ur) * y,
-                          [[ll.y, ur.y]],
-                          opts={'limit': 100})
-        return res
+        # The marginal PDF does not depend on Y, so what is left is the integral of Y over the
+        # region, which we have in closed form.
+        return self._marginal_pdfy(ll=ll, ur=ur) * (ur.y ** 2 - ll.y ** 2) / 2.0
 
     def _marginal_pdfx(self, ll: Vector3D, ur: Vector3D):
         """
         Calculate the marginal PDF of density function for X.
         """
-        res, _ = si.nquad(lambda y: self.at_point(None, y),
-                          [[ll.y, ur.y]],
-                          opts={'limit': 100})
-        return res
+        ys, w = self._marginal_rule(ll.y, ur.y, 'y')
+        return float(w @ self.at_points(None, ys))
 
     def _marginal_pdfy(self, ll: Vector3D, ur: Vector3D):
         """
         Calculate the marginal PDF of the density function for Y.
         """
-        pdf, _ = si.nquad(lambda x: self.at_point(x, None),
-                          [[ll.x, ur.x]],
-                          opts={'limit': 100})
-        return pdf
+        xs, w = self._marginal_rule(ll.x, ur.x, 'x')
+        return float(w @ self.at_points(xs, None))
+
+    def _marginal_rule(self, a: float, b: float, axis: str) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the quadrature rule for integrating along the line the marginal PDF for the other axis
+        is evaluated on, split where it crosses the :meth:`kink()` circle (if any).
+        """
+        kink = self.kink()
+        if kink is None:
+            return gauss_legendre(a, b)
+
+        center, radius = kink
+        line = self.marginal_center()
+        if axis == 'y':
+            offset = line.x - center.x
+            along = center.y
+        else:
+            offset = line.y - center.y
+            along = center.x
+
+        if abs(offset) >= radius:
+            return gauss_legendre(a, b)
+
+        chord = math.sqrt(radius ** 2 - offset ** 2)
+        return kinked_gauss_legendre(a, b, np.array([along - chord, along + chord]))
+
+
+def _intersects(circle: tp.Tuple[Vector3D, float], ll: Vector3D, ur: Vector3D) -> bool:
+    """
+    Determine if a circle in the plane intersects an axis-aligned 2D rectangle.
+    """
+    center, radius = circle
+    dx = center.x - min(max(center.x, ll.x), ur.x)
+    dy = center.y - min(max(center.y, ll.y), ur.y)
+    return dx * dx + dy * dy < radius * radius
+
+
+def _overlap_area(ll1: Vector3D, ur1: Vector3D, ll2: Vector3D, ur2: Vector3D) -> float:
+    """
+    Calculate the area of the intersection of two axis-aligned 2D rectangles.
+    """
+    dx = min(ur1.x, ur2.x) - max(ll1.x, ll2.x)
+    dy = min(ur1.y, ur2.y) - max(ll1.y, ll2.y)
+    return max(dx, 0.0) * max(dy, 0.0)
 
 
 class ClusterBlockDensity(BaseDensity):
@@ -137,6 +310,40 @@ class ClusterBlockDensity(BaseDensity):
 
         return self.rho_b * self.norm_factor
 
+    def at_points(self,
+                  xs: tp.Optional[np.ndarray] = None,
+                  ys: tp.Optional[np.ndarray] = None) -> np.ndarray:
+        assert xs is not None and ys is not None
+
+        cll = self.cluster.extent.ll
+        cur = self.cluster.extent.ur
+        nll = self.nest.extent.ll
+        nur = self.nest.extent.ur
+
+        in_cluster = (xs >= cll.x) & (xs <= cur.x) & (ys >= cll.y) & (ys <= cur.y)
+        in_nest = (xs >= nll.x) & (xs <= nur.x) & (ys >= nll.y) & (ys <= nur.y)
+
+        return np.where(in_cluster & ~in_nest, self.rho_b * self.norm_factor, 0.0)
+
+    def for_region(self, ll: Vector3D, ur: Vector3D):
+        r"""
+        Calculate the cumulative probability density within a region. The density is uniform
+        within the cluster's extent (excluding the nest), so this is the density times the area
+        of the region which overlaps the cluster but not the nest.
+        """
+        cluster_ll = self.cluster.extent.ll
+        cluster_ur = self.cluster.extent.ur
+
+        # Intersection of the region and the cluster, which may overlap the nest
+        ill = Vector3D(max(ll.x, cluster_ll.x), max(ll.y, cluster_ll.y))
+        iur = Vector3D(min(ur.x, cluster_ur.x), min(ur.y, cluster_ur.y))
+
+        area = _overlap_area(ll, ur, cluster_ll, cluster_ur)
+        if area > 0.0:
+            area -= _overlap_area(ill, iur, self.nest.extent.ll, self.nest.extent.ur)
+
+        return self.rho_b * self.norm_factor * area
+
 
 class BlockAcqDensity(BaseDensity):
     """
@@ -169,6 +376,21 @@ class BlockAcqDensity(BaseDensity):
         # simulation.
         self.norm_factor = 1.0 / total if total > 0 else 0.0
 
+    def kink(self) -> tp.Optional[tp.Tuple[Vector3D, float]]:
+        """
+        The distance to the nest is clamped to 0 within the nest factor of the nest center, which
+        the density has a square root of, so it is not smooth across the circle where the clamping
+        starts.
+        """
+        center = self.nest.extent.center
+        if self.dist_measure.nest_factor is None or self.dist_measure.nest_factor <= abs(center.z):
+            return None
+
+        return center, math.sqrt(self.dist_measure.nest_factor ** 2 - center.z ** 2)
+
+    def marginal_center(self) -> Vector3D:
+        return self.cluster.extent.center
+
     def at_point(self, x: tp.Optional[float] = None, y: tp.Optional[float] = None):
         r"""
         Calculate the block acquisition probability density at an (X,Y) point within the arena.
@@ -181,9 +403,9 @@ class BlockAcqDensity(BaseDensity):
         """
 
         if x is None and y is not None:  # Calculating marginal PDF of X
-            pt = Vector3D(self.cluster.extent.center.x, y)
+            pt = Vector3D(self.marginal_center().x, y)
         elif x is not None and y is None:  # Calculating marginal PDF of Y
-            pt = Vector3D(x, self.cluster.extent.center.y)
+            pt = Vector3D(x, self.marginal_center().y)
         else:  # Normal case
             assert x is not None and y is not None
             pt = Vector3D(x, y)
@@ -196,3 +418,21 @@ class BlockAcqDensity(BaseDensity):
         if z < 0:
             z = 0
         return 1.0 / ((math.sqrt(z) + self.rho) ** 2) * self.norm_factor
+
+    def at_points(self,
+                  xs: tp.Optional[np.ndarray] = None,
+                  ys: tp.Optional[np.ndarray] = None) -> np.ndarray:
+        if xs is None and ys is not None:  # Calculating marginal PDF of X
+            xs = np.full(np.shape(ys), self.marginal_center().x)
+        elif xs is not None and ys is None:  # Calculating marginal PDF of Y
+            ys = np.full(np.shape(xs), self.marginal_center().y)
+        else:  # Normal case
+            assert xs is not None and ys is not None
+
+        # No acquisitions possible if the cluster never had any blocks in it during simulation.
+        if self.rho is None:
+            return np.zeros(np.shape(xs))
+
+        z = self.dist_measure.to_nest_many(xs, ys)
+        z = np.maximum(z, 0.0)
+        return 1.0 / ((np.sqrt(z) + self.rho) ** 2) * self.norm_factor
@@ -0,0 +1,127 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Shared runner for inter-experiment models which evaluate an independent
+intra-experiment computation for each experiment in the batch, optionally in a
+pool of processes (``--models-processes``).
+"""
+
+# Core packages
+import os
+import typing as tp
+
+# 3rd party packages
+import pandas as pd
+import sierra.core.variables.batch_criteria as bc
+from sierra.core import types, utils
+
+# Project packages
+from titerra.projects.common import parallel
+import titerra.projects.fordyca_base.models.model_cache as model_cache
+
+
+def exp_cmdopts(cmdopts: types.Cmdopts,
+                dirs: tp.List[str],
+                exp_num: int) -> types.Cmdopts:
+    """
+    Get the cmdopts for running an intra-experiment model on the specified
+    experiment in the batch: a shallow copy of the batch cmdopts with the
+    experiment (and exp0) roots filled in. Nothing in cmdopts is modified by
+    the models, so there is no need for a deep copy.
+    """
+    exp = dirs[exp_num]
+    cmdopts2 = dict(cmdopts)
+    cmdopts2.update({
+        "exp0_output_root": os.path.join(cmdopts["batch_output_root"], dirs[0]),
+        "exp0_stat_root": os.path.join(cmdopts["batch_stat_root"], dirs[0]),
+        "exp_input_root": os.path.join(cmdopts['batch_input_root'], exp),
+        "exp_output_root": os.path.join(cmdopts['batch_output_root'], exp),
+        "exp_graph_root": os.path.join(cmdopts['batch_graph_root'], exp),
+        "exp_stat_root": os.path.join(cmdopts["batch_stat_root"], exp),
+        "exp_model_root": os.path.join(cmdopts['batch_model_root'], exp)
+    })
+    return cmdopts2
+
+
+def _exp_kernel(kernel: tp.Callable,
+                shared: tuple,
+                criteria: bc.IConcreteBatchCriteria,
+                cmdopts: types.Cmdopts,
+                dirs: tp.List[str],
+                exp_num: int) -> tp.Any:
+    cmdopts2 = exp_cmdopts(cmdopts, dirs, exp_num)
+    utils.dir_create_checked(cmdopts2['exp_model_root'], exist_ok=True)
+    return kernel(*shared, criteria, exp_num, cmdopts2)
+
+
+def map_exps(kernel: tp.Callable,
+             shared: tuple,
+             criteria: bc.IConcreteBatchCriteria,
+             cmdopts: types.Cmdopts) -> tp.List[tp.Any]:
+    """
+    Compute ``kernel(*shared, criteria, exp_num, exp_cmdopts)`` for each
+    experiment in the batch, where ``exp_cmdopts`` is from
+    :func:`exp_cmdopts()`. Results are returned in experiment order, regardless
+    of the number of processes used.
+
+    ``kernel`` must be picklable (a module-level function or a method of a
+    picklable object) if ``--models-processes`` is > 1. In that case, models
+    run serially within each worker, and each worker has its own
+    :class:`~titerra.projects.fordyca_base.models.model_cache.ModelResultCache`,
+    so sub-models shared between experiments (e.g., the exp0 1 robot models)
+    are run once per worker rather than once per batch, and their results are
+    not available to the calling process afterwards.
+    """
+    dirs = criteria.gen_exp_dirnames(cmdopts)
+    return parallel.map_kernel(cmdopts['models_processes'],
+                               _exp_kernel,
+                               (kernel, shared, criteria, cmdopts, dirs),
+                               [(i,) for i in range(len(dirs))])
+
+
+def run_intra_for_batch(model,
+                        criteria: bc.IConcreteBatchCriteria,
+                        cmdopts: types.Cmdopts) -> tp.List[tp.List[pd.DataFrame]]:
+    """
+    Run an intra-experiment model on every experiment in the batch via
+    :func:`model_cache.run_intra()`, returning the results in experiment order.
+    """
+    return map_exps(model_cache.run_intra, (model,), criteria, cmdopts)
+
+
+def steady_state_for_batch(model,
+                           criteria: bc.IConcreteBatchCriteria,
+                           cmdopts: types.Cmdopts) -> pd.DataFrame:
+    """
+    Run an intra-experiment model which targets a single graph on every
+    experiment in the batch, and collect the last (i.e., closest to steady
+    state) datapoint of each as a single row, with one column per experiment.
+    """
+    dirs = criteria.gen_exp_dirnames(cmdopts)
+    res_df = pd.DataFrame(columns=dirs, index=[0])
+
+    for exp, intra_dfs in zip(dirs, run_intra_for_batch(model, criteria, cmdopts)):
+        res_df[exp] = intra_dfs[0]['model'].iloc[-1]
+
+    return res_df
+
+
+__api__ = [
+    'exp_cmdopts',
+    'map_exps',
+    'run_intra_for_batch',
+    'steady_state_for_batch'
+]
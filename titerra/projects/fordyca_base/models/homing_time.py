@@ -22,26 +22,27 @@ return to the nest after picking up an object.
 # Core packages
 import os
 import typing as tp
-import copy
 import math
 
 # 3rd party packages
 import implements
 import pandas as pd
 import sierra.core.models.interface
-import sierra.plugins.platform.argos.variables.exp_setup as ts
 import sierra.core.variables.batch_criteria as bc
 from sierra.core.vector import Vector3D
 from sierra.core.experiment.spec import ExperimentSpec
-from sierra.core.xml import XMLAttrChangeSet
-from sierra.core import types, utils, storage
+from sierra.core import types, storage
 
 # Project packages
+import titerra.projects.common.exp_defs as exp_defs
 import titerra.projects.fordyca_base.models.representation as rep
+import titerra.projects.fordyca_base.models.model_cache as model_cache
+import titerra.projects.fordyca_base.models.exp_runner as exp_runner
 from titerra.projects.fordyca_base.models.density import BlockAcqDensity
 from titerra.projects.fordyca_base.models.dist_measure import DistanceMeasure2D
 from titerra.projects.fordyca_base.models.interference import IntraExp_RobotInterferenceRate_NRobots, IntraExp_RobotInterferenceTime_NRobots
-from titerra.projects.fordyca_base.models.blocks import ExpectedAcqDist
+from titerra.projects.fordyca_base.models.blocks import expected_acq_dist_kernel
+from titerra.projects.common import parallel
 
 
 def available_models(category: str):
@@ -122,9 +123,20 @@ class IntraExp_HomingTime_1Robot():
         res_df = pd.DataFrame(columns=['model'], index=cluster_df.index)
         res_df['model'] = 0.0
 
-        for result in result_opaths:
-            self._calc_for_result(
-                criteria, exp_num, cmdopts, result, nest, res_df)
+        # The experiment definition is the same for all simulations, so only
+        # read it once.
+        spec = ExperimentSpec(criteria, exp_num, cmdopts)
+        time_params = exp_defs.time_params(spec.exp_def_fpath)
+
+        # The expected acquisition distance for each simulation is independent
+        # of all others, but accumulated in order so the result does not depend
+        # on the # of processes.
+        dists = parallel.map_kernel(cmdopts['models_processes'],
+                                    expected_acq_dist_kernel,
+                                    (cmdopts, nest),
+                                    [(result,) for result in result_opaths])
+        for avg_dist in dists:
+            self._calc_for_result(avg_dist, time_params, res_df)
 
         # Average our results
         res_df['model'] /= len(result_opaths)
@@ -133,23 +145,13 @@ class IntraExp_HomingTime_1Robot():
         return [res_df]
 
     def _calc_for_result(self,
-                         criteria: bc.IConcreteBatchCriteria,
-                         exp_num: int,
-                         cmdopts: types.Cmdopts,
-                         result_opath: str,
-                         nest: rep.Nest,
+                         avg_dist: float,
+                         time_params: tp.Dict[str, int],
                          res_df: pd.DataFrame):
-
-        avg_dist = ExpectedAcqDist()(cmdopts, result_opath, nest)
-
         # After getting the average distance to ANY block in ANY cluster in the arena, we can
         # compute the average time, in SECONDS, that robots spend returning to the nest.
         avg_homing_sec = avg_dist / float(self.config['homing_mean_speed'])
 
-        spec = ExperimentSpec(criteria, exp_num, cmdopts)
-        exp_def = XMLAttrChangeSet.unpickle(spec.exp_def_fpath)
-        time_params = ts.ARGoSExpSetup.extract_time_params(exp_def)
-
         # Convert seconds to timesteps for displaying on graphs
         avg_homing_ts = avg_homing_sec * time_params['ticks_per_sec']
 
@@ -202,15 +204,24 @@ class IntraExp_HomingTime_NRobots():
                          main_config: types.YAMLDict,
                          model_config: types.YAMLDict) -> dict:
         homing1 = IntraExp_HomingTime_1Robot(main_config, model_config)
-        tau_h1 = homing1.run(criteria, exp_num, cmdopts)[0]
+        tau_h1 = model_cache.run_intra(homing1,
+                                       criteria,
+                                       exp_num,
+                                       cmdopts)[0]
 
         av_rateN = IntraExp_RobotInterferenceRate_NRobots(
             main_config, model_config)
-        alpha_caN = av_rateN.run(criteria, exp_num, cmdopts)[0]
+        alpha_caN = model_cache.run_intra(av_rateN,
+                                          criteria,
+                                          exp_num,
+                                          cmdopts)[0]
 
         av_timeN = IntraExp_RobotInterferenceTime_NRobots(
             main_config, model_config)
-        tau_avN = av_timeN.run(criteria, exp_num, cmdopts)[0]
+        tau_avN = model_cache.run_intra(av_timeN,
+                                        criteria,
+                                        exp_num,
+                                        cmdopts)[0]
 
         N = criteria.populations(cmdopts)[exp_num]
 
@@ -291,38 +302,11 @@ class InterExp_HomingTime_NRobots():
     def run(self,
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
-        dirs = criteria.gen_exp_dirnames(cmdopts)
-        res_df = pd.DataFrame(columns=dirs, index=[0])
-
-        for i, exp in enumerate(dirs):
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-
-            cmdopts2["exp0_output_root"] = os.path.join(
-                cmdopts2["batch_output_root"], dirs[0])
-            cmdopts2["exp0_stat_root"] = os.path.join(cmdopts2["batch_stat_root"],
-                                                      dirs[0])
-
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts2["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-            utils.dir_create_checked(
-                cmdopts2['exp_model_root'], exist_ok=True)
-
-            # Model only targets a single graph
-            intra_df = IntraExp_HomingTime_NRobots(self.main_config,
-                                                   self.config).run(criteria,
-                                                                    i,
-                                                                    cmdopts2)[0]
-            # Last datapoint is the closest to the steady state value (presumably) so we select it
-            # to use as our prediction for the experiment within the batch.
-            res_df[exp] = intra_df.loc[intra_df.index[-1], 'model']
+        # Model only targets a single graph. The last datapoint is the closest
+        # to the steady state value (presumably), so it is used as the
+        # prediction for each experiment within the batch.
+        res_df = exp_runner.steady_state_for_batch(IntraExp_HomingTime_NRobots(self.main_config, self.config),
+                                                   criteria,
+                                                   cmdopts)
 
         return [res_df]
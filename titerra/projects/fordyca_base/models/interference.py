@@ -20,7 +20,6 @@ at which a robot experiences interference.
 """
 # Core packages
 import os
-import copy
 import typing as tp
 
 # 3rd party packages
@@ -28,9 +27,10 @@ import implements
 import pandas as pd
 import sierra.core.models.interface
 import sierra.core.variables.batch_criteria as bc
-from sierra.core import types, utils, storage
+from sierra.core import types, storage
 
 # Project packages
+import titerra.projects.fordyca_base.models.exp_runner as exp_runner
 
 
 def available_models(category: str):
@@ -415,38 +415,10 @@ class InterExp_RobotInterferenceRate_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        dirs = criteria.gen_exp_dirnames(cmdopts)
-        res_df = pd.DataFrame(columns=dirs, index=[0])
-
-        for i, exp in enumerate(dirs):
-
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-
-            cmdopts2["exp0_output_root"] = os.path.join(
-                cmdopts["batch_output_root"], dirs[0])
-            cmdopts2["exp0_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], dirs[0])
-
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-            utils.dir_create_checked(
-                cmdopts2['exp_model_root'], exist_ok=True)
-
-            # Model only targets one graph
-            intra_df = IntraExp_RobotInterferenceRate_NRobots(self.main_config,
-                                                              self.config).run(criteria,
-                                                                               i,
-                                                                               cmdopts2)[0]
-            res_df[exp] = intra_df.loc[intra_df.index[-1], 'model']
+        # Model only targets a single graph
+        res_df = exp_runner.steady_state_for_batch(IntraExp_RobotInterferenceRate_NRobots(self.main_config, self.config),
+                                                   criteria,
+                                                   cmdopts)
 
         return [res_df]
 
@@ -484,36 +456,9 @@ class InterExp_RobotInterferenceTime_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        dirs = criteria.gen_exp_dirnames(cmdopts)
-        res_df = pd.DataFrame(columns=dirs, index=[0])
-
-        for i, exp in enumerate(dirs):
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-
-            cmdopts2["exp0_output_root"] = os.path.join(
-                cmdopts["batch_output_root"], dirs[0])
-            cmdopts2["exp0_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], dirs[0])
-
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-            utils.dir_create_checked(
-                cmdopts2['exp_model_root'], exist_ok=True)
-
-            # Model only targets one graph
-            intra_df = IntraExp_RobotInterferenceTime_NRobots(self.main_config,
-                                                              self.config).run(criteria,
-                                                                               i,
-                                                                               cmdopts2)[0]
-            res_df[exp] = intra_df.loc[intra_df.index[-1], 'model']
+        # Model only targets a single graph
+        res_df = exp_runner.steady_state_for_batch(IntraExp_RobotInterferenceTime_NRobots(self.main_config, self.config),
+                                                   criteria,
+                                                   cmdopts)
 
         return [res_df]
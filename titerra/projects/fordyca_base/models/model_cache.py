@@ -0,0 +1,232 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the terms of the GNU
+#  General Public License as published by the Free Software Foundation, either version 3 of the
+#  License, or (at your option) any later version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+#
+"""
+Cache of model results, so that sub-models which many FORDYCA models depend on
+(homing time, block acquisition rate, interference, raw performance, etc.) are
+only evaluated once per experiment during stage 4, no matter how many models
+they feed into.
+
+The cache is scoped to the models of a single batch (see
+:func:`batch_cache()`).
+"""
+
+# Core packages
+import os
+import json
+import typing as tp
+import logging
+import contextlib
+import atexit
+
+# 3rd party packages
+import pandas as pd
+import sierra.core.variables.batch_criteria as bc
+from sierra.core import types
+
+# Project packages
+
+
+class ModelResultCache():
+    """
+    Results of :meth:`run()` for intra- and inter-experiment models, keyed by:
+
+    - The model class, and the model configuration it was created with.
+
+    - The experiment (intra-experiment models only).
+
+    - The scalar cmdopts the model was run with, which include the batch and
+      experiment roots. Intra-experiment models must be run with the cmdopts
+      for the experiment they are run on (see
+      :func:`~titerra.projects.fordyca_base.models.exp_runner.exp_cmdopts()`),
+      otherwise results for the same experiment are cached separately for each
+      experiment whose cmdopts they are run with.
+
+    - The modification times of the files directly in the input and
+      statistics directories the model reads from, so results are recomputed
+      if stage 1/stage 3 outputs change.
+
+    Per-simulation outputs under the experiment output roots (e.g., the
+    ``block-clusters.csv`` read by the PL models) are not part of the key. This
+    is safe because a cache only lives for the models of one batch during a
+    single stage 4 run, while stage 2 outputs do not change.
+
+    Cached results are copied when they are returned, so callers can modify
+    them freely.
+
+    The cache is per-process: when experiments are run in a pool of processes
+    (``--models-processes``), each worker fills its own cache, and sub-models
+    shared between experiments are run once in each worker which needs them.
+    """
+
+    def __init__(self, batch_root: str) -> None:
+        self.batch_root = batch_root
+        self.results = {}  # type: tp.Dict[tp.Tuple, tp.List[pd.DataFrame]]
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+
+    def run_intra(self,
+                  model,
+                  criteria: bc.IConcreteBatchCriteria,
+                  exp_num: int,
+                  cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
+        exp_dir = criteria.gen_exp_dirnames(cmdopts)[exp_num]
+        dirs = [os.path.join(cmdopts['batch_input_root'], exp_dir),
+                cmdopts.get('exp_stat_root'),
+                cmdopts.get('exp0_stat_root')]
+        key = self._key(model, exp_num, cmdopts, dirs)
+
+        return self._lookup(key,
+                            lambda: model.run(criteria, exp_num, cmdopts))
+
+    def run_inter(self,
+                  model,
+                  criteria: bc.IConcreteBatchCriteria,
+                  cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
+        exp_dirs = criteria.gen_exp_dirnames(cmdopts)
+        dirs = [os.path.join(cmdopts['batch_input_root'], d) for d in exp_dirs]
+        dirs.extend([os.path.join(cmdopts['batch_stat_root'], d) for d in exp_dirs])
+        key = self._key(model, None, cmdopts, dirs)
+
+        return self._lookup(key, lambda: model.run(criteria, cmdopts))
+
+    def clear(self) -> None:
+        self.results = {}
+
+    def close(self) -> None:
+        """
+        Log the hit/miss counts for the batch and drop all cached results.
+        """
+        self.logger.info("Model result cache for %s: hits=%s,misses=%s",
+                         self.batch_root,
+                         self.hits,
+                         self.misses)
+        self.clear()
+
+    def _lookup(self,
+                key: tp.Tuple,
+                run: tp.Callable[[], tp.List[pd.DataFrame]]) -> tp.List[pd.DataFrame]:
+        if key in self.results:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.results[key] = [df.copy() for df in run()]
+
+        return [df.copy() for df in self.results[key]]
+
+    @staticmethod
+    def _key(model,
+             exp_num: tp.Optional[int],
+             cmdopts: types.Cmdopts,
+             dirs: tp.List[tp.Optional[str]]) -> tp.Tuple:
+        opts = tuple(sorted((k, v) for k, v in cmdopts.items()
+                            if isinstance(v, (str, int, float, bool, type(None)))))
+        mtimes = []
+        for d in dirs:
+            if d is None or not os.path.isdir(d):
+                continue
+            mtimes.extend(sorted((e.path, e.stat().st_mtime)
+                                 for e in os.scandir(d) if e.is_file()))
+
+        config = json.dumps(getattr(model, 'config', None), sort_keys=True, default=str)
+
+        return (model.__class__.__name__, exp_num, opts, config, tuple(mtimes))
+
+
+_cache = None  # type: tp.Optional[ModelResultCache]
+_implicit = None  # type: tp.Optional[ModelResultCache]
+
+
+@contextlib.contextmanager
+def batch_cache(cmdopts: types.Cmdopts) -> tp.Iterator[ModelResultCache]:
+    """
+    Make a :class:`ModelResultCache` for the batch available to all calls to
+    :func:`run_intra()` and :func:`run_inter()` for the duration of the
+    context. On exit the cache is closed: its hit/miss counts are logged and
+    its results dropped. Entering the context for the batch whose cache is
+    already active (e.g., from a sub-model) shares the enclosing cache.
+    """
+    global _cache
+
+    if _cache is not None and _cache.batch_root == cmdopts['batch_root']:
+        yield _cache
+        return
+
+    prev = _cache
+    _cache = ModelResultCache(cmdopts['batch_root'])
+    try:
+        yield _cache
+    finally:
+        _cache.close()
+        _cache = prev
+
+
+def _active(cmdopts: types.Cmdopts) -> ModelResultCache:
+    """
+    Get the cache for the batch from the enclosing :func:`batch_cache()`
+    context. Outside of one, SIERRA is running the models for the batch one at
+    a time, so the cache for the batch is kept across models until the models
+    for a different batch are run or the process exits, and then closed as if
+    its context had been exited.
+    """
+    global _implicit
+
+    if _cache is not None and _cache.batch_root == cmdopts['batch_root']:
+        return _cache
+
+    if _implicit is None or _implicit.batch_root != cmdopts['batch_root']:
+        _implicit_close()
+        _implicit = ModelResultCache(cmdopts['batch_root'])
+
+    return _implicit
+
+
+@atexit.register
+def _implicit_close() -> None:
+    global _implicit
+
+    if _implicit is not None:
+        _implicit.close()
+        _implicit = None
+
+
+def run_intra(model,
+              criteria: bc.IConcreteBatchCriteria,
+              exp_num: int,
+              cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
+    """
+    Get the results of running an intra-experiment model for the specified
+    experiment, from the :class:`ModelResultCache` for the batch if possible.
+    """
+    return _active(cmdopts).run_intra(model, criteria, exp_num, cmdopts)
+
+
+def run_inter(model,
+              criteria: bc.IConcreteBatchCriteria,
+              cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
+    """
+    Get the results of running an inter-experiment model for the batch, from
+    the :class:`ModelResultCache` for the batch if possible.
+    """
+    return _active(cmdopts).run_inter(model, criteria, cmdopts)
+
+
+__api__ = [
+    'ModelResultCache',
+    'batch_cache',
+    'run_intra',
+    'run_inter'
+]
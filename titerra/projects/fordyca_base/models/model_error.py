@@ -16,16 +16,16 @@
 
 # Core packages
 import os
-import copy
 import typing as tp
 
 # 3rd party packages
 import pandas as pd
-from sierra.core import types, utils, storage
+from sierra.core import types, storage
 import sierra.core.models.interface
 import sierra.core.variables.batch_criteria as bc
 
 # Project packages
+import titerra.projects.fordyca_base.models.exp_runner as exp_runner
 
 
 class Model2DError():
@@ -53,35 +53,27 @@ class Model2DError():
         dirs = criteria.gen_exp_dirnames(cmdopts)
         res_df = pd.DataFrame(columns=dirs, index=[0])
 
-        for i, exp in enumerate(dirs):
+        errors = exp_runner.map_exps(Model2DError._exp_error, (self,), criteria, cmdopts)
 
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-            utils.dir_create_checked(
-                cmdopts2['exp_model_root'], exist_ok=True)
+        for exp, d1_norm in zip(dirs, errors):
+            res_df[exp] = d1_norm
 
-            # Calculate model prediction heatmap
-            model_df = self.model(self.main_config, self.model_config).run(
-                cmdopts2, criteria, i)
+        return [res_df]
 
-            # Get data heatmap
-            data_ipath = os.path.join(
-                cmdopts2['exp_stat_root'], self.stddev_fname)
-            data_df = sierra.core.storage.DataFrameReader('storage.csv')(data_ipath)
+    def _exp_error(self,
+                   criteria: bc.IConcreteBatchCriteria,
+                   exp_num: int,
+                   cmdopts: types.Cmdopts) -> float:
+        # Calculate model prediction heatmap
+        model_df = self.model(self.main_config, self.model_config).run(
+            cmdopts, criteria, exp_num)
 
-            # Compute datapoint
-            d1_norm = (model_df - data_df).abs().to_numpy().sum()
-            # d2_norm = (model_df - data_df).pow(2).sum(1).sum()
-            res_df[exp] = d1_norm
+        # Get data heatmap
+        data_ipath = os.path.join(
+            cmdopts['exp_stat_root'], self.stddev_fname)
+        data_df = sierra.core.storage.DataFrameReader('storage.csv')(data_ipath)
 
-        return [res_df]
+        # Compute datapoint
+        d1_norm = (model_df - data_df).abs().to_numpy().sum()
+        # d2_norm = (model_df - data_df).pow(2).sum(1).sum()
+        return d1_norm
@@ -20,14 +20,19 @@ ODE solvers for swarm behavior in different scenarios.
 # Core packages
 import typing as tp
 import math
+import logging
 
 # 3rd party packages
 import numpy as np
-import scipy.integrate as si
+import scipy.linalg as sl
+import scipy.optimize as so
 
 # Project packages
 from titerra.projects.fordyca_base.models.interference import IntraExp_RobotInterferenceRate_NRobots
 
+# Relative residual tolerance for accepting the steady state root finder solution
+kROOT_TOL = 1e-8
+
 
 class CRWSolver():
     """
@@ -51,18 +56,146 @@ class CRWSolver():
     def __init__(self, params: tp.Dict[str, float]):
         self.params = params
 
-    def solve(self, z0: tp.Dict[str, float]):
+    def solve(self, z0: tp.Dict[str, float]) -> np.ndarray:
+        return CRWSolver.solve_batch([self.params], [z0])[0]
 
-        # initial conditions (can be changed)
-        # z0 = [1, 0, 0, 20]
-        # z0 = initial_conditions
+    @staticmethod
+    def solve_batch(params: tp.List[tp.Dict[str, float]],
+                    z0: tp.List[tp.Dict[str, float]],
+                    steady_state_only: bool = False) -> tp.Union[tp.List[np.ndarray],
+                                                                 np.ndarray]:
+        """
+        Solve the ODE system for a batch of experiments in a single call.
+
+        The rates for each experiment are constant in time (see
+        :meth:`rates`), so the system is affine: :math:`\dot{z} = Az + b`. It
+        is solved exactly by stepping all experiments at once with the
+        propagator :math:`e^{M\Delta t}` of the augmented system
+        :math:`M=[[A, b], [0, 0]]`, one matrix product per datapoint, instead
+        of calling back into Python for every RHS evaluation.
+
+        Args:
+            params: The ODE parameters for each experiment, as described in
+                    the class docstring.
+
+            z0: The initial conditions for each experiment.
+
+            steady_state_only: If ``True``, only the state at the end of the
+                               simulation is returned for each experiment, as a
+                               ``n_exp x 4`` array. Otherwise, a list of
+                               ``n_datapoints x 4`` arrays is returned, one per
+                               experiment.
+        """
+        M = np.array([CRWSolver.system_matrix(p) for p in params])
+        y0 = np.array([[z['N_s0'], z['N_h0'], z['N_avs0'], z['B0'], 1.0] for z in z0])
+
+        if steady_state_only:
+            prop = np.array([sl.expm(m * p['T']) for m, p in zip(M, params)])
+            return np.einsum('eij,ej->ei', prop, y0)[:, :4]
+
+        n_datapoints = np.array([p['n_datapoints'] for p in params])
+        prop = np.array([sl.expm(m * p['T'] / max(p['n_datapoints'] - 1, 1))
+                         for m, p in zip(M, params)])
+
+        z = np.empty((n_datapoints.max(), len(params), 5))
+        z[0] = y0
+        for k in range(1, len(z)):
+            z[k] = np.einsum('eij,ej->ei', prop, z[k - 1])
+
+        return [z[:n, i, :4] for i, n in enumerate(n_datapoints)]
 
-        # time points
-        t = np.linspace(0, self.params['T'], self.params['n_datapoints'])
-        z0_arr = [z0['N_s0'], z0['N_h0'],  z0['N_avs0'], z0['B0']]
-        z = si.odeint(self.kernel, z0_arr, t, args=(self, self.params))
+    @staticmethod
+    def solve_steady_state(params: tp.List[tp.Dict[str, float]],
+                           z0: tp.List[tp.Dict[str, float]]) -> np.ndarray:
+        """
+        Solve directly for the steady state of each experiment in the batch by
+        finding the root of dN_s = dN_h = dN_avs = 0. dB = 0 then also holds
+        at the root. If the root finder does not converge for an experiment,
+        that experiment falls back to :meth:`solve_batch`.
+
+        The number of blocks B does not appear on the RHS, so its value is not
+        determined by the fixed point, and is returned as NaN for experiments
+        which did not fall back to integration.
+
+        Returns:
+            A ``n_exp x 4`` array, the same as :meth:`solve_batch` with
+            ``steady_state_only=True``.
+        """
+        n_exp = len(params)
+        M = np.array([CRWSolver.system_matrix(p) for p in params])
+        A = M[:, :3, :3]
+        b = M[:, :3, 4]
+
+        # The experiments are independent, so the Jacobian of the stacked
+        # system is block diagonal.
+        jac = np.zeros((3 * n_exp, 3 * n_exp))
+        for i in range(n_exp):
+            jac[3 * i:3 * i + 3, 3 * i:3 * i + 3] = A[i]
+
+        def residual(x):
+            return (np.einsum('eij,ej->ei', A, x.reshape(n_exp, 3)) + b).reshape(-1)
+
+        x0 = np.array([[z['N_s0'], z['N_h0'], z['N_avs0']] for z in z0], dtype=float)
+        res = so.root(residual, x0.reshape(-1), jac=lambda x: jac)
+
+        ret = np.full((n_exp, 4), np.nan)
+        ret[:, :3] = res.x.reshape(n_exp, 3)
+
+        # Convergence is judged per-experiment, so one bad experiment does not
+        # force the whole batch to be integrated.
+        err = np.abs(residual(res.x).reshape(n_exp, 3)).max(axis=1)
+        scale = np.abs(b).max(axis=1) + kROOT_TOL
+        failed = [i for i in range(n_exp)
+                  if not np.all(np.isfinite(ret[i, :3])) or err[i] > kROOT_TOL * scale[i]]
+
+        if failed:
+            logging.getLogger(__name__).warning("Root finder did not converge for experiments %s: %s; integrating instead",
+                                                failed,
+                                                res.message)
+            ret[failed] = CRWSolver.solve_batch([params[i] for i in failed],
+                                                [z0[i] for i in failed],
+                                                steady_state_only=True)
+
+        return ret
 
-        return z
+    @staticmethod
+    def system_matrix(params: tp.Dict[str, float]) -> np.ndarray:
+        """
+        Build the 5x5 augmented matrix :math:`[[A, b], [0, 0]]` for the affine
+        system in :meth:`kernel`, with state [N_s, N_h, N_avs, B, 1].
+        """
+        tau_av, alpha_ca, tau_h, alpha_b = CRWSolver.rates(params)
+        N = params['N']
+        return np.array([[0.0, 1.0 / tau_h, 1.0 / tau_av, 0.0, -alpha_b - alpha_ca],
+                         [-1.0 / tau_av, -1.0 / tau_av - 1.0 / tau_h, -1.0 / tau_av, 0.0,
+                          alpha_b - alpha_ca + N / tau_av],
+                         [0.0, 0.0, -1.0 / tau_av, 0.0, alpha_ca],
+                         [0.0, 1.0 / tau_h, 0.0, 0.0, -alpha_b],
+                         [0.0, 0.0, 0.0, 0.0, 0.0]])
+
+    @staticmethod
+    def rates(params: tp.Dict[str, float]) -> tp.Tuple[float, float, float, float]:
+        """
+        Compute the (constant) rates appearing in the ODE system for an
+        experiment: (tau_av, alpha_ca, tau_h, alpha_b).
+        """
+        if params['N'] == 1:
+            return (params['tau_av1'],
+                    params['alpha_ca1'],
+                    params['tau_h1'],
+                    params['alpha_b1'])
+
+        N_avN_est = params['N_av1'] * params['crwD']
+        # N_avN_est = params['N_avN']
+
+        alpha_ca = IntraExp_RobotInterferenceRate_NRobots.kernel(N_av1=params['N_av1'],
+                                                                 tau_av1=params['tau_av1'],
+                                                                 N_avN=N_avN_est,
+                                                                 tau_avN=params['tau_avN'])
+        return (params['tau_avN'],
+                alpha_ca,
+                params['tau_hN'],
+                params['alpha_bN'])
 
     @staticmethod
     def kernel(z, t, self, params: tp.Dict[str, float]):
@@ -19,9 +19,7 @@ Inter-experiment models for some of the performance measures the SIERRA core
 supports.
 """
 # Core packages
-import os
 import typing as tp
-import copy
 
 # 3rd party packages
 import implements
@@ -40,6 +38,8 @@ from titerra.projects.common.perf_measures.scalability import SteadyStateParalle
 from titerra.projects.common.perf_measures.self_organization import SteadyStateFLMarginalUnivar
 
 import titerra.projects.fordyca_base.models.representation as rep
+import titerra.projects.fordyca_base.models.model_cache as model_cache
+import titerra.projects.fordyca_base.models.exp_runner as exp_runner
 from titerra.projects.fordyca_base.models.density import BlockAcqDensity
 from titerra.projects.fordyca_base.models.dist_measure import DistanceMeasure2D
 from titerra.projects.fordyca_base.models.blocks import IntraExp_BlockAcqRate_NRobots
@@ -91,38 +91,10 @@ class InterExp_RawPerf_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        dirs = criteria.gen_exp_dirnames(cmdopts)
-        res_df = pd.DataFrame(columns=dirs, index=[0])
-
-        for i, exp in enumerate(dirs):
-
-            # Setup cmdopts for intra-experiment model
-            cmdopts2 = copy.deepcopy(cmdopts)
-
-            cmdopts2["exp0_output_root"] = os.path.join(
-                cmdopts["batch_output_root"], dirs[0])
-            cmdopts2["exp0_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], dirs[0])
-
-            cmdopts2["exp_input_root"] = os.path.join(
-                cmdopts['batch_input_root'], exp)
-            cmdopts2["exp_output_root"] = os.path.join(
-                cmdopts['batch_output_root'], exp)
-            cmdopts2["exp_graph_root"] = os.path.join(
-                cmdopts['batch_graph_root'], exp)
-            cmdopts2["exp_stat_root"] = os.path.join(
-                cmdopts["batch_stat_root"], exp)
-            cmdopts2["exp_model_root"] = os.path.join(
-                cmdopts['batch_model_root'], exp)
-            sierra.core.utils.dir_create_checked(
-                cmdopts2['exp_model_root'], exist_ok=True)
-
-            # Model only targets a single graph
-            intra_df = IntraExp_BlockAcqRate_NRobots(self.main_config,
-                                                     self.config).run(criteria,
-                                                                      i,
-                                                                      cmdopts2)[0]
-            res_df[exp] = intra_df['model'].iloc[-1]
+        # Model only targets a single graph
+        res_df = exp_runner.steady_state_for_batch(IntraExp_BlockAcqRate_NRobots(self.main_config, self.config),
+                                                   criteria,
+                                                   cmdopts)
 
         # All done!
         return [res_df]
@@ -161,8 +133,9 @@ class InterExp_Scalability_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        perf_df = InterExp_RawPerf_NRobots(self.main_config, self.config).run(criteria,
-                                                                              cmdopts)[0]
+        perf_df = model_cache.run_inter(InterExp_RawPerf_NRobots(self.main_config, self.config),
+                                        criteria,
+                                        cmdopts)[0]
 
         perf_dfs_mock = _mock_distribution_gen(
             criteria, self.main_config, cmdopts, perf_df)
@@ -217,8 +190,9 @@ class InterExp_SelfOrg_NRobots():
             criteria: bc.IConcreteBatchCriteria,
             cmdopts: types.Cmdopts) -> tp.List[pd.DataFrame]:
 
-        perf_df = InterExp_RawPerf_NRobots(self.main_config, self.config).run(criteria,
-                                                                              cmdopts)[0]
+        perf_df = model_cache.run_inter(InterExp_RawPerf_NRobots(self.main_config, self.config),
+                                        criteria,
+                                        cmdopts)[0]
 
         perf_dfs_mock = _mock_distribution_gen(
             criteria, self.main_config, cmdopts, perf_df)
@@ -16,9 +16,11 @@
 
 # Core packages
 import os
+import re
 import typing as tp
 
 # 3rd party packages
+import numpy as np
 import pandas as pd
 from sierra.core import utils, storage, types
 import sierra.core.variables.batch_criteria as bc
@@ -31,18 +33,52 @@ import titerra.projects.common.generators.scenario_generator_parser as sgp
 import titerra.projects.common.variables.nest as nest
 
 
-class BlockCluster():
+class BlockClusterTable():
     """
-    Representation of a block cluster object within the arena.
+    Columnar representation of all block clusters in a ``block-clusters.csv``, parsed in a single
+    pass over the columns using only the final row. Each attribute is a NumPy array indexed by
+    cluster ID:
+
+    - ``xmin``, ``xmax``, ``ymin``, ``ymax`` - Cluster extent.
+    - ``area`` - Cluster area, as reported in the .csv (NaN if not present).
+    - ``block_count`` - Interval average # blocks in the cluster (NaN if not present).
+    - ``avg_blocks`` - Steady state # blocks in the cluster (see :meth:`BlockCluster.from_df`).
     """
-    @classmethod
-    def from_df(cls, clusters_df: pd.DataFrame, cluster_id: int) -> 'BlockCluster':
-        col_stem = 'cluster' + str(cluster_id)
+    kExtentRegex = re.compile('cluster([0-9]+)_(xmin|xmax|ymin|ymax|area)')
+    kBlockCountRegex = re.compile('int_avg_cluster([0-9]+)_block_count')
 
-        xmin = clusters_df.filter(regex=col_stem + '_xmin').iloc[-1].values[0]
-        xmax = clusters_df.filter(regex=col_stem + '_xmax').iloc[-1].values[0]
-        ymin = clusters_df.filter(regex=col_stem + '_ymin').iloc[-1].values[0]
-        ymax = clusters_df.filter(regex=col_stem + '_ymax').iloc[-1].values[0]
+    def __init__(self, clusters_df: pd.DataFrame) -> None:
+        last = clusters_df.iloc[-1]
+        n_clusters = len([c for c in clusters_df.columns if 'xmin' in c])
+
+        fields = {f: np.full(n_clusters, np.nan)
+                  for f in ['xmin', 'xmax', 'ymin', 'ymax', 'area', 'block_count']}
+        seen = set()
+
+        # Same matching rules as DataFrame.filter(regex=...): the first column containing a
+        # match for a given cluster ID and field wins.
+        for col in clusters_df.columns:
+            match = self.kBlockCountRegex.search(col)
+            if match is not None:
+                key = (int(match.group(1)), 'block_count')
+            else:
+                match = self.kExtentRegex.search(col)
+                if match is None:
+                    continue
+                key = (int(match.group(1)), match.group(2))
+
+            if key in seen or key[0] >= n_clusters:
+                continue
+
+            seen.add(key)
+            fields[key[1]][key[0]] = last[col]
+
+        self.xmin = fields['xmin']
+        self.xmax = fields['xmax']
+        self.ymin = fields['ymin']
+        self.ymax = fields['ymax']
+        self.area = fields['area']
+        self.block_count = fields['block_count']
 
         # We approximate the # blocks in a cluster (which changes dynamically) as a steady state
         # quantity, where each cluster always contains the fraction of total blocks in the arena
@@ -51,14 +87,27 @@ class BlockCluster():
             regex='int_avg_cluster[0-9]*_block_count').iloc[-1].sum()
         total_area = clusters_df.filter(
             regex='cluster[0-9]*_area').iloc[-1].sum()
-        cluster_area = ArenaExtent.from_corners(ll=Vector3D(xmin, ymin),
-                                                ur=Vector3D(xmax, ymax)).area()
-        cluster_avg_blocks = total_blocks * cluster_area / total_area
+        cluster_area = (self.xmax - self.xmin) * (self.ymax - self.ymin)
+        self.avg_blocks = total_blocks * cluster_area / total_area
 
-        return BlockCluster(ll=Vector3D(xmin, ymin),
-                            ur=Vector3D(xmax, ymax),
+    def __len__(self) -> int:
+        return len(self.xmin)
+
+    def cluster(self, cluster_id: int) -> 'BlockCluster':
+        return BlockCluster(ll=Vector3D(self.xmin[cluster_id], self.ymin[cluster_id]),
+                            ur=Vector3D(self.xmax[cluster_id], self.ymax[cluster_id]),
                             cluster_id=cluster_id,
-                            avg_blocks=cluster_avg_blocks)
+                            avg_blocks=self.avg_blocks[cluster_id])
+
+
+class BlockCluster():
+    """
+    Representation of a block cluster object within the arena.
+    """
+    @classmethod
+    def from_df(cls, clusters_df: pd.DataFrame, cluster_id: int) -> 'BlockCluster':
+        # Prefer BlockClusterTable when creating more than one cluster from the same dataframe.
+        return BlockClusterTable(clusters_df).cluster(cluster_id)
 
     def __init__(self, ll: Vector3D, ur: Vector3D, cluster_id: int, avg_blocks: float) -> None:
         self.extent = ArenaExtent.from_corners(ll=ll, ur=ur)
@@ -103,7 +152,7 @@ class BlockClusterSet():
 
         clusters_df = storage.DataFrameReader('storage.csv')(
             os.path.join(sim_opath, 'block-clusters.csv'))
-        n_clusters = len([c for c in clusters_df.columns if 'xmin' in c])
+        table = BlockClusterTable(clusters_df)
 
         # Create extents from clusters
         self.clusters = set()
@@ -114,7 +163,7 @@ class BlockClusterSet():
         # nest to avoid computational issues.
 
         if 'RN' in cmdopts['scenario']:
-            cluster = BlockCluster.from_df(clusters_df, 0)
+            cluster = table.cluster(0)
             total_area = cluster.extent.area()
 
             ll1 = cluster.extent.ll
@@ -156,8 +205,7 @@ class BlockClusterSet():
             self.clusters = set([c1, c2, c3, c4])
 
         else:  # General case
-            for c in range(0, n_clusters):
-                self.clusters |= set([BlockCluster.from_df(clusters_df, c)])
+            self.clusters = set(table.cluster(c) for c in range(0, len(table)))
 
     def __iter__(self):
         return iter(self.clusters)
@@ -125,6 +125,17 @@ class Cmdline(common.cmdline.CommonCmdline):
                            """,
                            default='semantic')
 
+        group.add_argument("--ct-npz",
+                           help="""
+
+                           Also write each construction target in a compact
+                           binary format (``.npz``) alongside its GraphML. Much
+                           smaller and faster to read than GraphML for large
+                           targets; can be passed to ``titerra-gmtv``.
+
+                           """,
+                           action='store_true')
+
     @staticmethod
     def cmdopts_update(cli_args, cmdopts: tp.Dict[str, str]):
         """Updates the core cmdopts dictionary with (key,value) pairs from the
@@ -137,7 +148,8 @@ class Cmdline(common.cmdline.CommonCmdline):
             'controller': cli_args.controller,
             'ct_specs': cli_args.ct_specs,
             'ct_orientations': cli_args.ct_orientations,
-            'ct_paradigm': cli_args.ct_paradigm
+            'ct_paradigm': cli_args.ct_paradigm,
+            'ct_npz': cli_args.ct_npz
         }
         cmdopts.update(updates)
 
@@ -19,6 +19,7 @@ Common functionality/configuration for all PRISM scenarios.
 """
 # Core packages
 import logging
+import os
 import typing as tp
 
 # 3rd party packages
@@ -32,6 +33,14 @@ from titerra.projects.common.variables import block_distribution, arena
 import titerra.projects.prism.variables.ct_set as ctset
 from titerra.projects.common.generators.argos import ForagingScenarioGenerator
 
+# Batch-level store of generated GraphML for construction targets, shared by
+# all experiments in the batch.
+kGMTCacheLeaf = 'gmt-cache'
+
+# Construction target sets, which are the same for every experiment in a batch,
+# keyed by (batch input root, specs, orientations, paradigm).
+_target_sets = {}  # type: tp.Dict[tp.Tuple[str, tp.Tuple[str, ...], tp.Tuple[str, ...], str], ctset.ConstructionTargetSet]
+
 
 class ConstructionScenarioGenerator(ForagingScenarioGenerator):
     def __init__(self, *args, **kwargs) -> None:
@@ -53,9 +62,7 @@ class ConstructionScenarioGenerator(ForagingScenarioGenerator):
         distribution configuration, maximum structure height, and # physics engines.
         """
         zmax = 0
-        target_set = ctset.factory(self.cmdopts['ct_specs'],
-                                   self.cmdopts['ct_orientations'],
-                                   self.spec.exp_input_root)
+        target_set = self._target_set()
 
         for t in target_set.targets:
             zmax = max(zmax, t.extent.zsize())
@@ -127,10 +134,28 @@ class ConstructionScenarioGenerator(ForagingScenarioGenerator):
 
     def generate_construct_targets(self,
                                    exp_def: XMLLuigi) -> None:
-        target_set = ctset.factory(self.cmdopts['ct_specs'],
-                                   self.cmdopts['ct_orientations'],
-                                   self.spec.exp_input_root)
+        target_set = self._target_set()
+        target_set.rebase(self.spec.exp_input_root)
         scutils.apply_to_expdef(target_set, exp_def)
 
-        # Generate .graphml files
-        target_set.gen_files()
+        # Generate .graphml (and .npz) files, or link them from the
+        # batch-level store if another experiment already generated them.
+        target_set.gen_files(os.path.join(self.cmdopts['batch_input_root'],
+                                          kGMTCacheLeaf),
+                             self.cmdopts['ct_npz'])
+
+    def _target_set(self) -> ctset.ConstructionTargetSet:
+        """
+        Get the construction target set for the batch, creating it for the first
+        experiment only.
+        """
+        key = (self.cmdopts['batch_input_root'],
+               tuple(self.cmdopts['ct_specs']),
+               tuple(self.cmdopts['ct_orientations']),
+               self.cmdopts['ct_paradigm'])
+        if key not in _target_sets:
+            _target_sets[key] = ctset.factory(self.cmdopts['ct_specs'],
+                                              self.cmdopts['ct_orientations'],
+                                              self.cmdopts['ct_paradigm'],
+                                              self.spec.exp_input_root)
+        return _target_sets[key]
@@ -0,0 +1,200 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+"""
+Reading and writing Graph Manipulation Targets (GMTs) in the supported file
+formats, selected by file extension:
+
+- ``.graphml`` - GraphML, as read by PRISM.
+
+- ``.npz`` - Compact binary format: a compressed numpy archive of arrays with
+  one row per vertex/edge, which is much smaller and faster to read and write
+  than GraphML for large targets. Arrays:
+
+  - ``vds`` - (N,) vertex descriptors.
+
+  - ``anchors`` - (N,3) vertex anchor coordinates.
+
+  - ``types`` - (N,) :data:`~titerra.projects.prism.gmt_spec.kBlockTypes`
+    value of each vertex; 0 if it does not have one (e.g., the other end of a
+    block in the ``edge`` paradigm).
+
+  - ``z_rots`` - (N,) index of each vertex's Z rotation in ``rotations``; -1
+    if it does not have one.
+
+  - ``colors`` - (N,) index of each vertex's color in ``color_names``.
+
+  - ``edges`` - (M,2) vertex descriptors of the endpoints of each edge.
+
+  - ``weights`` - (M,) weight of each edge.
+
+  Reading a target written in either format gives the same graph.
+"""
+
+# Core packages
+import os
+import typing as tp
+
+# 3rd party packages
+import numpy as np
+import networkx as nx
+
+# Project packages
+from titerra.projects.prism import gmt_spec
+
+kGraphMLExt = '.graphml'
+kNPZExt = '.npz'
+
+kNoBlockType = 0
+kNoZRot = -1
+
+
+def write_npz(path: str,
+              vds: np.ndarray,
+              anchors: np.ndarray,
+              types: np.ndarray,
+              z_rots: np.ndarray,
+              rotations: tp.List[str],
+              colors: np.ndarray,
+              color_names: tp.List[str],
+              edges: np.ndarray,
+              weights: tp.Optional[np.ndarray] = None) -> None:
+    """
+    Write a GMT in the compact binary format from its arrays (see module
+    docs). If ``weights`` is not passed all edges have weight 1.
+    """
+    if weights is None:
+        weights = np.ones(len(edges), dtype=np.int64)
+
+    # np.savez() appends the extension if it is missing, so write through a
+    # file object to use the path as-is.
+    with open(path, 'wb') as f:
+        np.savez_compressed(f,
+                            vds=np.asarray(vds, dtype=np.int64),
+                            anchors=np.asarray(anchors, dtype=np.int32).reshape(-1, 3),
+                            types=np.asarray(types, dtype=np.int8),
+                            z_rots=np.asarray(z_rots, dtype=np.int8),
+                            rotations=np.array(rotations, dtype=np.str_),
+                            colors=np.asarray(colors, dtype=np.int8),
+                            color_names=np.array(color_names, dtype=np.str_),
+                            edges=np.asarray(edges, dtype=np.int64).reshape(-1, 2),
+                            weights=np.asarray(weights, dtype=np.int64))
+
+
+def write_graph_npz(graph: nx.Graph, path: str) -> None:
+    """
+    Write a GMT graph in the compact binary format. All edge weights must be
+    integers.
+    """
+    rotations = []  # type: tp.List[str]
+    color_names = []  # type: tp.List[str]
+    types = []
+    z_rots = []
+    colors = []
+    anchors = []
+
+    for _, attrs in graph.nodes(data=True):
+        anchors.append([int(v) for v in attrs[gmt_spec.kVertexAnchorKey].split(',')])
+        types.append(attrs.get(gmt_spec.kBlockTypeKey, kNoBlockType))
+
+        z_rot = attrs.get(gmt_spec.kVertexZRotKey)
+        if z_rot is None:
+            z_rots.append(kNoZRot)
+        else:
+            if z_rot not in rotations:
+                rotations.append(z_rot)
+            z_rots.append(rotations.index(z_rot))
+
+        color = attrs[gmt_spec.kVertexColorKey]
+        if color not in color_names:
+            color_names.append(color)
+        colors.append(color_names.index(color))
+
+    edges = list(graph.edges(data='weight', default=1))
+    assert all(isinstance(w, int) for _, _, w in edges), \
+        "Only integer edge weights supported by {0}".format(kNPZExt)
+
+    write_npz(path,
+              vds=np.fromiter(graph.nodes, dtype=np.int64, count=len(graph)),
+              anchors=np.array(anchors, dtype=np.int32),
+              types=np.array(types, dtype=np.int8),
+              z_rots=np.array(z_rots, dtype=np.int8),
+              rotations=rotations,
+              colors=np.array(colors, dtype=np.int8),
+              color_names=color_names,
+              edges=np.array([(u, v) for u, v, _ in edges], dtype=np.int64),
+              weights=np.array([w for _, _, w in edges], dtype=np.int64))
+
+
+def read_npz(path: str) -> nx.Graph:
+    """
+    Read a GMT graph written in the compact binary format. Vertex attributes
+    have the same names and types as when read from GraphML.
+    """
+    with np.load(path) as npz:
+        arrays = {k: npz[k] for k in npz.files}
+
+    rotations = arrays['rotations'].tolist()
+    color_names = arrays['color_names'].tolist()
+
+    graph = nx.Graph()
+    for vd, anchor, btype, z_rot, color in zip(arrays['vds'].tolist(),
+                                               arrays['anchors'].tolist(),
+                                               arrays['types'].tolist(),
+                                               arrays['z_rots'].tolist(),
+                                               arrays['colors'].tolist()):
+        attrs = {}  # type: tp.Dict[str, tp.Any]
+        if btype != kNoBlockType:
+            attrs[gmt_spec.kBlockTypeKey] = btype
+        attrs[gmt_spec.kVertexAnchorKey] = '{0},{1},{2}'.format(*anchor)
+        if z_rot != kNoZRot:
+            attrs[gmt_spec.kVertexZRotKey] = rotations[z_rot]
+        attrs[gmt_spec.kVertexColorKey] = color_names[color]
+        graph.add_node(vd, **attrs)
+
+    graph.add_weighted_edges_from((u, v, w) for (u, v), w in zip(arrays['edges'].tolist(),
+                                                               arrays['weights'].tolist()))
+    return graph
+
+
+def write_graph(graph: nx.Graph, path: str) -> None:
+    """
+    Write a GMT graph in the format selected by the extension of ``path``.
+    """
+    if os.path.splitext(path)[1] == kNPZExt:
+        write_graph_npz(graph, path)
+    else:
+        nx.write_graphml(graph, path)
+
+
+def read_graph(path: str) -> nx.Graph:
+    """
+    Read a GMT graph in the format selected by the extension of ``path``.
+    """
+    if os.path.splitext(path)[1] == kNPZExt:
+        return read_npz(path)
+
+    return nx.read_graphml(path, node_type=int)
+
+
+__api__ = [
+    'kGraphMLExt',
+    'kNPZExt',
+    'write_npz',
+    'write_graph_npz',
+    'read_npz',
+    'write_graph',
+    'read_graph'
+]
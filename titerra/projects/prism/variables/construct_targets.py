@@ -23,8 +23,12 @@ for usage documentation.
 # Core packages
 import logging  # type: ignore
 import typing as tp
+import os
+import json
+import hashlib
 
 # 3rd party packages
+import numpy as np
 import networkx as nx
 import implements
 from sierra.core.vector import Vector3D
@@ -33,9 +37,29 @@ from sierra.core import types
 
 # Project packages
 from sierra.core.utils import ArenaExtent
-from titerra.projects.prism import gmt_spec
+from titerra.projects.prism import gmt_spec, gmt_io
+from titerra.projects.prism.voxel_grid import VoxelGrid
+import titerra.projects.prism.voxel_grid as vgrid
 from titerra.projects.prism.variables.orientation import Orientation
 
+# Version of the graphs generated for construction targets, for invalidating
+# cached GraphML (see :meth:`BaseConstructTarget.digest()`). Must be bumped
+# whenever the generated graph for a given target changes.
+kGeneratorVersion = 1
+
+# Order in which the neighbors of each vertex are probed when computing the
+# virtual shell.
+kShellNeighbors = vgrid.kFaceNeighbors
+
+# Order in which vertices are connected to their neighbors (see
+# :meth:`BaseConstructTarget._connect_vertex_to_neighbors()`).
+kEdgeNeighbors = np.array([[0, 1, 0],
+                           [0, -1, 0],
+                           [1, 0, 0],
+                           [-1, 0, 0],
+                           [0, 0, -1],
+                           [0, 0, 1]], dtype=np.int64)
+
 
 class IConcreteGMT(implements.Interface):
     @staticmethod
@@ -102,6 +126,23 @@ class BaseConstructTarget():
                                        attrs,
                                        False))
 
+    def digest(self) -> str:
+        """
+        Content address for the generated graph of the target: a hash of
+        everything the graph depends on. The anchor is not included, because
+        vertices are relative to the bounding box.
+        """
+        key = {
+            'class': type(self).__name__,
+            'shape': self.spec['shape'],
+            'composition': self.spec['composition'],
+            'bb': list(self.spec['bb']),
+            'orientation': self.spec['orientation'].str_val,
+            'paradigm': self.paradigm,
+            'version': kGeneratorVersion
+        }
+        return hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
     def write_graphml(self, graph: nx.Graph, path: str) -> None:
         """
         Writes generated GraphML to the filesystem.
@@ -119,49 +160,249 @@ class BaseConstructTarget():
 
         return True
 
-    def graph_virtual_shell_add(self, graph: nx.Graph) -> nx.Graph:
-        for vd in graph.copy():
-            xplus1 = Vector3D(1, 0, 0)
-            xminus1 = Vector3D(-1, 0, 0)
-            yplus1 = Vector3D(0, 1, 0)
-            yminus1 = Vector3D(0, -1, 0)
-            zplus1 = Vector3D(0, 0, 1)
-            zminus1 = Vector3D(0, 0, -1)
-            neighbors = [xplus1, xminus1, yplus1, yminus1, zplus1, zminus1]
-
-            c = self.calc_vertex_coord(vd, self.extent)
-            for n in neighbors:
-                n_vd = self.calc_vertex_descriptor(c + n, self.extent)
-                if n_vd not in graph and self.coord_within_bb(c + n):
-                    self.graph_block_add(graph,
-                                         'vbeam1',
-                                         c + n,
-                                         Orientation("0"))
+    def grid_gen(self) -> VoxelGrid:
+        """
+        Create an empty :class:`~titerra.projects.prism.voxel_grid.VoxelGrid`
+        covering the bounding box of the target.
+        """
+        return VoxelGrid((self.extent.xsize(),
+                          self.extent.ysize(),
+                          self.extent.zsize()))
+
+    def grid_blocks_add(self,
+                        grid: VoxelGrid,
+                        block_type: str,
+                        anchors: np.ndarray,
+                        z_rot: Orientation) -> bool:
+        """
+        Add blocks of the specified type at the (N,3) ``anchors`` coordinates
+        to the grid, in order, using the configured block representation
+        paradigm. Equivalent to calling :meth:`graph_block_add()` for each
+        anchor.
+
+        Returns:
+            False if the blocks extend outside of the bounding box and so
+            cannot be represented by the grid; the grid may have been
+            modified.
+        """
+        if self.paradigm == 'semantic':
+            grid.blocks_add(block_type, anchors, str(z_rot))
+        elif self.paradigm == 'edge':
+            ends = self.calc_block_ends_from_pose(anchors,
+                                                  z_rot,
+                                                  gmt_spec.kBlockExtents[block_type])
+            if ends is not None and not grid.within(ends):
+                return False
+            grid.blocks_add(block_type, anchors, str(z_rot), ends)
+        elif self.paradigm == 'vertex':
+            raise NotImplementedError
+
+        return True
+
+    def grid_from_blocks(self,
+                         blocks: tp.List[tp.Tuple[str, np.ndarray, Orientation]]) -> tp.Optional[VoxelGrid]:
+        """
+        Generate the grid for the (block type, (N,3) anchors, Z rotation)
+        groups of blocks, added in order, or None if the grid cannot represent
+        them.
+        """
+        grid = self.grid_gen()
+        if all(self.grid_blocks_add(grid, *b) for b in blocks):
+            self.logger.debug("Generated %s vertices from grid",
+                              grid.n_vertices)
+            return grid
+
+        return None
+
+    def graph_from_blocks(self,
+                          blocks: tp.List[tp.Tuple[str, np.ndarray, Orientation]]) -> nx.Graph:
+        """
+        Generate the graph for the (block type, (N,3) anchors, Z rotation)
+        groups of blocks, added in order, via :meth:`grid_from_blocks()`. Falls
+        back to adding blocks one at a time with :meth:`graph_block_add()` if
+        the grid cannot represent them.
+        """
+        grid = self.grid_from_blocks(blocks)
+        if grid is not None:
+            return grid.to_graph()
+
+        graph = nx.Graph()
+        for block_type, anchors, z_rot in blocks:
+            for c in anchors.tolist():
+                self.graph_block_add(graph, block_type, Vector3D(*c), z_rot)
 
         return graph
 
-    def graph_complement_shell_add(self, graph: nx.Graph) -> nx.Graph:
+    def gen_grid(self) -> tp.Optional[VoxelGrid]:
         """
-        Adds virtual vertices to the graph to form the complement shell.
+        Generate the grid representation of the target, or None if the target
+        does not have one.
+        """
+        return None
 
-        .. IMPORTANT:: This function will not work if the structure the graph
-                       represents contains holes. I haven't yet implemented that
-                       check when adding virtual vertices because it is
-                       non-trivial.
+    def gen_graphml(self, path: str) -> None:
+        """
+        Generate the target and write it to the filesystem as GraphML,
+        directly from its grid representation if it has one.
+        """
+        grid = self.gen_grid()
+        if grid is not None:
+            self.logger.info("Write grid to %s", path)
+            grid.write_graphml(path)
+        else:
+            self.write_graphml(self.gen_graph(), path)
+
+    def gen_npz(self, path: str) -> None:
+        """
+        Generate the target and write it to the filesystem in the compact
+        binary format (see :mod:`~titerra.projects.prism.gmt_io`), directly
+        from its grid representation if it has one.
+        """
+        self.logger.info("Write target to %s", path)
+        grid = self.gen_grid()
+        if grid is not None:
+            grid.write_npz(path)
+        else:
+            gmt_io.write_graph_npz(self.gen_graph(), path)
+
+    def gen_file(self, path: str) -> None:
+        """
+        Generate the target and write it to the filesystem in the format
+        selected by the extension of ``path``.
         """
-        for i in range(0, self.extent.xsize()):
-            for j in range(0, self.extent.ysize()):
-                for k in range(0, self.extent.zsize()):
-                    c = Vector3D(i, j, k)
-                    vd = self.calc_vertex_descriptor(c, self.extent)
-                    if vd not in graph:
-                        self.graph_block_add(graph,
-                                             'vbeam1',
-                                             c,
-                                             Orientation("0"))
+        self.gen_files([path])
 
+    def gen_files(self, paths: tp.List[str]) -> None:
+        """
+        Generate the target once and write it to the filesystem at each of
+        ``paths``, in the format selected by the extension of each, directly
+        from its grid representation if it has one.
+        """
+        grid = self.gen_grid()
+        graph = None
+        if grid is None:
+            graph = self.gen_graph()
+
+        for path in paths:
+            self.logger.info("Write target to %s", path)
+            if grid is None:
+                gmt_io.write_graph(graph, path)
+            elif os.path.splitext(path)[1] == gmt_io.kNPZExt:
+                grid.write_npz(path)
+            else:
+                grid.write_graphml(path)
+
+    def graph_virtual_shell_add(self, graph: nx.Graph) -> nx.Graph:
+        """
+        Adds virtual vertices to the graph to form the virtual shell: every
+        empty cell within the bounding box which is face-adjacent to a vertex
+        (i.e., the dilation of the structure minus the structure itself).
+        """
+        coords = self.graph_coords(graph)
+        occupied = self.graph_occupancy(coords)
+
+        # Cells are added in the order they are first found as neighbors of
+        # vertices, so the result is the same as probing each vertex in turn.
+        nbrs, within = vgrid.neighbors(coords, kShellNeighbors, occupied.shape)
+        cands = nbrs[within]
+        cands = cands[~occupied[tuple(cands.T)]]
+        flat = np.ravel_multi_index(tuple(cands.T), occupied.shape)
+        _, first = np.unique(flat, return_index=True)
+        shell = cands[np.sort(first)]
+
+        self.graph_virtual_vertices_add(graph, shell, occupied)
         return graph
 
+    def graph_complement_shell_add(self, graph: nx.Graph) -> nx.Graph:
+        """
+        Adds virtual vertices to the graph to form the complement shell: every
+        empty cell within the bounding box which can be reached from outside
+        of the structure. Holes (empty cells completely enclosed by the
+        structure) are not part of the complement shell. Cells are reached by
+        flood fill from the empty cells on the sides and top of the bounding
+        box; the bottom is the arena floor, so cavities only open to the floor
+        are holes too.
+        """
+        coords = self.graph_coords(graph)
+        occupied = self.graph_occupancy(coords)
+
+        seeds = np.zeros(occupied.shape, dtype=bool)
+        seeds[[0, -1], :, :] = True
+        seeds[:, [0, -1], :] = True
+        seeds[:, :, -1] = True
+        outside = vgrid.flood_fill(~occupied, seeds)
+
+        # np.argwhere() gives cells in X, Y, Z loop order.
+        self.graph_virtual_vertices_add(graph, np.argwhere(outside), occupied)
+        return graph
+
+    def graph_coords(self, graph: nx.Graph) -> np.ndarray:
+        """
+        Get the (N,3) coordinates of the vertices in the graph, in order.
+        Vectorized :meth:`calc_vertex_coord()`.
+        """
+        vds = np.fromiter(graph.nodes, dtype=np.int64, count=len(graph))
+        xsize = self.extent.xsize()
+        ysize = self.extent.ysize()
+        return np.stack([vds % xsize,
+                         (vds // xsize) % ysize,
+                         vds // (xsize * ysize)], axis=1)
+
+    def graph_occupancy(self, coords: np.ndarray) -> np.ndarray:
+        """
+        Get the occupancy grid of the bounding box for the (N,3) vertex
+        coordinates. Vertices outside of the bounding box (e.g., the far ends
+        of blocks in the ``edge`` paradigm) are ignored.
+        """
+        occupied = np.zeros((self.extent.xsize(),
+                             self.extent.ysize(),
+                             self.extent.zsize()), dtype=bool)
+        within = np.all((coords >= 0) & (coords < np.array(occupied.shape)), axis=1)
+        occupied[tuple(coords[within].T)] = True
+        return occupied
+
+    def graph_virtual_vertices_add(self,
+                                   graph: nx.Graph,
+                                   cells: np.ndarray,
+                                   occupied: np.ndarray) -> None:
+        """
+        Add a virtual (``vbeam1``) vertex at each of the (N,3) empty ``cells``,
+        in order, connected to its face-adjacent neighbors which are occupied
+        or earlier in ``cells``. Same as calling :meth:`graph_block_add()` for
+        each cell, without per-vertex neighbor lookups. Virtual blocks are
+        cubes, so this is the same for all paradigms.
+        """
+        if len(cells) == 0:
+            return
+
+        xsize = self.extent.xsize()
+        ysize = self.extent.ysize()
+
+        # Rank of each cell in the order vertices are added; vertices already
+        # in the graph come first.
+        rank = np.full(occupied.shape, len(cells), dtype=np.int64)
+        rank[occupied] = -1
+        rank[tuple(cells.T)] = np.arange(len(cells))
+
+        vds = cells[:, 2] * xsize * ysize + cells[:, 1] * xsize + cells[:, 0]
+        z_rot = str(Orientation("0"))
+        graph.add_nodes_from((vd, {
+            gmt_spec.kBlockTypeKey: gmt_spec.kBlockTypes['vbeam1'],
+            gmt_spec.kVertexAnchorKey: '{0},{1},{2}'.format(*c),
+            gmt_spec.kVertexZRotKey: z_rot,
+            gmt_spec.kVertexColorKey: gmt_spec.kBlockColors['vbeam1']
+        }) for vd, c in zip(vds.tolist(), cells.tolist()))
+
+        nbrs, within = vgrid.neighbors(cells, kEdgeNeighbors, occupied.shape)
+        nbr_rank = np.full(within.shape, len(cells), dtype=np.int64)
+        nbr_rank[within] = rank[tuple(nbrs[within].T)]
+        connect = nbr_rank < np.arange(len(cells))[:, np.newaxis]
+
+        src = np.broadcast_to(vds[:, np.newaxis], connect.shape)[connect]
+        dest = nbrs[connect]
+        dest = dest[:, 2] * xsize * ysize + dest[:, 1] * xsize + dest[:, 0]
+        graph.add_edges_from(zip(src.tolist(), dest.tolist()), weight=1)
+
     def graph_block_remove(self,
                            graph: nx.Graph,
                            c: Vector3D) -> None:
@@ -391,6 +632,33 @@ class BaseConstructTarget():
 
         return coords
 
+    @staticmethod
+    def calc_block_ends_from_pose(anchors: np.ndarray,
+                                  z_rot: Orientation,
+                                  size: int) -> tp.Optional[np.ndarray]:
+        """
+        Same as the last coordinate of :meth:`calc_block_extent_from_pose()`
+        for each of the (N,3) anchors, or None if blocks have no other end.
+        """
+        if size == 1:
+            return None
+
+        anchors = np.asarray(anchors, dtype=np.int64).reshape(-1, 3)
+        ends = anchors.copy()
+
+        if z_rot.is_N():
+            ends[:, 1] += anchors[:, 1] + size - 1
+        elif z_rot.is_S():
+            ends[:, 1] -= anchors[:, 1] - size + 1
+        elif z_rot.is_E():
+            ends[:, 0] += anchors[:, 0] + size - 1
+        elif z_rot.is_W():
+            ends[:, 0] -= anchors[:, 0] - size + 1
+        else:
+            return None
+
+        return ends
+
     @staticmethod
     def calc_block_extent_from_vd(graph: nx.Graph,
                                   vd: int) -> tp.List[Vector3D]:
@@ -408,6 +676,20 @@ class BaseConstructTarget():
                                                                extent)
 
 
+def loop_coords(loops: tp.List[tp.Tuple[int, tp.Iterable[int]]]) -> np.ndarray:
+    """
+    Get the (N,3) coordinates visited by nested loops over the (axis, range)
+    pairs, outermost loop first, in the order they are visited.
+    """
+    mesh = np.meshgrid(*[np.asarray(list(r), dtype=np.int64) for _, r in loops],
+                       indexing='ij')
+    coords = np.zeros(mesh[0].shape + (3,), dtype=np.int64)
+    for (axis, _), m in zip(loops, mesh):
+        coords[..., axis] = m
+
+    return coords.reshape(-1, 3)
+
+
 @implements.implements(IConcreteGMT)
 class Beam1Prism(BaseConstructTarget):
     """
@@ -426,27 +708,26 @@ class Beam1Prism(BaseConstructTarget):
         super().__init__(spec, target_id, paradigm, graphml_path)
 
     def gen_graph(self) -> nx.Graph:
-        graph = nx.Graph()
+        return self.graph_from_blocks(self._blocks())
 
+    def gen_grid(self) -> tp.Optional[VoxelGrid]:
+        return self.grid_from_blocks(self._blocks())
+
+    def _blocks(self) -> tp.List[tp.Tuple[str, np.ndarray, Orientation]]:
         # For rectprisms, there is no difference in the generated GRAPHML for +X
         # vs -X, or +Y vs -Y.
+        xs = range(0, self.extent.xsize())
+        ys = range(0, self.extent.ysize())
+        zs = range(0, self.extent.zsize())
+
         if self.spec['orientation'].is_EW():
-            for x in range(0, self.extent.xsize()):
-                for y in range(0, self.extent.ysize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
+            anchors = loop_coords([(0, xs), (1, ys), (2, zs)])
         elif self.spec['orientation'].is_NS():
-            for y in range(0, self.extent.ysize()):
-                for x in range(0, self.extent.xsize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
-        return graph
+            anchors = loop_coords([(1, ys), (0, xs), (2, zs)])
+        else:
+            return []
+
+        return [('beam1', anchors, self.spec['orientation'])]
 
 
 @implements.implements(IConcreteGMT)
@@ -467,25 +748,26 @@ class Beam2Prism(BaseConstructTarget):
         super().__init__(spec, target_id, paradigm, graphml_path)
 
     def gen_graph(self) -> nx.Graph:
-        graph = nx.Graph()
+        return self.graph_from_blocks(self._blocks())
+
+    def gen_grid(self) -> tp.Optional[VoxelGrid]:
+        return self.grid_from_blocks(self._blocks())
+
+    def _blocks(self) -> tp.List[tp.Tuple[str, np.ndarray, Orientation]]:
+        xs = range(0, self.extent.xsize(), 2)
+        ys = range(0, self.extent.ysize())
+        zs = range(0, self.extent.zsize())
 
         if self.spec['orientation'].is_EW():
-            for x in range(0, self.extent.xsize(), 2):
-                for y in range(0, self.extent.ysize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam2',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
+            anchors = loop_coords([(0, xs), (1, ys), (2, zs)])
         elif self.spec['orientation'].is_NS():
-            for y in range(0, self.extent.ysize(), 2):
-                for x in range(0, self.extent.xsize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam2',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
-        return graph
+            xs = range(0, self.extent.xsize())
+            ys = range(0, self.extent.ysize(), 2)
+            anchors = loop_coords([(1, ys), (0, xs), (2, zs)])
+        else:
+            return []
+
+        return [('beam2', anchors, self.spec['orientation'])]
 
 
 @implements.implements(IConcreteGMT)
@@ -506,25 +788,26 @@ class Beam3Prism(BaseConstructTarget):
         super().__init__(spec, target_id, paradigm, graphml_path)
 
     def gen_graph(self) -> nx.Graph:
-        graph = nx.Graph()
+        return self.graph_from_blocks(self._blocks())
+
+    def gen_grid(self) -> tp.Optional[VoxelGrid]:
+        return self.grid_from_blocks(self._blocks())
+
+    def _blocks(self) -> tp.List[tp.Tuple[str, np.ndarray, Orientation]]:
+        xs = range(0, self.extent.xsize(), 3)
+        ys = range(0, self.extent.ysize())
+        zs = range(0, self.extent.zsize())
 
         if self.spec['orientation'].is_EW():
-            for x in range(0, self.extent.xsize(), 3):
-                for y in range(0, self.extent.ysize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam3',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
+            anchors = loop_coords([(0, xs), (1, ys), (2, zs)])
         elif self.spec['orientation'].is_NS():
-            for y in range(0, self.extent.ysize(), 3):
-                for x in range(0, self.extent.xsize()):
-                    for z in range(0, self.extent.zsize()):
-                        self.graph_block_add(graph,
-                                             'beam3',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
-        return graph
+            xs = range(0, self.extent.xsize())
+            ys = range(0, self.extent.ysize(), 3)
+            anchors = loop_coords([(1, ys), (0, xs), (2, zs)])
+        else:
+            return []
+
+        return [('beam3', anchors, self.spec['orientation'])]
 
 
 @implements.implements(IConcreteGMT)
@@ -568,29 +851,27 @@ class Beam1Pyramid(BaseConstructTarget):
         super().__init__(spec, target_id, paradigm, graphml_path)
 
     def gen_graph(self) -> nx.Graph:
-        graph = nx.Graph()
+        return self.graph_from_blocks(self._blocks())
 
+    def gen_grid(self) -> tp.Optional[VoxelGrid]:
+        return self.grid_from_blocks(self._blocks())
+
+    def _blocks(self) -> tp.List[tp.Tuple[str, np.ndarray, Orientation]]:
         # For rectprisms, there is no difference in the generated GRAPHML for +X
         # vs -X, or +Y vs -Y.
-        z = 0
-        if self.spec['orientation'].is_EW():
-            for z in range(z, self.extent.zsize()):
-                for x in range(z, self.extent.xsize() - z):
-                    for y in range(z, self.extent.ysize() - z):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
-        elif self.spec['orientation'].is_NS():
-            for z in range(0, self.extent.zsize()):
-                for y in range(z, self.extent.ysize() - z):
-                    for x in range(z, self.extent.xsize() - z):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             self.spec['orientation'])
+        layers = []
+        for z in range(0, self.extent.zsize()):
+            xs = range(z, self.extent.xsize() - z)
+            ys = range(z, self.extent.ysize() - z)
+            if self.spec['orientation'].is_EW():
+                layers.append(loop_coords([(2, [z]), (0, xs), (1, ys)]))
+            elif self.spec['orientation'].is_NS():
+                layers.append(loop_coords([(2, [z]), (1, ys), (0, xs)]))
 
-        return graph
+        if not layers:
+            return []
+
+        return [('beam1', np.concatenate(layers), self.spec['orientation'])]
 
 
 @implements.implements(IConcreteGMT)
@@ -628,10 +909,10 @@ class Ramp(BaseConstructTarget):
                                                                                    self.kRAMP_LENGTH_RATIO)
 
     def gen_graph(self) -> nx.Graph:
-        graph = nx.Graph()
-
         # First, generate beam1 blocks
-        self._gen_beam1_blocks(graph)
+        grid = self.grid_gen()
+        self._gen_beam1_blocks(grid)
+        graph = grid.to_graph()
 
         # Then, generate ramp blocks
         self._gen_ramp_blocks(graph)
@@ -665,31 +946,26 @@ class Ramp(BaseConstructTarget):
                                          Vector3D(x, y, z))
                 corr += 1
 
-    def _gen_beam1_blocks(self, graph: nx.Graph) -> None:
+    def _gen_beam1_blocks(self, grid: VoxelGrid) -> None:
         """
-        Add the nodes containing the anchor cells of beam1 blocks to the
-        structure graph, along with the connections to their neighbors.
+        Add the anchor cells of beam1 blocks to the structure grid; their
+        connections to their neighbors are implied by the grid.
 
         """
         ratio = self.kRAMP_LENGTH_RATIO
 
-        if self.spec['orientation'].is_EW():
-            corr = 1
-            for z in range(0, self.extent.zsize()):
-                for x in range(0, self.extent.xsize() - ratio * corr):
-                    for y in range(0, self.extent.ysize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             1)
-                corr += 1
-        elif self.spec['orientation'].is_NS():
-            corr = 1
-            for z in range(0, self.extent.zsize()):
-                for y in range(0, self.extent.ysize() - ratio * corr):
-                    for x in range(0, self.extent.xsize()):
-                        self.graph_block_add(graph,
-                                             'beam1',
-                                             Vector3D(x, y, z),
-                                             1)
-                corr += 1
+        corr = 1
+        for z in range(0, self.extent.zsize()):
+            if self.spec['orientation'].is_EW():
+                anchors = loop_coords([(2, [z]),
+                                       (0, range(0, self.extent.xsize() - ratio * corr)),
+                                       (1, range(0, self.extent.ysize()))])
+            elif self.spec['orientation'].is_NS():
+                anchors = loop_coords([(2, [z]),
+                                       (1, range(0, self.extent.ysize() - ratio * corr)),
+                                       (0, range(0, self.extent.xsize()))])
+            else:
+                return
+
+            self.grid_blocks_add(grid, 'beam1', anchors, 1)
+            corr += 1
@@ -23,6 +23,7 @@ for usage documentation.
 import re
 import typing as tp
 import os
+import shutil
 
 # 3rd party packages
 import implements
@@ -33,6 +34,7 @@ from sierra.core import types
 # Project packages
 
 from titerra.projects.prism.variables import construct_targets as ct
+from titerra.projects.prism import gmt_io
 import titerra.projects.prism.variables.orientation as orientation
 
 
@@ -95,10 +97,68 @@ class ConstructionTargetSet():
 
         return [self.tag_adds]
 
-    def gen_files(self) -> None:
+    def rebase(self, graphml_root: str) -> None:
+        """
+        Move the GraphML files for all targets to a new root directory, so that
+        the same (already generated) target set can be applied to multiple
+        experiments.
+        """
+        self.graphml_root = graphml_root
+        self.tag_adds = []
         for target in self.targets:
-            graph = target.gen_graph()
-            target.write_graphml(graph, target.graphml_path)
+            target.graphml_path = os.path.join(graphml_root,
+                                               os.path.basename(target.graphml_path))
+
+    def gen_files(self,
+                  cache_root: tp.Optional[str] = None,
+                  npz: bool = False) -> None:
+        """
+        Generate the GraphML files for all targets, and, if ``npz`` is passed,
+        the compact binary (``.npz``) files alongside them.
+
+        If ``cache_root`` is passed, each file is only generated if there is
+        not already one for the target's
+        :meth:`~titerra.projects.prism.variables.construct_targets.BaseConstructTarget.digest()`
+        in ``cache_root``, and the target's file is hardlinked to (or, if that
+        fails, a copy of) the cached file.
+        """
+        exts = [gmt_io.kGraphMLExt]
+        if npz:
+            exts.append(gmt_io.kNPZExt)
+
+        if cache_root is not None:
+            os.makedirs(cache_root, exist_ok=True)
+
+        for target in self.targets:
+            paths = [os.path.splitext(target.graphml_path)[0] + ext for ext in exts]
+            if cache_root is None:
+                target.gen_files(paths)
+            else:
+                self._gen_files_cached(target, paths, cache_root)
+
+    @staticmethod
+    def _gen_files_cached(target, paths: tp.List[str], cache_root: str) -> None:
+        digest = target.digest()
+        cached = [os.path.join(cache_root, digest + os.path.splitext(path)[1])
+                  for path in paths]
+
+        # Generate the target once for all of the formats not already cached.
+        # Keep the extension, which selects the format.
+        missing = [c for c in cached if not os.path.exists(c)]
+        if missing:
+            tmps = [os.path.join(cache_root, digest + '.tmp' + os.path.splitext(c)[1])
+                    for c in missing]
+            target.gen_files(tmps)
+            for tmp, c in zip(tmps, missing):
+                os.replace(tmp, c)
+
+        for c, path in zip(cached, paths):
+            if os.path.lexists(path):
+                os.remove(path)
+            try:
+                os.link(c, path)
+            except OSError:
+                shutil.copyfile(c, path)
 
     def _gen_prism(self, target_id: int, spec: types.CLIArgSpec):
         if spec['composition'] == 'beam1':
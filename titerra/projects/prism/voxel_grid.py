@@ -0,0 +1,328 @@
+# Copyright 2021 John Harwell, All rights reserved.
+#
+#  This file is part of TITERRA.
+#
+#  TITERRA is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  TITERRA is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE.  See the GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along with
+#  TITERRA.  If not, see <http://www.gnu.org/licenses/
+"""
+Array-backed representation of the vertices of a construction target graph,
+so that targets can be built with whole-array operations instead of one block
+(and one edge) at a time.
+"""
+
+# Core packages
+import typing as tp
+
+# 3rd party packages
+import numpy as np
+import networkx as nx
+
+# Project packages
+from titerra.projects.prism import gmt_spec, gmt_io
+
+# Offsets of the 6 face-adjacent (Manhattan) neighbors of a cell.
+kFaceNeighbors = np.array([[1, 0, 0],
+                           [-1, 0, 0],
+                           [0, 1, 0],
+                           [0, -1, 0],
+                           [0, 0, 1],
+                           [0, 0, -1]], dtype=np.int64)
+
+
+class VoxelGrid():
+    """
+    Vertices of a construction target graph, indexed by their (X,Y,Z) cell
+    within the target's bounding box. Adjacent occupied cells are connected by
+    an edge, as are the two ends of a block in the ``edge`` paradigm, so edges
+    never need to be stored explicitly.
+
+    Attributes:
+        order: The order in which the vertex in each cell was added; -1 if the
+               cell is empty. Determines the order of vertices (and edges) in
+               the materialized graph.
+
+        btype: The :data:`~titerra.projects.prism.gmt_spec.kBlockTypes` value
+               of the block each vertex belongs to.
+
+        z_rot: Index into ``rotations`` of the Z rotation of the block each
+               vertex belongs to.
+
+        anchor: Whether each vertex is a block anchor, rather than the other
+                end of a block (``edge`` paradigm only).
+
+        ends: Per-block (anchor vertex order, other end vertex order) pairs
+              for blocks with more than one vertex.
+    """
+    kEmpty = -1
+
+    def __init__(self, dims: tp.Tuple[int, int, int]) -> None:
+        self.dims = tuple(int(d) for d in dims)
+        self.order = np.full(self.dims, self.kEmpty, dtype=np.int64)
+        self.btype = np.zeros(self.dims, dtype=np.int8)
+        self.z_rot = np.zeros(self.dims, dtype=np.int16)
+        self.anchor = np.zeros(self.dims, dtype=bool)
+        self.rotations = []  # type: tp.List[str]
+        self.ends = []  # type: tp.List[np.ndarray]
+        self.n_vertices = 0
+
+    def within(self, coords: np.ndarray) -> bool:
+        """
+        Determine if all of the (N,3) coordinates are within the grid.
+        """
+        return bool(np.all((coords >= 0) & (coords < np.array(self.dims))))
+
+    def blocks_add(self,
+                   block_type: str,
+                   anchors: np.ndarray,
+                   z_rot: str,
+                   ends: tp.Optional[np.ndarray] = None) -> None:
+        """
+        Add blocks of the specified type at the (N,3) ``anchors`` coordinates,
+        in order. If ``ends`` is passed, each block also has a vertex at the
+        corresponding coordinate, added immediately after its anchor.
+        """
+        anchors = np.asarray(anchors, dtype=np.int64).reshape(-1, 3)
+        n_blocks = len(anchors)
+
+        if ends is not None:
+            ends = np.asarray(ends, dtype=np.int64).reshape(-1, 3)
+            coords = np.empty((2 * n_blocks, 3), dtype=np.int64)
+            coords[0::2] = anchors
+            coords[1::2] = ends
+            is_anchor = np.tile([True, False], n_blocks)
+        else:
+            coords = anchors
+            is_anchor = np.ones(n_blocks, dtype=bool)
+
+        assert self.within(coords), "Vertices outside of {0}".format(self.dims)
+        cells = tuple(coords.T)
+        flat = np.ravel_multi_index(cells, self.dims)
+        assert len(np.unique(flat)) == len(flat) and \
+            np.all(self.order[cells] == self.kEmpty), \
+            "Vertices for {0} blocks already exist".format(block_type)
+
+        if z_rot not in self.rotations:
+            self.rotations.append(z_rot)
+
+        order = self.n_vertices + np.arange(len(coords), dtype=np.int64)
+        self.order[cells] = order
+        self.btype[cells] = gmt_spec.kBlockTypes[block_type]
+        self.z_rot[cells] = self.rotations.index(z_rot)
+        self.anchor[cells] = is_anchor
+        self.n_vertices += len(coords)
+
+        if ends is not None:
+            self.ends.append(order.reshape(-1, 2))
+
+    def to_graph(self) -> nx.Graph:
+        """
+        Materialize the graph. Vertices are added in the order they were added
+        to the grid, and each vertex's edges to later vertices in the order
+        those vertices were added, so the result is the same as adding the
+        blocks one at a time with
+        :meth:`~titerra.projects.prism.variables.construct_targets.BaseConstructTarget.graph_block_add()`.
+        """
+        graph = nx.Graph()
+        vds, attrs = self._vertices()
+        graph.add_nodes_from(zip(vds.tolist(), attrs))
+
+        edges = self.edges()
+        graph.add_edges_from(zip(vds[edges[:, 0]].tolist(),
+                                 vds[edges[:, 1]].tolist()),
+                             weight=1)
+        return graph
+
+    def write_graphml(self, path: str) -> None:
+        """
+        Write the graph as GraphML directly, without materializing it. The
+        output is the same as writing the result of :meth:`to_graph()` with
+        :func:`networkx.write_graphml()` (without ``lxml``).
+        """
+        vds, attrs = self._vertices()
+        edges = self.edges()
+
+        # Key IDs are assigned in the order attributes are first seen, and
+        # written in reverse order.
+        keys = []
+        if attrs:
+            keys.extend([('node', k, 'long' if k == gmt_spec.kBlockTypeKey else 'string')
+                         for k in attrs[0].keys()])
+        if len(edges) > 0:
+            keys.append(('edge', 'weight', 'long'))
+        ids = {(f, k): 'd{0}'.format(i) for i, (f, k, _) in enumerate(keys)}
+
+        lines = ["<?xml version='1.0' encoding='utf-8'?>",
+                 '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+                 'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+                 'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+                 'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">']
+        for f, k, t in reversed(keys):
+            lines.append('  <key id="{0}" for="{1}" attr.name="{2}" attr.type="{3}" />'.format(ids[(f, k)],
+                                                                                              f,
+                                                                                              k,
+                                                                                              t))
+        if not attrs:
+            lines.append('  <graph edgedefault="undirected" />')
+        else:
+            lines.append('  <graph edgedefault="undirected">')
+            for vd, vattrs in zip(vds.tolist(), attrs):
+                lines.append('    <node id="{0}">'.format(vd))
+                lines.extend('      <data key="{0}">{1}</data>'.format(ids[('node', k)], v)
+                             for k, v in vattrs.items())
+                lines.append('    </node>')
+
+            edge = '    <edge source="{0}" target="{1}">\n      <data key="{2}">1</data>\n    </edge>'
+            weight_id = ids.get(('edge', 'weight'))
+            lines.extend(edge.format(u, v, weight_id)
+                         for u, v in zip(vds[edges[:, 0]].tolist(),
+                                         vds[edges[:, 1]].tolist()))
+            lines.append('  </graph>')
+        lines.append('</graphml>')
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def write_npz(self, path: str) -> None:
+        """
+        Write the graph in the compact binary format (see
+        :mod:`~titerra.projects.prism.gmt_io`) directly, without materializing
+        it.
+        """
+        cells, vds = self._cells()
+        cells_t = tuple(cells.T)
+        is_anchor = self.anchor[cells_t]
+
+        color_names = [gmt_spec.kBlockColors[name] for name in gmt_spec.kBlockTypes]
+        color_lut = np.zeros(max(gmt_spec.kBlockTypes.values()) + 1, dtype=np.int8)
+        for i, btype in enumerate(gmt_spec.kBlockTypes.values()):
+            color_lut[btype] = i
+
+        gmt_io.write_npz(path,
+                         vds=vds,
+                         anchors=cells,
+                         types=np.where(is_anchor,
+                                        self.btype[cells_t],
+                                        gmt_io.kNoBlockType),
+                         z_rots=np.where(is_anchor,
+                                         self.z_rot[cells_t],
+                                         gmt_io.kNoZRot),
+                         rotations=self.rotations,
+                         colors=color_lut[self.btype[cells_t]],
+                         color_names=color_names,
+                         edges=vds[self.edges()])
+
+    def _cells(self) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the (N,3) cells and descriptors of the vertices, in the order they
+        were added.
+        """
+        xsize, ysize, _ = self.dims
+        cells = np.argwhere(self.order != self.kEmpty)
+        cells = cells[np.argsort(self.order[tuple(cells.T)])]
+        vds = cells[:, 2] * xsize * ysize + cells[:, 1] * xsize + cells[:, 0]
+        return cells, vds
+
+    def _vertices(self) -> tp.Tuple[np.ndarray, tp.List[tp.Dict[str, tp.Any]]]:
+        """
+        Get the descriptors and attributes of the vertices, in the order they
+        were added. Attribute order must match
+        :meth:`~titerra.projects.prism.variables.construct_targets.BaseConstructTarget.graph_block_add()`
+        so that the written GraphML is the same.
+        """
+        cells, vds = self._cells()
+
+        names = {v: k for k, v in gmt_spec.kBlockTypes.items()}
+        btypes = self.btype[tuple(cells.T)].tolist()
+        z_rots = self.z_rot[tuple(cells.T)].tolist()
+        anchors = self.anchor[tuple(cells.T)].tolist()
+
+        attrs = []
+        for c, btype, z_rot, is_anchor in zip(cells.tolist(),
+                                              btypes,
+                                              z_rots,
+                                              anchors):
+            color = gmt_spec.kBlockColors[names[btype]]
+            if is_anchor:
+                attrs.append({
+                    gmt_spec.kBlockTypeKey: btype,
+                    gmt_spec.kVertexAnchorKey: '{0},{1},{2}'.format(*c),
+                    gmt_spec.kVertexZRotKey: self.rotations[z_rot],
+                    gmt_spec.kVertexColorKey: color
+                })
+            else:
+                attrs.append({
+                    gmt_spec.kVertexAnchorKey: '{0},{1},{2}'.format(*c),
+                    gmt_spec.kVertexColorKey: color
+                })
+
+        return vds, attrs
+
+    def edges(self) -> np.ndarray:
+        """
+        Get the (M,2) edges of the graph as pairs of vertex orders, with the
+        earlier vertex first, sorted.
+        """
+        pairs = list(self.ends)
+        for axis in range(0, 3):
+            lo = np.swapaxes(self.order, 0, axis)[:-1]
+            hi = np.swapaxes(self.order, 0, axis)[1:]
+            mask = (lo != self.kEmpty) & (hi != self.kEmpty)
+            pairs.append(np.stack([lo[mask], hi[mask]], axis=1))
+
+        edges = np.sort(np.concatenate(pairs).reshape(-1, 2), axis=1)
+        return np.unique(edges, axis=0)
+
+
+def neighbors(coords: np.ndarray,
+              offsets: np.ndarray,
+              dims: tp.Tuple[int, int, int]) -> tp.Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the (N,K,3) neighbors of each of the (N,3) coordinates at the (K,3)
+    offsets, and the (N,K) mask of which neighbors are within a grid of the
+    specified dimensions.
+    """
+    nbrs = coords[:, np.newaxis, :] + offsets[np.newaxis, :, :]
+    within = np.all((nbrs >= 0) & (nbrs < np.array(dims)), axis=2)
+    return nbrs, within
+
+
+def flood_fill(passable: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+    """
+    Find all cells reachable from the ``seeds`` cells through face-adjacent
+    ``passable`` cells (both boolean grids of the same shape). Seeds which are
+    not passable are ignored.
+
+    Breadth-first from all seeds at once; each cell enters the frontier at
+    most once, so the cost is linear in the number of cells.
+    """
+    dims = passable.shape
+    flat_passable = passable.ravel()
+    reached = np.zeros(flat_passable.size, dtype=bool)
+
+    frontier = np.flatnonzero(seeds.ravel() & flat_passable)
+    reached[frontier] = True
+
+    while frontier.size > 0:
+        coords = np.stack(np.unravel_index(frontier, dims), axis=1)
+        nbrs, within = neighbors(coords, kFaceNeighbors, dims)
+        flat = np.ravel_multi_index(tuple(nbrs[within].T), dims)
+        frontier = np.unique(flat[flat_passable[flat] & ~reached[flat]])
+        reached[frontier] = True
+
+    return reached.reshape(dims)
+
+
+__api__ = [
+    'VoxelGrid',
+    'neighbors',
+    'flood_fill'
+]
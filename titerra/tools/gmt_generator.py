@@ -28,6 +28,7 @@ from sierra.core.vector import Vector3D
 
 from titerra.projects.prism.cmdline import Cmdline
 import titerra.projects.prism.variables.ct_set as ctset
+from titerra.projects.prism import gmt_io
 from titerra.projects.prism.variables.orientation import Orientation
 
 
@@ -37,7 +38,11 @@ class GMTGeneratorCmdline():
         self.parser = argparse.ArgumentParser(prog='gmt_generator')
         Cmdline.add_ct_args(self.parser)
 
-        self.parser.add_argument("-f", "--output-file", nargs='+')
+        self.parser.add_argument("-f", "--output-file",
+                                 help="""Output file for each target; the
+                                 format is selected by the extension
+                                 (``.graphml`` or ``.npz``).""",
+                                 nargs='+')
         self.parser.add_argument("--for-paper",
                                  help="""Generate the necessary graphs and
                                  modify them so that they can be subsequently
@@ -73,8 +78,13 @@ class GMTGenerator():
                 self.logger.info("Processing target '%s' -> '%s'",
                                  args.ct_specs[i],
                                  opath)
-                graph = target_set.targets[i].gen_graph()
-                target_set.targets[i].write_graphml(graph, opath)
+                # Format is selected by the extension of the output file
+                opaths = [opath]
+                npz_path = os.path.splitext(opath)[0] + gmt_io.kNPZExt
+                if args.ct_npz and npz_path != opath:
+                    opaths.append(npz_path)
+
+                target_set.targets[i].gen_files(opaths)
 
 
 class PaperFigureGenerator():
@@ -27,6 +27,7 @@ import logging
 
 # 3rd party packages
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 import matplotlib.pyplot as plt
 import numpy as np
 import networkx as nx
@@ -40,7 +41,8 @@ import sierra.core.logging
 from sierra.core.utils import ArenaExtent
 
 from titerra.projects.prism.variables.construct_targets import BaseConstructTarget
-from titerra.projects.prism import gmt_spec
+from titerra.projects.prism import gmt_spec, gmt_io
+from titerra.projects.common import parallel
 
 
 class GMTVisualizerCmdline(BaseCmdline):
@@ -75,14 +77,24 @@ class GMTVisualizerCmdline(BaseCmdline):
                                  """,
                                  default="1:1:1")
 
+        self.parser.add_argument("--processes",
+                                 help="""
+
+                                 The number of processes to use to render the
+                                 views of the structure from different angles.
+
+                                 """,
+                                 type=int,
+                                 default=1)
+
         self.parser.add_argument("input_file")
         self.parser.add_argument("-o", "--output-dir", required=True)
 
 
 class GMTVisualizer():
     """
-    Given a path to a .graphml file, generate a set of images which visualize
-    different representations of the graph:
+    Given a path to a .graphml (or .npz) file, generate a set of images which
+    visualize different representations of the graph:
 
     - A prismatic representation with blocks
 
@@ -102,8 +114,7 @@ class GMTVisualizer():
         self.logger = logging.getLogger(__name__)
 
         self.graph_type = os.path.basename(args.input_file).split('.')[0]
-        self.graph = nx.read_graphml(args.input_file,
-                                     node_type=int)
+        self.graph = gmt_io.read_graph(args.input_file)
 
         self.output_dir = args.output_dir
         os.makedirs(self.output_dir, exist_ok=True)
@@ -111,6 +122,7 @@ class GMTVisualizer():
         self.do_prismatic = args.prismatic
         self.do_graph = args.graph
         self.aspect_ratio = tuple(map(float, args.aspect_ratio.split(':')))
+        self.n_procs = args.processes
 
         assert self.do_prismatic or self.do_graph, \
             "Either --prismatic or --graph is required"
@@ -121,45 +133,67 @@ class GMTVisualizer():
         3D in various ways, to aid in diagnostic debugging and for nice figures
         in papers.
 
+        Each plot is only built once (per process, if ``--processes`` > 1); the
+        view is then rotated to each angle in turn.
         """
-        for angle in range(0, 360, 30):
-            self.logger.info("Generate for angle=%s", angle)
-            if self.do_prismatic:
-                ax = VolumetricPlotGenerator(self.graph)(self.aspect_ratio)
-                self._output_plot(ax, angle)
+        angles = list(range(0, 360, 30))
+        n_chunks = max(1, min(self.n_procs, len(angles)))
+        chunks = [angles[i::n_chunks] for i in range(0, n_chunks)]
 
-            if self.do_graph:
-                ax = GraphPlotGenerator()(self.graph)
-                self._output_plot(ax, angle)
+        parallel.map_kernel(self.n_procs,
+                            _render_angles,
+                            (self,),
+                            [(chunk,) for chunk in chunks])
 
-    def _output_plot(self, ax: Axes3D,  angle: int):
-        ax.view_init(elev=None, azim=angle)
+    def render(self, angles: tp.List[int]) -> None:
+        """
+        Build each requested plot and save it from each of the specified
+        angles.
+        """
+        if self.do_prismatic:
+            ax = VolumetricPlotGenerator(self.graph)(self.aspect_ratio)
+            self._output_plots(ax, angles)
+
+        if self.do_graph:
+            ax = GraphPlotGenerator()(self.graph)
+            self._output_plots(ax, angles)
+
+    def _output_plots(self, ax: Axes3D, angles: tp.List[int]) -> None:
         fig = ax.get_figure()
 
         # Reduce whitespace around figure
-        plt.gca().set_axis_off()
-        plt.subplots_adjust(top=1, bottom=0, right=1, left=0,
+        ax.set_axis_off()
+        fig.subplots_adjust(top=1, bottom=0, right=1, left=0,
                             hspace=0, wspace=0)
-        plt.margins(0, 0, 0)
-        plt.gca().xaxis.set_major_locator(plt.NullLocator())
-        plt.gca().yaxis.set_major_locator(plt.NullLocator())
-        plt.gca().zaxis.set_major_locator(plt.NullLocator())
-
-        # The path we are passed may contain dots from the controller name,
-        # so we extract the leaf of that for manipulation to add the angle
-        # of the view right before the file extension.
-        fname = "{0}_{1}{2}".format(self.graph_type,
-                                    angle,
-                                    sierra.core.config.kImageExt)
-
-        fig.savefig(os.path.join(self.output_dir, fname),
-                    bbox_inches='tight',
-                    dpi=sierra.core.config.kGraphDPI,
-                    pad_inches=0)
+        ax.margins(0, 0, 0)
+        ax.xaxis.set_major_locator(plt.NullLocator())
+        ax.yaxis.set_major_locator(plt.NullLocator())
+        ax.zaxis.set_major_locator(plt.NullLocator())
+
+        for angle in angles:
+            self.logger.info("Generate for angle=%s", angle)
+            ax.view_init(elev=None, azim=angle)
+
+            # The path we are passed may contain dots from the controller name,
+            # so we extract the leaf of that for manipulation to add the angle
+            # of the view right before the file extension.
+            fname = "{0}_{1}{2}".format(self.graph_type,
+                                        angle,
+                                        sierra.core.config.kImageExt)
+
+            fig.savefig(os.path.join(self.output_dir, fname),
+                        bbox_inches='tight',
+                        dpi=sierra.core.config.kGraphDPI,
+                        pad_inches=0)
+
         # Prevent memory accumulation (fig.clf() does not close everything)
         plt.close(fig)
 
 
+def _render_angles(visualizer: GMTVisualizer, angles: tp.List[int]) -> None:
+    visualizer.render(angles)
+
+
 class GraphPlotGenerator():
     def __call__(self, graph: nx.Graph) -> Axes3D:
 
@@ -216,6 +250,17 @@ class GraphPlotGenerator():
 
 
 class VolumetricPlotGenerator():
+    # (outward normal, corners relative to the lower corner of the voxel) of
+    # each face of a voxel.
+    kFaces = [
+        ((1, 0, 0), [(1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)]),
+        ((-1, 0, 0), [(0, 0, 0), (0, 0, 1), (0, 1, 1), (0, 1, 0)]),
+        ((0, 1, 0), [(0, 1, 0), (0, 1, 1), (1, 1, 1), (1, 1, 0)]),
+        ((0, -1, 0), [(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)]),
+        ((0, 0, 1), [(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]),
+        ((0, 0, -1), [(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)]),
+    ]
+
     def __init__(self, graph: nx.Graph) -> None:
         self.logger = logging.getLogger(__name__)
         self.graph = graph
@@ -289,7 +334,9 @@ class VolumetricPlotGenerator():
         xaxis = (ct_extent.ur.x - ct_extent.ll.x)
         yaxis = (ct_extent.ur.y - ct_extent.ll.y)
         zaxis = (ct_extent.ur.z - ct_extent.ll.z)
-        colors = np.empty((xaxis, yaxis, zaxis, 4), dtype=object)
+
+        # NaN for cells which are not part of any block
+        colors = np.full((xaxis, yaxis, zaxis, 4), np.nan)
 
         for vd, coord in items:
             rgba = self._color_to_rgba(self.graph.nodes[vd][gmt_spec.kVertexColorKey],
@@ -309,66 +356,53 @@ class VolumetricPlotGenerator():
                                            percentile)
                 colors[e.x, e.y, e.z] = rgba
 
-        for i, xi in enumerate(range(xaxis)):
-            for j, yi in enumerate(range(yaxis)):
-                for k, zi, in enumerate(range(zaxis)):
-                    rgba = colors[i, j, k]
-
-                    if any(c is None for c in rgba):
-                        continue
+        # All voxels are drawn as a single mesh, which is much faster to build
+        # and render than a surface per voxel.
+        ax.add_collection3d(self._calc_mesh(colors))
 
-                    # Plotting N cube elements at position pos
-                    X, Y, Z = VolumetricPlotGenerator._cuboid_data((xi, yi, zi))
-                    ax.plot_surface(X,
-                                    Y,
-                                    Z,
-                                    color=rgba,
-                                    rstride=1,
-                                    cstride=1,
-                                    alpha=rgba[3])
+        # Collections do not update the data limits, so set them explicitly to
+        # the extent of the voxels (which are centered on their cells).
+        ax.set_xlim(-0.5, xaxis - 0.5)
+        ax.set_ylim(-0.5, yaxis - 0.5)
+        ax.set_zlim(-0.5, zaxis - 0.5)
 
     @staticmethod
-    def _cuboid_data(center, size=(1.0, 1.0, 1.0)):
-        # code taken from
-        # http://stackoverflow.com/questions/30715083/python-plotting-a-wireframe-3d-cuboid?noredirect=1&lq=1
-        # suppose axis direction: x: to left; y: to inside; z: to upper
-
-        # get the (left, outside, bottom) point
-        o = [a - b / 2 for a, b in zip(center, size)]
-
-        # get the length, width, and height
-        l, w, h = size
-
-        x = np.array([ \
-            # x coordinate of points in bottom surface
-            [o[0], o[0] + l, o[0] + l, o[0], o[0]],
-            # x coordinate of points in upper surface
-            [o[0], o[0] + l, o[0] + l, o[0], o[0]],
-            # x coordinate of points in outside surface
-            [o[0], o[0] + l, o[0] + l, o[0], o[0]],
-            # x coordinate of points in inside surface
-            [o[0], o[0] + l, o[0] + l, o[0], o[0]]])
-
-        y = np.array([ \
-            # y coordinate of points in bottom surface
-            [o[1], o[1], o[1] + w, o[1] + w, o[1]],
-            # y coordinate of points in upper surface
-            [o[1], o[1], o[1] + w, o[1] + w, o[1]],
-            # y coordinate of points in outside surface
-            [o[1], o[1], o[1], o[1], o[1]],
-            # y coordinate of points in inside surface
-            [o[1] + w, o[1] + w, o[1] + w, o[1] + w, o[1] + w]])
-
-        z = np.array([  \
-            # z coordinate of points in bottom surface
-            [o[2], o[2], o[2], o[2], o[2]],
-            # z coordinate of points in upper surface
-            [o[2] + h, o[2] + h, o[2] + h, o[2] + h, o[2] + h],
-            # z coordinate of points in outside surface
-            [o[2], o[2], o[2] + h, o[2] + h, o[2]],
-            # z coordinate of points in inside surface
-            [o[2], o[2], o[2] + h, o[2] + h, o[2]]])
-        return x, y, z
+    def _calc_mesh(colors: np.ndarray) -> Poly3DCollection:
+        """
+        Build a single mesh of the faces of all voxels with a color, culling
+        faces which cannot be seen: faces shared with an opaque voxel, and
+        faces between two translucent voxels. Faces are shaded by their
+        direction relative to the same light source as
+        :meth:`~mpl_toolkits.mplot3d.axes3d.Axes3D.plot_surface()`.
+        """
+        occupied = ~np.isnan(colors[..., 0])
+        opaque = occupied & (np.nan_to_num(colors[..., 3]) >= 1.0)
+
+        # Pad so that the neighbors of cells on the boundary are empty
+        occupied_p = np.pad(occupied, 1)
+        opaque_p = np.pad(opaque, 1)
+        dims = occupied.shape
+        light = mpl.colors.LightSource(azdeg=225, altdeg=19.4712).direction
+
+        verts = []
+        fcolors = []
+        for normal, corners in VolumetricPlotGenerator.kFaces:
+            nbr = tuple(slice(1 + n, 1 + n + d) for n, d in zip(normal, dims))
+            nbr_occupied = occupied_p[nbr]
+            nbr_opaque = opaque_p[nbr]
+
+            visible = occupied & ~(nbr_occupied & (nbr_opaque | ~opaque))
+            cells = np.argwhere(visible)
+
+            verts.append(cells[:, np.newaxis, :] - 0.5 + np.array(corners)[np.newaxis, :, :])
+
+            shade = 0.3 + 0.7 * (np.dot(normal, light) + 1.0) / 2.0
+            rgba = colors[tuple(cells.T)]
+            rgba[:, 0:3] *= shade
+            fcolors.append(rgba)
+
+        return Poly3DCollection(np.concatenate(verts),
+                                facecolors=np.concatenate(fcolors))
 
     @staticmethod
     def _calc_bb(graph: nx.Graph) -> ArenaExtent: